@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import (Iterable, Iterator, Optional, Tuple)
+import hashlib
+from typing import (Iterable, Iterator, Optional, Tuple, Type)
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self
 
@@ -21,6 +23,59 @@ from spinn_utilities.typing.coords import XY
 from .router import Router
 
 
+class _ChipTemplate(object):
+    """
+    The values of a chip that do not depend on where its board is,
+    shared by all chips with the same values on any board.
+    """
+
+    # Weak references let the pool drop the template once no chip uses it
+    __slots__ = ("scamp", "placable", "sdram", "tag_ids", "__weakref__")
+
+    def __init__(
+            self, scamp: Tuple[int, ...], placable: Tuple[int, ...],
+            sdram: int, tag_ids: OrderedSet[int]):
+        """
+        :param scamp: The IDs of the scamp processors
+        :param placable: The IDs of the other processors
+        :param sdram: The SDRAM of the chip
+        :param tag_ids: The tag IDs of the chip
+        """
+        self.scamp = scamp
+        self.placable = placable
+        self.sdram = sdram
+        self.tag_ids = tag_ids
+
+
+class _ChipValues(object):
+    """
+    The values of a chip other than x, y and the router: a shared template
+    plus the values that differ from board to board, shared by all chips
+    with the same values.
+    """
+
+    # Weak references let the pool drop the values once no chip uses them
+    __slots__ = (
+        "template", "ethernet_x", "ethernet_y", "ip_address", "parent_link",
+        "__weakref__")
+
+    def __init__(
+            self, template: _ChipTemplate, ethernet_x: int, ethernet_y: int,
+            ip_address: Optional[str], parent_link: Optional[int]):
+        """
+        :param template: The values that are the same on any board
+        :param ethernet_x: The nearest Ethernet x coordinate
+        :param ethernet_y: The nearest Ethernet y coordinate
+        :param ip_address: The IP address of the chip, if any
+        :param parent_link: The link towards the boot chip, if known
+        """
+        self.template = template
+        self.ethernet_x = ethernet_x
+        self.ethernet_y = ethernet_y
+        self.ip_address = ip_address
+        self.parent_link = parent_link
+
+
 class Chip(XY):
     """
     Represents a SpiNNaker chip with a number of cores, an amount of
@@ -29,6 +84,21 @@ class Chip(XY):
 
     # tag 0 is reserved for stuff like IO STD
     _IPTAG_IDS = OrderedSet(range(1, 8))
+    # The tag IDs of a chip without tags
+    _NO_TAG_IDS: OrderedSet[int] = OrderedSet()
+
+    # The processors, SDRAM and tags of a chip, shared by all chips with
+    # the same ones on every board while any of them exist; identical
+    # boards have the same few templates.
+    _SHARED_TEMPLATES: WeakValueDictionary[
+        Tuple[object, ...], _ChipTemplate] = WeakValueDictionary()
+    # A template plus the values that depend on the board, shared by all
+    # chips with the same values while any of them exist; almost every
+    # chip of a board has one of a few so sharing saves memory.
+    # A tuple subclass can not have slots so each chip has a dict;
+    # keeping two attributes in it rather than ten makes the dict smaller.
+    _SHARED_VALUES: WeakValueDictionary[
+        Tuple[object, ...], _ChipValues] = WeakValueDictionary()
 
     def __new__(cls, x: int, y: int, scamp_processors: Iterable[int],
                 placable_processors: Iterable[int], router: Router,
@@ -70,20 +140,45 @@ class Chip(XY):
         """
         # X and Y set by new
         _, _ = x, y
-        self._scamp_processors = tuple(scamp_processors)
-        self._placable_processors = tuple(placable_processors)
         self._router = router
-        self._sdram = sdram
-        self._ip_address = ip_address
         if tag_ids is not None:
-            self._tag_ids = OrderedSet(tag_ids)
-        elif self._ip_address is None:
-            self._tag_ids = OrderedSet()
+            tags = tuple(OrderedSet(tag_ids))
+        elif ip_address is None:
+            tags = ()
         else:
-            self._tag_ids = self._IPTAG_IDS
-        self._nearest_ethernet_x = nearest_ethernet_x
-        self._nearest_ethernet_y = nearest_ethernet_y
-        self._parent_link = parent_link
+            tags = tuple(self._IPTAG_IDS)
+        scamp = tuple(scamp_processors)
+        placable = tuple(placable_processors)
+        template_key = (scamp, placable, sdram, tags)
+        template = self._SHARED_TEMPLATES.get(template_key)
+        if template is None:
+            template = _ChipTemplate(
+                scamp, placable, sdram, self._tag_id_set(tags))
+            self._SHARED_TEMPLATES[template_key] = template
+        # Templates compare by identity, as equal values share one
+        key = (template, nearest_ethernet_x, nearest_ethernet_y,
+               ip_address, parent_link)
+        values = self._SHARED_VALUES.get(key)
+        if values is None:
+            values = _ChipValues(
+                template, nearest_ethernet_x, nearest_ethernet_y,
+                ip_address, parent_link)
+            self._SHARED_VALUES[key] = values
+        self._values = values
+
+    @classmethod
+    def _tag_id_set(cls, tags: Tuple[int, ...]) -> OrderedSet[int]:
+        """
+        Gets a set of these tag IDs, shared if they are the usual ones.
+
+        :param tags: The tag IDs
+        :return: An ordered set of the IDs
+        """
+        if not tags:
+            return cls._NO_TAG_IDS
+        if tags == tuple(cls._IPTAG_IDS):
+            return cls._IPTAG_IDS
+        return OrderedSet(tags)
 
     def is_processor_with_id(self, processor_id: int) -> bool:
         """
@@ -93,9 +188,10 @@ class Chip(XY):
         :param processor_id: the processor ID to check for
         :return: Whether the processor with the given ID exists
         """
-        if processor_id in self._placable_processors:
+        template = self._values.template
+        if processor_id in template.placable:
             return True
-        return processor_id in self._scamp_processors
+        return processor_id in template.scamp
 
     @property
     def x(self) -> int:
@@ -116,43 +212,45 @@ class Chip(XY):
         """
         An iterable of id's of all available processors
         """
-        yield from self._scamp_processors
-        yield from self._placable_processors
+        template = self._values.template
+        yield from template.scamp
+        yield from template.placable
 
     @property
     def n_processors(self) -> int:
         """
         The total number of processors.
         """
-        return len(self._scamp_processors) + len(self._placable_processors)
+        template = self._values.template
+        return len(template.scamp) + len(template.placable)
 
     @property
     def placable_processors_ids(self) -> Tuple[int, ...]:
         """
         An iterable of available placeable/ non scamp processor ids.
         """
-        return self._placable_processors
+        return self._values.template.placable
 
     @property
     def n_placable_processors(self) -> int:
         """
         The total number of processors that are placeable / not used by scamp.
         """
-        return len(self._placable_processors)
+        return len(self._values.template.placable)
 
     @property
     def scamp_processors_ids(self) -> Tuple[int, ...]:
         """
         An iterable of available scamp processors.
         """
-        return self._scamp_processors
+        return self._values.template.scamp
 
     @property
     def n_scamp_processors(self) -> int:
         """
         The total number of processors that are used by scamp.
         """
-        return len(self._scamp_processors)
+        return len(self._values.template.scamp)
 
     @property
     def router(self) -> Router:
@@ -166,7 +264,7 @@ class Chip(XY):
         """
         The SDRAM associated with the chip.
         """
-        return self._sdram
+        return self._values.template.sdram
 
     @property
     def ip_address(self) -> Optional[str]:
@@ -174,28 +272,30 @@ class Chip(XY):
         The IP address of the chip, or ``None`` if there is no Ethernet
         connected to the chip.
         """
-        return self._ip_address
+        return self._values.ip_address
 
     @property
     def nearest_ethernet_x(self) -> int:
         """
         The X-coordinate of the nearest Ethernet chip.
         """
-        return self._nearest_ethernet_x
+        return self._values.ethernet_x
 
     @property
     def nearest_ethernet_y(self) -> int:
         """
         The Y-coordinate of the nearest Ethernet chip.
         """
-        return self._nearest_ethernet_y
+        return self._values.ethernet_y
 
     @property
     def tag_ids(self) -> OrderedSet[int]:
         """
         The tag IDs supported by this chip.
+
+        This set may be shared with other chips so must not be changed.
         """
-        return self._tag_ids
+        return self._values.template.tag_ids
 
     @property
     def parent_link(self) -> Optional[int]:
@@ -204,10 +304,57 @@ class Chip(XY):
         at the machine root chip (probably 0, 0 in most cases).  This will
         be ``None`` if the chip information didn't contain this value.
         """
-        return self._parent_link
+        return self._values.parent_link
+
+    def without_link(self, link_id: int) -> "Chip":
+        """
+        Creates a copy of this chip with a router that does not have the link.
+
+        This chip and its router are not changed.
+
+        :param link_id: The ID of the link to leave out
+        :return: A new chip with all the same values except for the link
+        """
+        router = self._router.without_link(link_id)
+        values = self._values
+        template = values.template
+        return Chip(
+            self[0], self[1], template.scamp, template.placable, router,
+            template.sdram, values.ethernet_x, values.ethernet_y,
+            values.ip_address, template.tag_ids, values.parent_link)
+
+    def fingerprint(self) -> bytes:
+        """
+        A digest of all the values of this chip including the links.
+
+        Two chips with the same values have the same fingerprint,
+        in any run and any process.
+        The parent link is left out as it depends on how the machine was
+        booted and is not kept when the machine is saved as JSON.
+
+        :return: A 16 byte BLAKE2b digest
+        """
+        chip = self._values
+        template = chip.template
+        links = sorted(self._router.destinations())
+        values = (
+            self[0], self[1], template.scamp, template.placable,
+            template.sdram, self._router.n_available_multicast_entries,
+            chip.ethernet_x, chip.ethernet_y, chip.ip_address,
+            tuple(template.tag_ids), links)
+        return hashlib.blake2b(
+            repr(values).encode(), digest_size=16).digest()
+
+    def __reduce__(self) -> Tuple[Type["Chip"], Tuple[object, ...]]:
+        values = self._values
+        template = values.template
+        return (type(self), (
+            self[0], self[1], template.scamp, template.placable, self._router,
+            template.sdram, values.ethernet_x, values.ethernet_y,
+            values.ip_address, tuple(template.tag_ids), values.parent_link))
 
     def __str__(self) -> str:
-        if self._ip_address:
+        if self.ip_address:
             ip_info = f"ip_address={self.ip_address} "
         else:
             ip_info = ""
@@ -190,7 +190,7 @@ class MachineDataView(UtilsDataView):
             If the machine is currently unavailable
         :raises KeyError: If the chip does not exist but the machine does
         """
-        return cls.get_machine()._chips[x, y]
+        return cls.get_machine()[x, y]
 
     @classmethod
     def get_nearest_ethernet(cls, x: int, y: int) -> XY:
@@ -213,7 +213,7 @@ class MachineDataView(UtilsDataView):
         try:
             m = cls.__data._machine
             if m is not None:
-                chip = m._chips[(x, y)]
+                chip = m[x, y]
                 return chip.nearest_ethernet_x, chip.nearest_ethernet_y
         except Exception:  # pylint: disable=broad-except
             pass
@@ -0,0 +1,230 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.typing.coords import XY
+
+from .exceptions import SpinnMachineInvalidParameterException
+from .machine_arrays import MachineArrays
+
+if TYPE_CHECKING:
+    from .machine import Machine
+
+
+class DistanceOracle(object):
+    """
+    Gives bounds on the number of hops between chips over the links that
+    actually exist, without storing the distance between every pair.
+
+    The hops from and to a few landmark chips are found once with a breadth
+    first search.
+    The triangle inequality then bounds the distance between any two chips
+    in time proportional to the number of landmarks.
+    The lower bound is never less than :py:meth:`Machine.get_vector_length`.
+
+    The oracle is a snapshot of the machine when it was created.
+    """
+
+    __slots__ = (
+        "_arrays", "_from_landmarks", "_landmarks", "_machine",
+        "_to_landmarks")
+
+    #: Lower bound used when the oracle can prove there is no path
+    UNREACHABLE = int(numpy.iinfo(numpy.int64).max)
+
+    def __init__(self, machine: Machine,
+                 landmarks: Optional[Iterable[XY]] = None,
+                 n_landmarks: int = 16):
+        """
+        :param machine: The machine to give distances on
+        :param landmarks: The (x, y) of the chips to use as landmarks.
+            If `None` up to `n_landmarks` of the Ethernet chips are chosen,
+            each the farthest from those already picked.
+        :param n_landmarks:
+            The number of Ethernet chips to pick if landmarks is `None`
+        :raises SpinnMachineInvalidParameterException:
+            If a landmark is not a chip on the machine
+        """
+        self._machine = machine
+        self._arrays = machine.arrays
+        table = self._arrays.neighbours
+        reverse = MachineArrays.reverse_table(table)
+        from_landmarks: List[NDArray[numpy.int32]] = []
+        to_landmarks: List[NDArray[numpy.int32]] = []
+        if landmarks is None:
+            indexes = self._pick_landmarks(table, n_landmarks, from_landmarks)
+        else:
+            indexes = [self._position(xy, "landmarks") for xy in landmarks]
+            for index in indexes:
+                from_landmarks.append(
+                    MachineArrays.breadth_first(table, index))
+        for index in indexes:
+            to_landmarks.append(MachineArrays.breadth_first(reverse, index))
+        self._landmarks = [
+            (int(self._arrays.x[index]), int(self._arrays.y[index]))
+            for index in indexes]
+        self._from_landmarks = numpy.array(
+            from_landmarks, dtype=numpy.int32).reshape(
+                len(indexes), len(self._arrays))
+        self._to_landmarks = numpy.array(
+            to_landmarks, dtype=numpy.int32).reshape(
+                len(indexes), len(self._arrays))
+
+    def _position(self, xy: XY, parameter: str) -> int:
+        try:
+            return self._arrays.position_of(xy[0], xy[1])
+        except KeyError as ex:
+            raise SpinnMachineInvalidParameterException(
+                parameter, xy, "There is no chip there") from ex
+
+    def _pick_landmarks(
+            self, table: NDArray[numpy.int32], n_landmarks: int,
+            from_landmarks: List[NDArray[numpy.int32]]) -> List[int]:
+        """
+        Picks Ethernet chips so that each is as far as possible from the
+        ones already picked, starting with the boot chip.
+
+        :param table: The table of the chips reached over each link
+        :param n_landmarks: The maximum number of landmarks to pick
+        :param from_landmarks:
+            List to add the hops from each picked landmark to
+        :return: The positions in the machine's arrays of the picked chips
+        """
+        candidates = numpy.nonzero(self._arrays.is_ethernet)[0]
+        if len(candidates) == 0:
+            return []
+        try:
+            first = self._arrays.position_of(0, 0)
+        except KeyError:
+            first = int(candidates[0])
+        picked = [first]
+        nearest = MachineArrays.breadth_first(table, first).astype(numpy.int64)
+        from_landmarks.append(nearest.astype(numpy.int32))
+        # Chips that can not be reached count as infinitely far
+        nearest[nearest < 0] = self.UNREACHABLE
+        while len(picked) < min(n_landmarks, len(candidates)):
+            distances = nearest[candidates]
+            distances[numpy.isin(candidates, picked)] = -1
+            best = int(candidates[numpy.argmax(distances)])
+            picked.append(best)
+            hops = MachineArrays.breadth_first(table, best)
+            from_landmarks.append(hops)
+            nearest = numpy.where(
+                hops >= 0, numpy.minimum(nearest, hops), nearest)
+        return picked
+
+    @property
+    def landmarks(self) -> List[XY]:
+        """
+        The (x, y) of the landmark chips.
+        """
+        return self._landmarks
+
+    def _positions(
+            self, xys: ArrayLike, parameter: str) -> NDArray[numpy.intp]:
+        return numpy.array(
+            [self._position((x, y), parameter)
+             for x, y in numpy.asarray(xys).reshape(-1, 2).tolist()],
+            dtype=numpy.intp)
+
+    def lower_bounds(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.int64]:
+        """
+        Get lower bounds on the hops between many pairs of chips.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: The lower bound for each pair, which is
+            :py:attr:`UNREACHABLE` if there can be no path
+        :raises SpinnMachineInvalidParameterException:
+            If any source or destination is not a chip on the machine
+        """
+        s = self._positions(sources, "sources")
+        d = self._positions(destinations, "destinations")
+        from_s = self._from_landmarks[:, s]
+        from_d = self._from_landmarks[:, d]
+        to_s = self._to_landmarks[:, s]
+        to_d = self._to_landmarks[:, d]
+        # hops(landmark, d) <= hops(landmark, s) + hops(s, d)
+        ahead = numpy.where(
+            (from_s >= 0) & (from_d >= 0), from_d - from_s, 0)
+        # hops(s, landmark) <= hops(s, d) + hops(d, landmark)
+        behind = numpy.where((to_s >= 0) & (to_d >= 0), to_s - to_d, 0)
+        lower = self._machine.get_vector_lengths(
+            self._xys(s), self._xys(d)).astype(numpy.int64)
+        if len(self._landmarks):
+            lower = numpy.maximum(lower, ahead.max(axis=0))
+            lower = numpy.maximum(lower, behind.max(axis=0))
+            # If the landmark reaches s but not d, s can not reach d either.
+            # If d reaches the landmark but s does not, s can not reach d.
+            impossible = (((from_s >= 0) & (from_d < 0)) |
+                          ((to_d >= 0) & (to_s < 0))).any(axis=0)
+            lower[impossible] = self.UNREACHABLE
+        lower[s == d] = 0
+        return lower
+
+    def upper_bounds(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.int64]:
+        """
+        Get upper bounds on the hops between many pairs of chips.
+
+        The bound is the length of the shortest path via any of the landmarks.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: The upper bound for each pair or -1 if no path via a landmark
+            was found.
+        :raises SpinnMachineInvalidParameterException:
+            If any source or destination is not a chip on the machine
+        """
+        s = self._positions(sources, "sources")
+        d = self._positions(destinations, "destinations")
+        to_s = self._to_landmarks[:, s].astype(numpy.int64)
+        from_d = self._from_landmarks[:, d].astype(numpy.int64)
+        via = numpy.where(
+            (to_s >= 0) & (from_d >= 0), to_s + from_d, self.UNREACHABLE)
+        upper = numpy.full(len(s), self.UNREACHABLE, dtype=numpy.int64)
+        if len(self._landmarks):
+            upper = via.min(axis=0)
+        upper[s == d] = 0
+        upper[upper == self.UNREACHABLE] = -1
+        return upper
+
+    def bounds(self, source: XY, destination: XY) -> Tuple[int, Optional[int]]:
+        """
+        Get the lower and upper bounds on the hops between two chips.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The lower bound, which is :py:attr:`UNREACHABLE` if there can
+            be no path, and the upper bound or `None` if no path via a
+            landmark was found.
+        :raises SpinnMachineInvalidParameterException:
+            If the source or destination is not a chip on the machine
+        """
+        lower = int(self.lower_bounds([source], [destination])[0])
+        upper = int(self.upper_bounds([source], [destination])[0])
+        return lower, (upper if upper >= 0 else None)
+
+    def _xys(self, indexes: NDArray[numpy.intp]) -> NDArray[numpy.int32]:
+        return numpy.stack(
+            (self._arrays.x[indexes], self._arrays.y[indexes]), axis=1)
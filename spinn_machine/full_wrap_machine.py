@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -25,7 +27,71 @@ class FullWrapMachine(Machine):
     It will therefore wraps in both the Horizontal and vertical directions.
 
     This class provides the more complex maths to deal with wraps.
+
+    As the shortest vector between two chips only depends on the differences
+    in x and y modulo the width and height, these can optionally be looked up
+    in tables made by :py:meth:`build_vector_table`.
     """
+
+    __slots__ = (
+        # Lengths of the shortest vectors by x and y difference if built
+        "_length_table",
+        # The same lengths as lists which are faster for single lookups
+        "_length_rows",
+        # The shortest (x, y, z) vectors by x and y difference if built
+        "_vector_table",
+        # The same vectors as lists which are faster for single lookups
+        "_vector_rows")
+
+    def __init__(self, width: int, height: int, chip_core_map: Dict[XY, int],
+                 origin: str = ""):
+        """
+        :param width: The width of the machine excluding
+        :param height:
+            The height of the machine
+        :param chip_core_map:
+            A map off the expected x,y coordinates on a standard board to
+            the most likely number of cores on that chip.
+        :param origin: Extra information about how this machine was created
+            to be used in the str method. Example "``Virtual``" or "``Json``"
+        """
+        super().__init__(width, height, chip_core_map, origin)
+        self._length_table: Optional[NDArray[numpy.int16]] = None
+        self._length_rows: Optional[List[List[int]]] = None
+        self._vector_table: Optional[NDArray[numpy.int16]] = None
+        self._vector_rows: Optional[
+            List[List[Tuple[int, int, int]]]] = None
+
+    def build_vector_table(self) -> None:
+        """
+        Precomputes the shortest vector and its length for every difference
+        in x and y.
+
+        Once built :py:meth:`get_vector`, :py:meth:`get_vector_length` and
+        their array versions are single lookups into a width by height table.
+        The results are exactly the same as without the table.
+
+        The array versions use 8 bytes per chip position, while the single
+        lookups use Python lists which are faster to index.
+        Even for the largest machines this is only a few megabytes.
+        """
+        self._length_table = None
+        self._length_rows = None
+        self._vector_table = None
+        self._vector_rows = None
+        deltas = numpy.indices((self._width, self._height)).reshape(2, -1).T
+        origins = numpy.zeros_like(deltas)
+        lengths = self.get_vector_lengths(origins, deltas)
+        vectors = self.get_vectors(origins, deltas)
+        self._length_table = lengths.astype(numpy.int16).reshape(
+            self._width, self._height)
+        self._vector_table = vectors.astype(numpy.int16).reshape(
+            self._width, self._height, 3)
+        self._length_rows = self._length_table.tolist()
+        self._vector_rows = [
+            [(x, y, z) for x, y, z in row]
+            for row in self._vector_table.tolist()]
+
     @overrides(Machine.get_xys_by_ethernet)
     def get_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
@@ -42,15 +108,6 @@ class FullWrapMachine(Machine):
             yield (((x + ethernet_x) % self._width,
                    (y + ethernet_y) % self._height), n_cores)
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y) % self._height)
-            if chip_xy in self._chips:
-                yield chip_xy
-
     @overrides(Machine.get_down_xys_by_ethernet)
     def get_down_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
@@ -88,6 +145,11 @@ class FullWrapMachine(Machine):
         # Aliases for convenience
         w, h = self._width, self._height
 
+        if self._length_rows is not None:
+            return self._length_rows[
+                (destination[0] - source[0]) % w][
+                (destination[1] - source[1]) % h]
+
         x_up = (destination[0] - source[0]) % w
         x_down = x_up - w
         y_right = (destination[1] - source[1]) % h
@@ -121,6 +183,11 @@ class FullWrapMachine(Machine):
         # Aliases for convenience
         w, h = self._width, self._height
 
+        if self._vector_rows is not None:
+            return self._vector_rows[
+                (destination[0] - source[0]) % w][
+                (destination[1] - source[1]) % h]
+
         x_up = (destination[0] - source[0]) % w
         x_down = x_up - w
         y_right = (destination[1] - source[1]) % h
@@ -154,6 +221,55 @@ class FullWrapMachine(Machine):
         else:
             return self._minimize_vector(dx, dy)
 
+    def _best_deltas(
+            self, sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.int64], NDArray[numpy.int64],
+                NDArray[numpy.int64]]:
+        """
+        Finds the x and y pair with the shortest vector for each pair of chips.
+
+        :param sources: N by 2 array of (x,y) coordinates
+        :param destinations: N by 2 array of (x,y) coordinates
+        :return: The best x deltas, y deltas and their vector lengths
+        """
+        x, y = self._deltas(sources, destinations)
+        x_up = x % self._width
+        x_down = x_up - self._width
+        y_right = y % self._height
+        y_left = y_right - self._height
+        xs = numpy.stack((x_up, x_down, x_up, x_down))
+        ys = numpy.stack((y_right, y_right, y_left, y_left))
+        # argmin takes the first of equal lengths just like get_vector
+        lengths = self._vector_lengths(xs, ys)
+        best = numpy.argmin(lengths, axis=0)
+        pairs = numpy.arange(len(x))
+        return xs[best, pairs], ys[best, pairs], lengths[best, pairs]
+
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        if self._length_table is not None:
+            x, y = self._deltas(sources, destinations)
+            return self._length_table[x % self._width, y % self._height]
+        _, _, lengths = self._best_deltas(sources, destinations)
+        return lengths
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        if self._vector_table is not None:
+            x, y = self._deltas(sources, destinations)
+            return self._vector_table[x % self._width, y % self._height]
+        x, y, _ = self._best_deltas(sources, destinations)
+        return self._minimize_vectors(x, y)
+
+    @overrides(Machine._wrap_xys)
+    def _wrap_xys(self, x: NDArray[numpy.int32], y: NDArray[numpy.int32]
+                  ) -> Tuple[NDArray[numpy.int32], NDArray[numpy.int32]]:
+        return x % self._width, y % self._height
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -42,15 +44,6 @@ class HorizontalWrapMachine(Machine):
         for (x, y), n_cores in self._chip_core_map.items():
             yield ((x + ethernet_x) % self._width, (y + ethernet_y)), n_cores
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if chip_xy in self._chips:
-                yield chip_xy
-
     @overrides(Machine.get_down_xys_by_ethernet)
     def get_down_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
@@ -142,6 +135,47 @@ class HorizontalWrapMachine(Machine):
         else:
             return self._minimize_vector(x_left, y)
 
+    def _best_deltas(
+            self, sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.int64], NDArray[numpy.int64],
+                NDArray[numpy.int64]]:
+        """
+        Finds the x and y pair with the shortest vector for each pair of chips.
+
+        :param sources: N by 2 array of (x,y) coordinates
+        :param destinations: N by 2 array of (x,y) coordinates
+        :return: The best x deltas, y deltas and their vector lengths
+        """
+        x, y = self._deltas(sources, destinations)
+        x_right = x % self._width
+        x_left = x_right - self._width
+        xs = numpy.stack((x_left, x_right))
+        ys = numpy.stack((y, y))
+        # Left first as get_vector only goes right if strictly shorter
+        lengths = self._vector_lengths(xs, ys)
+        best = numpy.argmin(lengths, axis=0)
+        pairs = numpy.arange(len(x))
+        return xs[best, pairs], ys[best, pairs], lengths[best, pairs]
+
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        _, _, lengths = self._best_deltas(sources, destinations)
+        return lengths
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        x, y, _ = self._best_deltas(sources, destinations)
+        return self._minimize_vectors(x, y)
+
+    @overrides(Machine._wrap_xys)
+    def _wrap_xys(self, x: NDArray[numpy.int32], y: NDArray[numpy.int32]
+                  ) -> Tuple[NDArray[numpy.int32], NDArray[numpy.int32]]:
+        return x % self._width, y
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
@@ -79,6 +79,21 @@ class Link(object):
         """
         return self._destination_y
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Link):
+            return False
+        return (
+            self._source_x == other.source_x and
+            self._source_y == other.source_y and
+            self._source_link_id == other.source_link_id and
+            self._destination_x == other.destination_x and
+            self._destination_y == other.destination_y)
+
+    def __hash__(self) -> int:
+        return hash((
+            self._source_x, self._source_y, self._source_link_id,
+            self._destination_x, self._destination_y))
+
     def __str__(self) -> str:
         return (
             f"[Link: source_x={self._source_x}, source_y={self._source_y}, "
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from collections import Counter
+from collections import Counter, defaultdict, deque
+import hashlib
+import heapq
 import logging
 from typing import (
-    Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple,
+    Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple,
     TYPE_CHECKING)
 
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from typing_extensions import Never
 
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
@@ -26,10 +30,18 @@ from spinn_utilities.typing.coords import XY
 
 from spinn_machine.data import MachineDataView
 from .exceptions import (
-    SpinnMachineAlreadyExistsException, SpinnMachineException)
+    SpinnMachineAlreadyExistsException, SpinnMachineException,
+    SpinnMachineInvalidParameterException)
+from .machine_arrays import MachineArrays
+from .machine_columns import chip_columns, machine_from_columns
+from .router import Router
 
 if TYPE_CHECKING:
     from .chip import Chip
+    from .link import Link
+
+#: A path as the links to follow and the number of hops
+Path = Tuple[List["Link"], int]
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -49,16 +61,53 @@ class Machine(object, metaclass=AbstractBase):
     #  coordinates down the given link (0-5)
     LINK_ADD_TABLE = [(1, 0), (1, 1), (0, 1), (-1, 0), (-1, -1), (0, -1)]
 
+    # The x and y offsets of the rings of chips around a start chip by radius
+    # shared by all machines and built the first time each radius is needed
+    _RING_OFFSETS: Dict[
+        int, Tuple[NDArray[numpy.int32], NDArray[numpy.int32]]] = dict()
+
     __slots__ = (
+        # A columnar view of the chips built when first needed
+        "_arrays",
+        # The chips on each board by the (x, y) of their nearest Ethernet chip
+        "_board_chips",
+        # The sum of the fingerprints of the chips on each board
+        # modulo 2 ** 128 built when first needed by board_digests
+        "_board_digests",
+        # All the (x, y)s on the boards with an Ethernet chip
+        # built when first needed by get_unused_xy
+        "_board_xys",
         "_boot_ethernet_address",
         # A map off the expected x, y coordinates on a standard board to
         # the most likely number of cores on that chip.
         "_chip_core_map",
-        "_chips",
-        "_ethernet_connected_chips",
+        # The chips built so far; use _chips to get them all
+        "_chip_map",
+        # The Ethernet-enabled chips built so far
+        # use _ethernet_connected_chips to get them all
+        "_ethernet_chips",
         # Declared height of the machine
         # This can not be changed
         "_height",
+        # The slot index of each chip outside width by height
+        # in the order first added; never reused so indexes stay stable
+        "_extra_slots",
+        # The (x, y) of each extra slot in order of index,
+        # the reverse of _extra_slots
+        "_extra_xys",
+        # The Ethernet-enabled chips by their IP address
+        "_ip_chips",
+        # Boards whose chips are only built when first needed by the
+        # (x, y) of the Ethernet chip
+        # as the (x, y)s of the chips, the number of cores,
+        # the number of placeable cores and a function to build the chips
+        "_lazy_boards",
+        # The (x, y) of the Ethernet chip of the lazy board of each (x, y)
+        "_lazy_xys",
+        # The (x, y)s of the chips of each lazy board added since all the
+        # chips were last built, in the order added, if any were built
+        # early; used to put the chips back in the order planned
+        "_lazy_order",
         # A Counter of the number of cores on each Chip
         "_n_cores_counter",
         # A Counter of links on each Chip
@@ -71,6 +120,8 @@ class Machine(object, metaclass=AbstractBase):
         "_origin",
         # A Counter for SDRAM on each Chip
         "_sdram_counter",
+        # Every (x, y) before this in x then y order is used
+        "_unused_xy",
         # Declared width of the machine
         # This can not be changed
         "_width"
@@ -97,12 +148,21 @@ class Machine(object, metaclass=AbstractBase):
         self._chip_core_map = chip_core_map
 
         # The list of chips with Ethernet connections
-        self._ethernet_connected_chips: List[Chip] = list()
+        self._ethernet_chips: List[Chip] = list()
         # Store the boot chip information
         self._boot_ethernet_address: Optional[str] = None
 
         # The dictionary of chips
-        self._chips: Dict[XY, Chip] = dict()
+        self._chip_map: Dict[XY, Chip] = dict()
+        self._lazy_boards: Dict[XY, Tuple[
+            List[XY], int, int, Callable[[], Iterable[Chip]]]] = dict()
+        self._lazy_xys: Dict[XY, XY] = dict()
+        self._lazy_order: Dict[XY, List[XY]] = dict()
+        self._board_chips: Dict[XY, Dict[XY, Chip]] = defaultdict(dict)
+        self._ip_chips: Dict[str, Chip] = dict()
+        self._extra_slots: Dict[XY, int] = dict()
+        self._extra_xys: List[XY] = []
+        self._board_digests: Optional[Dict[XY, int]] = None
 
         self._origin = origin
 
@@ -111,6 +171,10 @@ class Machine(object, metaclass=AbstractBase):
         self._n_router_entries_counter: Counter[int] = Counter()
         self._sdram_counter: Counter[int] = Counter()
 
+        self._arrays: Optional[MachineArrays] = None
+        self._board_xys: Optional[Set[XY]] = None
+        self._unused_xy: XY = (0, 0)
+
     @abstractmethod
     def get_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
@@ -203,9 +267,9 @@ class Machine(object, metaclass=AbstractBase):
         Yields the actual chips on the board with this Ethernet-enabled chip.
         Including the Ethernet-enabled chip itself.
 
-        Wrap-arounds are handled as appropriate.
-
-        This method does check if the chip actually exists.
+        The chips on a board are those whose nearest Ethernet chip is at
+        (ethernet_x, ethernet_y). These are kept in an index so this does not
+        scan the board.
 
         :param ethernet_x:
             The X coordinate of a (local 0,0) legal Ethernet-enabled chip
@@ -213,11 +277,13 @@ class Machine(object, metaclass=AbstractBase):
             The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
         :return: Yields the chips on this board.
         """
-        for chip_xy in self.get_existing_xys_by_ethernet(
-                ethernet_x, ethernet_y):
-            yield self._chips[chip_xy]
+        self._build_lazy_board((ethernet_x, ethernet_y))
+        board = self._board_chips.get((ethernet_x, ethernet_y))
+        if board is None:
+            return iter(())
+        # A snapshot so chips may be removed while iterating
+        return iter(tuple(board.values()))
 
-    @abstractmethod
     def get_existing_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
         """
@@ -225,9 +291,9 @@ class Machine(object, metaclass=AbstractBase):
         Ethernet-enabled chip.
         Including the Ethernet-enabled chip itself.
 
-        Wrap-arounds are handled as appropriate.
-
-        This method does check if the chip actually exists.
+        The chips on a board are those whose nearest Ethernet chip is at
+        (ethernet_x, ethernet_y). These are kept in an index so this does not
+        scan the board.
 
         :param ethernet_x:
             The X coordinate of a (local 0,0) legal Ethernet-enabled chip
@@ -235,7 +301,22 @@ class Machine(object, metaclass=AbstractBase):
             The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
         :return: Yields the (x,y)s of chips on this board.
         """
-        raise NotImplementedError
+        self._build_lazy_board((ethernet_x, ethernet_y))
+        board = self._board_chips.get((ethernet_x, ethernet_y))
+        if board is None:
+            return iter(())
+        # A snapshot so chips may be removed while iterating
+        return iter(tuple(board))
+
+    def get_ethernet_chip_by_ip(self, ip_address: str) -> Optional[Chip]:
+        """
+        Get the Ethernet-enabled chip with the given IP address.
+
+        :param ip_address: The IP address of the chip
+        :return: The chip or `None` if no chip has that IP address
+        """
+        self._build_all_lazy()
+        return self._ip_chips.get(ip_address)
 
     @abstractmethod
     def xy_over_link(self, x: int, y: int, link: int) -> XY:
@@ -419,6 +500,46 @@ class Machine(object, metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_vector_lengths(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        """
+        Get the lengths of the shortest vectors between many pairs of chips.
+
+        This is the array version of :py:meth:`get_vector_length` and gives
+        exactly the same answer for each pair.
+
+        .. warning::
+            GIGO: This method does not check if input parameters make sense.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: Array of the N distances in steps
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_vectors(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        """
+        Get the shortest vectors (x, y, z) between many pairs of chips.
+
+        This is the array version of :py:meth:`get_vector` and gives
+        exactly the same answer for each pair.
+
+        .. warning::
+            GIGO: This method does not check if input parameters make sense.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: N by 3 array of the (x, y, z) vectors
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         """
@@ -438,7 +559,66 @@ class Machine(object, metaclass=AbstractBase):
         """
         raise NotImplementedError
 
-    def validate(self) -> None:
+    def chips_within(self, radius: int, start: XY,
+                     by_ring: bool = True) -> NDArray[numpy.int32]:
+        """
+        Get the chips that exist no more than radius links from start.
+
+        Unlike :py:meth:`concentric_xys` only chips that exist are included
+        and each chip is only included once, even when the rings wrap around
+        a small machine.
+
+        :param radius: The radius of rings to include (0 = start only)
+        :param start: The start coordinate
+        :param by_ring: If True the chips are in the order they appear in
+            :py:meth:`concentric_xys`, so nearest ring first.
+            If False they are in the order of :py:attr:`chips`.
+        :return: N by 2 array of the (x,y) coordinates of the chips
+        """
+        dx, dy = self._ring_offsets(radius)
+        x, y = self._wrap_xys(dx + start[0], dy + start[1])
+        arrays = self.arrays
+        indexes = arrays.positions_of(x, y)
+        indexes = indexes[indexes >= 0]
+        # Keep the first time each chip is seen, which is its nearest ring
+        unique, first = numpy.unique(indexes, return_index=True)
+        if by_ring:
+            unique = indexes[numpy.sort(first)]
+        return numpy.stack((arrays.x[unique], arrays.y[unique]), axis=1)
+
+    @classmethod
+    def _ring_offsets(cls, radius: int) -> Tuple[
+            NDArray[numpy.int32], NDArray[numpy.int32]]:
+        """
+        Get the template of the x and y offsets from a start chip in the
+        order of :py:meth:`_basic_concentric_xys`.
+
+        :param radius: The radius of rings to produce (0 = start only)
+        :return: The x offsets and the y offsets
+        """
+        if radius not in cls._RING_OFFSETS:
+            offsets = numpy.array(
+                list(cls._basic_concentric_xys(radius, (0, 0))),
+                dtype=numpy.int32).reshape(-1, 2)
+            dx = offsets[:, 0]
+            dy = offsets[:, 1]
+            dx.flags.writeable = False
+            dy.flags.writeable = False
+            cls._RING_OFFSETS[radius] = (dx, dy)
+        return cls._RING_OFFSETS[radius]
+
+    def _wrap_xys(self, x: NDArray[numpy.int32], y: NDArray[numpy.int32]
+                  ) -> Tuple[NDArray[numpy.int32], NDArray[numpy.int32]]:
+        """
+        Applies any wrap-arounds to arrays of x and y coordinates.
+
+        :param x: The x coordinates
+        :param y: The y coordinates
+        :return: The wrapped x and y coordinates
+        """
+        return x, y
+
+    def validate(self, collect_all: bool = False) -> None:
         """
         Validates the machine and raises an exception in unexpected conditions.
 
@@ -447,6 +627,11 @@ class Machine(object, metaclass=AbstractBase):
         This allows the checks to be avoided when creating a virtual machine
         (Except of course in testing)
 
+        The per chip checks are done in bulk on NumPy arrays of the values
+        read from the chips.
+
+        :param collect_all: If True the exception lists every problem found,
+            one per line, rather than just the first.
         :raises SpinnMachineException:
             * An Error is raised if there is a chip with a x outside of the
               range 0 to width -1.
@@ -461,55 +646,122 @@ class Machine(object, metaclass=AbstractBase):
             * An Error is raised if this is a unexpected multiple board
               situation.
         """
+        errors = self._validation_errors(collect_all)
+        if errors:
+            raise SpinnMachineException("\n".join(errors))
+
+    def _validation_errors(self, collect_all: bool) -> List[str]:
+        """
+        Finds the problems reported by :py:meth:`validate`.
+
+        :param collect_all: If False stops at the first problem found
+        :return: A description of each problem found
+        """
+        self._build_all_lazy()
+        errors: List[str] = []
         if self._boot_ethernet_address is None:
-            raise SpinnMachineException(
-                "no ethernet chip at 0, 0 found")
+            errors.append("no ethernet chip at 0, 0 found")
+            if not collect_all:
+                return errors
         version = MachineDataView.get_machine_version()
         if len(self._ethernet_connected_chips) > 1:
             if not version.supports_multiple_boards:
-                raise SpinnMachineException(
+                errors.append(
                     f"A {self.wrap} machine of size {self._width}, "
                     f"{self._height} can not handle multiple ethernet chips")
+                if not collect_all:
+                    return errors
         # The fact that self._boot_ethernet_address is set means there is an
         # Ethernet chip and it is at 0,0 so no need to check that
 
-        for chip in self.chips:
-            if chip.x < 0:
-                raise SpinnMachineException(
-                    f"{self.where_is_chip(chip)} has a negative x")
-            if chip.y < 0:
-                raise SpinnMachineException(
-                    f"{self.where_is_chip(chip)} has a negative y")
-            if chip.x >= self._width:
-                raise SpinnMachineException(
-                    f"{self.where_is_chip(chip)} has an x larger "
-                    f"than width {self._width}")
-            if chip.y >= self._height:
-                raise SpinnMachineException(
-                    f"{self.where_is_chip(chip)} has a y larger "
-                    f"than height {self._height}")
-            if chip.n_processors < version.minimum_cores_expected:
-                raise SpinnMachineException(
-                    f"{self.where_is_chip(chip)} has too few cores "
-                    f"found {chip.n_processors}")
-            if chip.ip_address:
-                # Ethernet Chip checks
-                error = version.illegal_ethernet_message(chip.x, chip.y)
-                if error is not None:
-                    raise SpinnMachineException(
-                        f"{self.where_is_chip(chip)} {error}")
-            else:
-                # Non-Ethernet chip checks
-                if not self.is_chip_at(
-                        chip.nearest_ethernet_x, chip.nearest_ethernet_y):
-                    raise SpinnMachineException(
-                        f"{self.where_is_chip(chip)} "
-                        f"has an invalid ethernet chip")
-                local_xy = self.get_local_xy(chip)
-                if local_xy not in self._chip_core_map:
-                    raise SpinnMachineException(
-                        f"{self.where_is_chip(chip)} "
-                        f"has an unexpected local xy of {local_xy}")
+        (x, y, n_processors, ethernet_x, ethernet_y,
+         is_ethernet) = self._validation_columns()
+
+        ethernet_errors: Dict[int, str] = dict()
+        # Ethernet chips are few so the version can check them one at a time
+        for index in numpy.nonzero(is_ethernet)[0].tolist():
+            error = version.illegal_ethernet_message(
+                int(x[index]), int(y[index]))
+            if error is not None:
+                ethernet_errors[index] = error
+        bad_ethernet = numpy.zeros(len(x), dtype=numpy.bool_)
+        bad_ethernet[list(ethernet_errors)] = True
+
+        # There are only a few different nearest Ethernet chips to look up
+        nearest, nearest_index = numpy.unique(
+            numpy.stack((ethernet_x, ethernet_y), axis=1), axis=0,
+            return_inverse=True)
+        nearest_exists = numpy.array(
+            [self.is_chip_at(ex, ey) for ex, ey in nearest.tolist()],
+            dtype=numpy.bool_)
+        no_ethernet = ~is_ethernet & ~nearest_exists[nearest_index.ravel()]
+
+        local_x, local_y = self._wrap_xys(x - ethernet_x, y - ethernet_y)
+        core_map = numpy.zeros(
+            (max((lx for lx, _ in self._chip_core_map), default=-1) + 1,
+             max((ly for _, ly in self._chip_core_map), default=-1) + 1),
+            dtype=numpy.bool_)
+        for lx, ly in self._chip_core_map:
+            core_map[lx, ly] = True
+        in_map = ((local_x >= 0) & (local_x < core_map.shape[0]) &
+                  (local_y >= 0) & (local_y < core_map.shape[1]))
+        in_map[in_map] = core_map[local_x[in_map], local_y[in_map]]
+
+        # The checks in the order they are reported for each chip
+        checks = [
+            (x < 0, lambda chip, index: "has a negative x"),
+            (y < 0, lambda chip, index: "has a negative y"),
+            (x >= self._width, lambda chip, index:
+                f"has an x larger than width {self._width}"),
+            (y >= self._height, lambda chip, index:
+                f"has a y larger than height {self._height}"),
+            (n_processors < version.minimum_cores_expected,
+             lambda chip, index: f"has too few cores "
+                                 f"found {chip.n_processors}"),
+            (bad_ethernet, lambda chip, index: ethernet_errors[index]),
+            (no_ethernet, lambda chip, index: "has an invalid ethernet chip"),
+            (~is_ethernet & ~no_ethernet & ~in_map, lambda chip, index:
+                f"has an unexpected local xy of {self.get_local_xy(chip)}")]
+        bad = numpy.zeros(len(x), dtype=numpy.bool_)
+        for mask, _ in checks:
+            bad |= mask
+        for index in numpy.nonzero(bad)[0].tolist():
+            chip = self._chips[int(x[index]), int(y[index])]
+            for mask, message in checks:
+                if mask[index]:
+                    errors.append(
+                        f"{self.where_is_chip(chip)} {message(chip, index)}")
+                    if not collect_all:
+                        return errors
+        return errors
+
+    def _validation_columns(self) -> Tuple[
+            NDArray[numpy.integer], NDArray[numpy.integer],
+            NDArray[numpy.integer], NDArray[numpy.integer],
+            NDArray[numpy.integer], NDArray[numpy.bool_]]:
+        """
+        Gets the values of every chip that :py:meth:`validate` checks.
+
+        These come from the :py:attr:`arrays` if they have been built,
+        otherwise they are read from the chips directly, as building all the
+        arrays costs several times as much as the checks.
+
+        :return: The x, y, number of processors, nearest Ethernet x,
+            nearest Ethernet y and whether it is an Ethernet chip of each chip
+        """
+        arrays = self._arrays
+        if arrays is not None:
+            return (arrays.x, arrays.y, arrays.n_processors,
+                    arrays.nearest_ethernet_x, arrays.nearest_ethernet_y,
+                    arrays.is_ethernet)
+        columns = numpy.array(
+            [(chip.x, chip.y, chip.n_processors, chip.nearest_ethernet_x,
+              chip.nearest_ethernet_y, chip.ip_address is not None)
+             for chip in self._chips.values()],
+            dtype=numpy.int64).reshape(-1, 6)
+        x, y, n_processors, ethernet_x, ethernet_y = columns[:, :5].T
+        return (x, y, n_processors, ethernet_x, ethernet_y,
+                columns[:, 5].astype(numpy.bool_))
 
     @property
     @abstractmethod
@@ -527,24 +779,195 @@ class Machine(object, metaclass=AbstractBase):
         :raise SpinnMachineAlreadyExistsException:
             If a chip with the same x and y coordinates already exists
         """
-        if chip in self._chips:
+        self._build_lazy(chip.x, chip.y)
+        if chip in self._chip_map:
             raise SpinnMachineAlreadyExistsException(
                 "chip", f"{chip.x}, {chip.y}")
 
-        self._chips[chip] = chip
+        self._chip_map[chip] = chip
+        self._arrays = None
+        if not (0 <= chip.x < self._width and 0 <= chip.y < self._height) \
+                and chip not in self._extra_slots:
+            self._add_extra_slot((chip.x, chip.y))
+        self._board_chips[
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y][chip] = chip
 
         # keep some stats about the
-        self._n_cores_counter[chip.n_processors] += 1
-        self._n_links_counter[len(chip.router)] += 1
-        self._n_router_entries_counter[
-            chip.router.n_available_multicast_entries] += 1
-        self._sdram_counter[chip.sdram] += 1
+        self._count_chip(chip, 1)
 
         if chip.ip_address is not None:
-            self._ethernet_connected_chips.append(chip)
+            self._ethernet_chips.append(chip)
+            self._ip_chips[chip.ip_address] = chip
+            if self._board_xys is not None:
+                self._board_xys.update(
+                    self.get_xys_by_ethernet(chip.x, chip.y))
             if chip.x == 0 and chip.y == 0:
                 self._boot_ethernet_address = chip.ip_address
 
+    def _count_chip(self, chip: Chip, change: int) -> None:
+        """
+        Adds or removes a chip from the stats and digest kept about the
+        chips.
+
+        :param chip: The chip to count
+        :param change: 1 to add the chip or -1 to remove it
+        """
+        for counter, key in (
+                (self._n_cores_counter, chip.n_processors),
+                (self._n_links_counter, len(chip.router)),
+                (self._n_router_entries_counter,
+                 chip.router.n_available_multicast_entries),
+                (self._sdram_counter, chip.sdram)):
+            counter[key] += change
+            # Keys are used to find the max so must not be left at zero
+            if counter[key] == 0:
+                del counter[key]
+        if self._board_digests is not None:
+            self._add_digest(self._board_digests, chip, change)
+
+    @staticmethod
+    def _add_digest(
+            digests: Dict[XY, int], chip: Chip, change: int) -> None:
+        """
+        Adds or removes the fingerprint of a chip from that of its board.
+
+        :param digests: The digest of each board to update
+        :param chip: The chip to add or remove
+        :param change: 1 to add the chip or -1 to remove it
+        """
+        board = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        digest = (digests.get(board, 0) + change * int.from_bytes(
+            chip.fingerprint(), "big")) % (1 << 128)
+        if digest:
+            digests[board] = digest
+        else:
+            digests.pop(board, None)
+
+    def board_digests(self) -> Dict[XY, int]:
+        """
+        Get a digest of the chips on each board.
+
+        Each digest is the sum, modulo 2 ** 128, of the
+        :py:meth:`Chip.fingerprint` of every chip with that nearest
+        Ethernet-enabled chip, so comparing these finds the boards that
+        differ between two machines.
+
+        The digests are worked out the first time this is called and then
+        kept up to date as chips are added and removed.
+        Changes made directly to a Chip or Router are not seen.
+
+        :return: The digest of each board by the (x, y) of the nearest
+            Ethernet-enabled chip of its chips
+        """
+        if self._board_digests is None:
+            # Build any lazy boards before adding chips to the digests,
+            # as building a board adds its chips once digests are kept
+            chips = self._chips
+            self._board_digests = dict()
+            for chip in chips.values():
+                self._add_digest(self._board_digests, chip, 1)
+        return dict(self._board_digests)
+
+    def fingerprint(self) -> str:
+        """
+        A digest of the board layout of the version, size, wrap and every
+        chip of the machine, including cores, SDRAM, links, tags and
+        IP addresses.
+
+        Machines with the same values have the same fingerprint in any run
+        and any process, whatever order the chips were added in,
+        so this can be used as a key to cache results worked out from the
+        machine.
+
+        This is built from the :py:meth:`board_digests` so costs time in
+        proportion to the number of boards once those are known.
+
+        :return: A 32 character hexadecimal string
+        """
+        digest = sum(self.board_digests().values()) % (1 << 128)
+        # The chips and cores of a board stand in for the version,
+        # as the machine holds them itself even when there is no config
+        board = tuple(sorted(self._chip_core_map.items()))
+        values = (board, self._width, self._height, self.wrap, digest)
+        return hashlib.blake2b(
+            repr(values).encode(), digest_size=16).hexdigest()
+
+    def remove_chip(self, x: int, y: int) -> Chip:
+        """
+        Remove a chip from the machine.
+
+        The stats kept about the chips, the Ethernet-enabled chips and the
+        boot chip are all updated without rescanning the machine.
+
+        Links from other chips to the removed chip are *not* removed;
+        these will be reported by :py:meth:`one_way_links`.
+
+        :param x: The x-coordinate of the chip to remove
+        :param y: The y-coordinate of the chip to remove
+        :return: The chip removed
+        :raise SpinnMachineInvalidParameterException:
+            If there is no chip at (x, y)
+        """
+        self._build_lazy(x, y)
+        chip = self._chip_map.pop((x, y), None)
+        if chip is None:
+            raise SpinnMachineInvalidParameterException(
+                "x, y", (x, y), "There is no chip there")
+        self._arrays = None
+        board_xy = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        board = self._board_chips[board_xy]
+        del board[x, y]
+        if not board:
+            del self._board_chips[board_xy]
+        self._count_chip(chip, -1)
+        if chip.ip_address is not None:
+            self._ethernet_chips.remove(chip)
+            if self._ip_chips.get(chip.ip_address) is chip:
+                del self._ip_chips[chip.ip_address]
+            # The board is no longer known so its (x, y)s may be unused
+            self._board_xys = None
+            self._unused_xy = (0, 0)
+            if chip.x == 0 and chip.y == 0:
+                self._boot_ethernet_address = None
+        elif (x, y) < self._unused_xy:
+            self._unused_xy = (x, y)
+        return chip
+
+    def remove_link(self, x: int, y: int, link_id: int) -> Chip:
+        """
+        Remove a link going out of a chip.
+
+        The chip is replaced by a copy with a new Router without the link.
+        Chips and Routers are not changed as they may be shared with another
+        machine, for example a repaired copy.
+
+        The link going the opposite way, if any, is *not* removed.
+
+        :param x: The x-coordinate of the chip the link goes out of
+        :param y: The y-coordinate of the chip the link goes out of
+        :param link_id: The ID of the link to remove
+        :return: The new chip without the link
+        :raise SpinnMachineInvalidParameterException:
+            If there is no chip at (x, y) or it does not have the link
+        """
+        if not self.is_link_at(x, y, link_id):
+            raise SpinnMachineInvalidParameterException(
+                "x, y, link_id", (x, y, link_id), "There is no link there")
+        chip = self._chip_map[x, y]
+        new_chip = chip.without_link(link_id)
+        self._count_chip(chip, -1)
+        self._count_chip(new_chip, 1)
+        self._chip_map[x, y] = new_chip
+        self._arrays = None
+        self._board_chips[
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y][x, y] = new_chip
+        if chip.ip_address is not None:
+            index = self._ethernet_chips.index(chip)
+            self._ethernet_chips[index] = new_chip
+            if self._ip_chips.get(chip.ip_address) is chip:
+                self._ip_chips[chip.ip_address] = new_chip
+        return new_chip
+
     def add_chips(self, chips: Iterable[Chip]) -> None:
         """
         Add some chips to the machine.
@@ -557,6 +980,121 @@ class Machine(object, metaclass=AbstractBase):
         for next_chip in chips:
             self.add_chip(next_chip)
 
+    def add_lazy_board(
+            self, ethernet_x: int, ethernet_y: int, xys: Iterable[XY],
+            n_cores: int, n_placable_cores: int,
+            build: Callable[[], Iterable[Chip]]) -> None:
+        """
+        Add a board whose chips are only built when first needed.
+
+        Looking up a chip, its links or the chips of a board only builds
+        that board.
+        The number of chips and cores are worked out from the values given
+        here without building any chips.
+        Anything that needs every chip, such as iterating over the chips,
+        builds all the boards still to be built, in the order added.
+        The chips of the lazy boards are then in the order the boards were
+        added, after any other chips, even if some boards were built early.
+
+        :param ethernet_x: The X coordinate of the Ethernet chip of the board
+        :param ethernet_y: The Y coordinate of the Ethernet chip of the board
+        :param xys: The (x, y)s of all the chips the build function adds
+        :param n_cores: The total number of cores on those chips
+        :param n_placable_cores:
+            The total number of placeable (non scamp) cores on those chips
+        :param build: A function that returns the chips of the board
+        :raise SpinnMachineAlreadyExistsException:
+            If the board or any of the (x, y)s has already been added
+        """
+        board = (ethernet_x, ethernet_y)
+        xys = list(xys)
+        if board in self._lazy_boards:
+            raise SpinnMachineAlreadyExistsException(
+                "board", f"{ethernet_x}, {ethernet_y}")
+        for xy in xys:
+            if xy in self._lazy_xys or xy in self._chip_map:
+                raise SpinnMachineAlreadyExistsException(
+                    "chip", f"{xy[0]}, {xy[1]}")
+        self._lazy_boards[board] = (xys, n_cores, n_placable_cores, build)
+        self._lazy_order[board] = xys
+        for xy in xys:
+            self._lazy_xys[xy] = board
+
+    def _build_lazy(self, x: int, y: int) -> None:
+        """
+        Builds the lazy board with a chip at (x, y) if there is one.
+
+        :param x: The x coordinate of a chip that may be on a lazy board
+        :param y: The y coordinate of a chip that may be on a lazy board
+        """
+        if self._lazy_xys:
+            board = self._lazy_xys.get((x, y))
+            if board is not None:
+                self._build_lazy_board(board)
+
+    def _build_lazy_board(self, board: XY) -> None:
+        """
+        Builds the chips of a lazy board if not already built.
+
+        :param board: The (x, y) of the Ethernet chip of the board
+        """
+        lazy = self._lazy_boards.pop(board, None)
+        if lazy is None:
+            return
+        xys, _, _, build = lazy
+        for xy in xys:
+            del self._lazy_xys[xy]
+        self.add_chips(build())
+
+    def _build_all_lazy(self) -> None:
+        """
+        Builds the chips of every lazy board not already built,
+        leaving the chips in the order planned.
+        """
+        if not self._lazy_order:
+            return
+        # Boards built early were not built in the order added
+        early = len(self._lazy_order) != len(self._lazy_boards)
+        while self._lazy_boards:
+            self._build_lazy_board(next(iter(self._lazy_boards)))
+        if early:
+            self._restore_lazy_order()
+        self._lazy_order.clear()
+
+    def _restore_lazy_order(self) -> None:
+        """
+        Puts the chips of the lazy boards in the order the boards were added,
+        after any other chips, as if none had been built early.
+        """
+        lazy_xys = [xy for xys in self._lazy_order.values() for xy in xys]
+        on_lazy = set(lazy_xys)
+        chip_map = {xy: chip for xy, chip in self._chip_map.items()
+                    if xy not in on_lazy}
+        for xy in lazy_xys:
+            chip = self._chip_map.get(xy)
+            if chip is not None:
+                chip_map[xy] = chip
+        self._chip_map = chip_map
+        self._ethernet_chips = [
+            chip for chip in chip_map.values() if chip.ip_address is not None]
+        self._arrays = None
+
+    @property
+    def _chips(self) -> Dict[XY, Chip]:
+        """
+        All the chips by their (x, y), after building any lazy boards.
+        """
+        self._build_all_lazy()
+        return self._chip_map
+
+    @property
+    def _ethernet_connected_chips(self) -> List[Chip]:
+        """
+        All the Ethernet-enabled chips, after building any lazy boards.
+        """
+        self._build_all_lazy()
+        return self._ethernet_chips
+
     @property
     def chips(self) -> Iterator[Chip]:
         """
@@ -564,6 +1102,130 @@ class Machine(object, metaclass=AbstractBase):
         """
         return iter(self._chips.values())
 
+    @property
+    def arrays(self) -> MachineArrays:
+        """
+        A read-only columnar view of all the Chips in the machine.
+
+        The view is built the first time it is needed and rebuilt after
+        chips are added.
+        The arrays are keyed by the position of each Chip in
+        :py:attr:`chips`, which changes as chips are added or removed,
+        not by the stable :py:meth:`chip_index`.
+        """
+        if self._arrays is None:
+            self._arrays = MachineArrays(self._chips.values())
+        return self._arrays
+
+    @property
+    def n_chip_slots(self) -> int:
+        """
+        The number of chip indexes in use, so the size needed for a flat
+        array with an entry for every chip keyed by :py:meth:`chip_index`.
+
+        This is width by height plus one for each chip ever added outside
+        that area, so it never goes down.
+        """
+        return self._width * self._height + len(self._extra_slots)
+
+    def chip_index(self, x: int, y: int) -> int:
+        """
+        Get the stable index of the (x, y) coordinates.
+
+        Inside the width and height of the machine this is
+        ``y * width + x`` whether or not there is a chip there.
+        Any other (x, y) gets the next index after these the first time a
+        chip is added there.
+        Indexes do not change when chips are added or removed,
+        so they can be used to key per-chip data held in flat arrays of
+        :py:attr:`n_chip_slots` entries.
+
+        :param x: The x coordinate
+        :param y: The y coordinate
+        :return: The index between 0 and n_chip_slots - 1
+        :raise SpinnMachineInvalidParameterException:
+            If (x, y) is outside the machine and has never had a chip
+        """
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return y * self._width + x
+        try:
+            return self._extra_slots[x, y]
+        except KeyError as ex:
+            raise SpinnMachineInvalidParameterException(
+                "x, y", (x, y), "Outside the machine and never had a chip"
+            ) from ex
+
+    def _add_extra_slot(self, xy: XY) -> None:
+        """
+        Gives an (x, y) outside the width and height the next slot index.
+
+        :param xy: The (x, y) coordinates, which must not have a slot yet
+        """
+        self._extra_slots[xy] = (
+            self._width * self._height + len(self._extra_xys))
+        self._extra_xys.append(xy)
+
+    def chip_xy(self, index: int) -> XY:
+        """
+        Get the (x, y) coordinates of a stable chip index.
+
+        This is the reverse of :py:meth:`chip_index`.
+        There may not be a chip at the (x, y) returned.
+
+        :param index: An index between 0 and n_chip_slots - 1
+        :return: The (x, y) coordinates of the index
+        :raise SpinnMachineInvalidParameterException:
+            If the index is not between 0 and n_chip_slots - 1
+        """
+        n_grid = self._width * self._height
+        if 0 <= index < n_grid:
+            return index % self._width, index // self._width
+        if n_grid <= index < self.n_chip_slots:
+            return self._extra_xys[index - n_grid]
+        raise SpinnMachineInvalidParameterException(
+            "index", index, f"Not between 0 and {self.n_chip_slots - 1}")
+
+    def chip_indexes(self, x: ArrayLike, y: ArrayLike) -> NDArray[numpy.int64]:
+        """
+        Get the stable indexes of many (x, y) coordinates at once.
+
+        :param x: The x coordinates to look up
+        :param y: The y coordinates to look up, the same shape as x
+        :return: The index of each (x, y) as for :py:meth:`chip_index`,
+            or -1 where the (x, y) has no index
+        """
+        x = numpy.asarray(x, dtype=numpy.int64)
+        y = numpy.asarray(y, dtype=numpy.int64)
+        inside = (x >= 0) & (x < self._width) & (y >= 0) & (y < self._height)
+        indexes = numpy.where(inside, y * self._width + x, -1)
+        for pos in zip(*numpy.nonzero(~inside)):
+            indexes[pos] = self._extra_slots.get(
+                (int(x[pos]), int(y[pos])), -1)
+        return indexes
+
+    def chip_xys(self, indexes: ArrayLike) -> NDArray[numpy.int32]:
+        """
+        Get the (x, y) coordinates of many stable chip indexes at once.
+
+        :param indexes: Indexes between 0 and n_chip_slots - 1
+        :return: An array with the (x, y) of each index in the last axis
+        :raise SpinnMachineInvalidParameterException:
+            If any index is not between 0 and n_chip_slots - 1
+        """
+        indexes = numpy.asarray(indexes, dtype=numpy.int64)
+        if indexes.size and (
+                indexes.min() < 0 or indexes.max() >= self.n_chip_slots):
+            raise SpinnMachineInvalidParameterException(
+                "indexes", indexes,
+                f"Not all between 0 and {self.n_chip_slots - 1}")
+        xys = numpy.stack(
+            (indexes % self._width, indexes // self._width), axis=-1)
+        extra = indexes >= self._width * self._height
+        if extra.any():
+            extras = numpy.array(self._extra_xys, dtype=numpy.int64)
+            xys[extra] = extras[indexes[extra] - self._width * self._height]
+        return xys.astype(numpy.int32)
+
     @property
     def chip_coordinates(self) -> Iterator[XY]:
         """
@@ -589,7 +1251,7 @@ class Machine(object, metaclass=AbstractBase):
 
         :return: The number of items in the underlying iterable
         """
-        return len(self._chips)
+        return self.n_chips
 
     def get_chip_at(self, x: int, y: int) -> Optional[Chip]:
         """
@@ -601,7 +1263,8 @@ class Machine(object, metaclass=AbstractBase):
         :return: the chip at the specified location,
             or ``None`` if no such chip
         """
-        return self._chips.get((x, y))
+        self._build_lazy(x, y)
+        return self._chip_map.get((x, y))
 
     def __getitem__(self, x_y_tuple: XY) -> Chip:
         """
@@ -612,7 +1275,8 @@ class Machine(object, metaclass=AbstractBase):
             * y is the y-coordinate of the chip to retrieve
         :return: the chip at the specified location
         """
-        return self._chips[x_y_tuple]
+        self._build_lazy(x_y_tuple[0], x_y_tuple[1])
+        return self._chip_map[x_y_tuple]
 
     def is_chip_at(self, x: int, y: int) -> bool:
         """
@@ -623,7 +1287,8 @@ class Machine(object, metaclass=AbstractBase):
         :param y: y location of the chip to test for existence
         :return: True if the chip exists, False otherwise
         """
-        return (x, y) in self._chips
+        self._build_lazy(x, y)
+        return (x, y) in self._chip_map
 
     def is_link_at(self, x: int, y: int, link: int) -> bool:
         """
@@ -634,7 +1299,8 @@ class Machine(object, metaclass=AbstractBase):
         :param link: The link to test the existence of
         :returns: True if an only the Chip exists and has the Link
         """
-        return (x, y) in self._chips and self._chips[x, y].router.is_link(link)
+        chip = self.get_chip_at(x, y)
+        return chip is not None and chip.router.is_link(link)
 
     def __contains__(self, x_y_tuple: XY) -> bool:
         """
@@ -645,7 +1311,7 @@ class Machine(object, metaclass=AbstractBase):
             * y is the y-coordinate of the chip to retrieve
         :return: True if the chip exists, False otherwise
         """
-        return x_y_tuple in self._chips
+        return self.is_chip_at(x_y_tuple[0], x_y_tuple[1])
 
     @property
     def width(self) -> int:
@@ -666,7 +1332,8 @@ class Machine(object, metaclass=AbstractBase):
         """
         The number of chips in the machine.
         """
-        return len(self._chips)
+        return len(self._chip_map) + sum(
+            len(xys) for xys, _, _, _ in self._lazy_boards.values())
 
     @property
     def ethernet_connected_chips(self) -> Sequence[Chip]:
@@ -716,18 +1383,36 @@ class Machine(object, metaclass=AbstractBase):
             n_boards = ""
         return (f"[{self._origin}{self.wrap}Machine: width={self._width}, "
                 f"height={self._height},{n_boards} "
-                f"n_chips={len(self._chips)}]")
+                f"n_chips={self.n_chips}]")
 
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __reduce__(self) -> Tuple[
+            Callable[..., Machine], Tuple[object, ...]]:
+        """
+        Pickles the machine as the columns given by :py:func:`chip_columns`
+        rather than as a graph of chips, routers and links.
+
+        Any lazy boards are built first.
+        The unpickled machine has the same chips in the same order.
+        Use :py:func:`machine_from_columns` with lazy True where only the
+        boards used should be built.
+
+        :return: The function and arguments to rebuild the machine
+        """
+        return (machine_from_columns, (
+            type(self), self._width, self._height, self._chip_core_map,
+            self._origin, dict(self._extra_slots), chip_columns(self)))
+
     def get_cores_count(self) -> int:
         """
         Get the number of cores from the machine.
 
         :return: n_cores
         """
-        return sum(n * count for n, count in self._n_cores_counter.items())
+        return sum(n * count for n, count in self._n_cores_counter.items()) + \
+            sum(n for _, n, _, _ in self._lazy_boards.values())
 
     def get_links_count(self) -> float:
         """
@@ -740,6 +1425,7 @@ class Machine(object, metaclass=AbstractBase):
 
         :return: n_links; fractional parts indicate partial link problems
         """
+        self._build_all_lazy()
         return sum(n * count for n, count in self._n_links_counter.items()) / 2
 
     @property
@@ -747,6 +1433,7 @@ class Machine(object, metaclass=AbstractBase):
         """
         The minimum number of router_enteries found on any Chip
         """
+        self._build_all_lazy()
         return sorted(self._n_router_entries_counter.keys())[-1]
 
     def summary_string(self) -> str:
@@ -758,6 +1445,7 @@ class Machine(object, metaclass=AbstractBase):
         :raises AttributeError: If there is no boot chip
         """
         # pylint: disable=logging-fstring-interpolation
+        self._build_all_lazy()
         version = MachineDataView.get_machine_version()
 
         sdram = sorted(self._sdram_counter.keys())
@@ -830,39 +1518,41 @@ class Machine(object, metaclass=AbstractBase):
         The total number of cores on the machine which are not
         monitor cores.
         """
-        return sum(chip.n_placable_processors for chip in self.chips)
+        if self._lazy_boards:
+            return sum(chip.n_placable_processors
+                       for chip in self._chip_map.values()) + sum(
+                n for _, _, n, _ in self._lazy_boards.values())
+        return int(self.arrays.n_placable_processors.sum())
 
     @property
     def total_cores(self) -> int:
         """
         The total number of cores on the machine, including monitors.
         """
-        return sum(chip.n_processors for chip in self.chips)
+        if self._lazy_boards:
+            return self.get_cores_count()
+        return int(self.arrays.n_processors.sum())
 
     def unreachable_outgoing_chips(self) -> List[XY]:
         """
         Detects chips that can not reach any of their neighbours.
 
         Current implementation does *not* deal with group of unreachable chips.
+        See :py:meth:`find_unreachable_chips` for that.
 
         :return: List (hopefully empty) if the (x,y) coordinates of
             unreachable chips.
         """
-        removable_coords: List[XY] = list()
-        for (x, y) in self.chip_coordinates:
-            # If no links out of the chip work, remove it
-            for link in range(6):
-                if self.is_link_at(x, y, link):
-                    break
-            else:
-                removable_coords.append((x, y))
-        return removable_coords
+        # If no links out of the chip work, remove it
+        arrays = self.arrays
+        return arrays.xys(arrays.link_mask == 0)
 
     def unreachable_incoming_chips(self) -> List[XY]:
         """
         Detects chips that are not reachable from any of their neighbours.
 
         Current implementation does *not* deal with group of unreachable chips.
+        See :py:meth:`find_unreachable_chips` for that.
 
         :return: List (hopefully empty) if the (x,y) coordinates of
             unreachable chips.
@@ -886,6 +1576,7 @@ class Machine(object, metaclass=AbstractBase):
         Detects chips that can not reach any of their *local* neighbours.
 
         Current implementation does *not* deal with group of unreachable chips.
+        See :py:meth:`find_unreachable_chips` for that.
 
         :return: List (hopefully empty) if the (x,y) coordinates of
             unreachable chips.
@@ -917,6 +1608,7 @@ class Machine(object, metaclass=AbstractBase):
         neighbours.
 
         Current implementation does *not* deal with group of unreachable chips.
+        See :py:meth:`find_unreachable_chips` for that.
 
         :return: List (hopefully empty) if the (x,y) coordinates of
             unreachable chips.
@@ -942,23 +1634,330 @@ class Machine(object, metaclass=AbstractBase):
                 removable_coords.append((x, y))
         return removable_coords
 
-    def one_way_links(self) -> Iterable[Tuple[int, int, int, int]]:
+    def find_unreachable_chips(
+            self, local: bool = False,
+            ethernets: Optional[Iterable[XY]] = None
+            ) -> Tuple[List[XY], List[XY]]:
+        """
+        Finds, in a single pass over the links, every chip that is not
+        strongly connected to its root chip.
+
+        Unlike the other ``unreachable_*`` methods this also finds groups of
+        chips that can reach each other but are cut off from the root.
+
+        Chips whose root chip is not in the machine are not checked.
+
+        :param local: If True the root of each chip is the Ethernet chip of
+            its board and only links between chips on the same board are used.
+            If False the root of every chip is the boot chip.
+        :param ethernets: If local is True, only check the chips on the boards
+            with an Ethernet chip at one of these (x,y) coordinates.
+            Ignored if local is False.
+        :return: The (x,y) coordinates of the chips that can not be reached
+            from their root and of the chips that can not reach their root.
+        """
+        if not local or ethernets is None:
+            return self._find_unreachable_by_arrays(local)
+        # A few boards are cheaper to search directly than rebuilding the
+        # arrays after every change, as repair does
+        chips = [chip for (e_x, e_y) in ethernets
+                 for chip in self.get_chips_by_ethernet(e_x, e_y)]
+        forward: Dict[XY, List[XY]] = defaultdict(list)
+        backward: Dict[XY, List[XY]] = defaultdict(list)
+        for chip in chips:
+            xy = (chip.x, chip.y)
+            for _, d_x, d_y in chip.router.destinations():
+                target = (d_x, d_y)
+                neighbour = self._chips.get(target)
+                if neighbour is None:
+                    continue
+                if local and (
+                        neighbour.nearest_ethernet_x !=
+                        chip.nearest_ethernet_x or
+                        neighbour.nearest_ethernet_y !=
+                        chip.nearest_ethernet_y):
+                    continue
+                forward[xy].append(target)
+                backward[target].append(xy)
+
+        roots = {(chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+                 for chip in chips}
+        roots.intersection_update(self._chips)
+        reached = self._search(roots, forward)
+        returned = self._search(roots, backward)
+
+        not_reached: List[XY] = list()
+        not_returned: List[XY] = list()
+        for chip in chips:
+            xy = (chip.x, chip.y)
+            if (chip.nearest_ethernet_x,
+                    chip.nearest_ethernet_y) not in roots:
+                continue
+            if xy not in reached:
+                not_reached.append(xy)
+            if xy not in returned:
+                not_returned.append(xy)
+        return not_reached, not_returned
+
+    def _find_unreachable_by_arrays(
+            self, local: bool) -> Tuple[List[XY], List[XY]]:
+        """
+        Does :py:meth:`find_unreachable_chips` for the whole machine using
+        the neighbour table of :py:attr:`arrays`.
+
+        :param local: If True use a root per board, else the boot chip
+        :return: The (x,y) coordinates of the chips that can not be reached
+            from their root and of the chips that can not reach their root.
+        """
+        arrays = self.arrays
+        table = arrays.neighbours
+        if local:
+            ethernet_x = arrays.nearest_ethernet_x
+            ethernet_y = arrays.nearest_ethernet_y
+            # Only keep links between chips on the same board
+            target = numpy.maximum(table, 0)
+            same = ((table >= 0) &
+                    (ethernet_x[target] == ethernet_x[:, None]) &
+                    (ethernet_y[target] == ethernet_y[:, None]))
+            table = numpy.where(same, table, -1)
+            root_of = arrays.positions_of(ethernet_x, ethernet_y)
+        else:
+            root_of = numpy.full(
+                len(arrays), arrays.positions_of(0, 0), dtype=numpy.int32)
+        checked = root_of >= 0
+        roots = numpy.unique(root_of[checked])
+        reached = MachineArrays.breadth_first(table, roots) >= 0
+        returned = MachineArrays.breadth_first(
+            MachineArrays.reverse_table(table), roots) >= 0
+        return (arrays.xys(checked & ~reached),
+                arrays.xys(checked & ~returned))
+
+    @staticmethod
+    def _search(roots: Iterable[XY], edges: Dict[XY, List[XY]]) -> Set[XY]:
+        """
+        Breadth first search over the edges from all the roots at once.
+
+        :param roots: The (x,y) coordinates to start from
+        :param edges: The (x,y) coordinates reached from each (x,y)
+        :return: All the (x,y) coordinates reached including the roots
+        """
+        seen = set(roots)
+        queue = deque(seen)
+        while queue:
+            for target in edges.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def unreachable_chips(self) -> List[XY]:
+        """
+        Detects all the chips that are not strongly connected to the boot
+        chip, including groups of chips that are cut off together.
+
+        :return: List (hopefully empty) of the (x,y) coordinates of
+            unreachable chips.
+        """
+        not_reached, not_returned = self.find_unreachable_chips()
+        unreachable = set(not_reached).union(not_returned)
+        return [xy for xy in self._chips if xy in unreachable]
+
+    def unreachable_local_chips(self) -> List[XY]:
+        """
+        Detects all the chips that are not strongly connected to the Ethernet
+        chip of their board using only the links on that board,
+        including groups of chips that are cut off together.
+
+        :return: List (hopefully empty) of the (x,y) coordinates of
+            unreachable chips.
+        """
+        not_reached, not_returned = self.find_unreachable_chips(local=True)
+        unreachable = set(not_reached).union(not_returned)
+        return [xy for xy in self._chips if xy in unreachable]
+
+    def one_way_links(self, xys: Optional[Iterable[XY]] = None
+                      ) -> Iterable[Tuple[int, int, int, int]]:
         """
         Links with no link going the opposite way
 
+        :param xys: If given only the links out of the chips at these (x,y)
+            coordinates are checked
         :returns: Iterable of links that only go one way.
             If any these will be Tuples of x, y, out (existing link id)
             and back (id on the target) that is missing
         """
+        if xys is None:
+            yield from self._one_way_links_by_arrays()
+            return
         link_checks = [(0, 3), (1, 4), (2, 5), (3, 0), (4, 1), (5, 2)]
-        for chip in self.chips:
+        chips = [self._chips[xy] for xy in xys if xy in self._chips]
+        for chip in chips:
             for out, back in link_checks:
-                link = chip.router.get_link(out)
-                if link is not None:
-                    if not self.is_link_at(
-                            link.destination_x, link.destination_y, back):
+                target = chip.router.get_destination(out)
+                if target is not None:
+                    if not self.is_link_at(target[0], target[1], back):
                         yield chip.x, chip.y, out, back
 
+    def _one_way_links_by_arrays(
+            self) -> Iterable[Tuple[int, int, int, int]]:
+        """
+        Does :py:meth:`one_way_links` for the whole machine using the
+        neighbour table of :py:attr:`arrays`.
+
+        :returns: Iterable of x, y, out and back of the links that only go
+            one way
+        """
+        arrays = self.arrays
+        table = arrays.neighbours
+        link_ids = numpy.arange(Router.MAX_LINKS_PER_ROUTER)
+        has_link = ((arrays.link_mask[:, None] >> link_ids) & 1).astype(bool)
+        backs = (link_ids + Router.LINK_OPPOSITE) % 6
+        # Links to chips that do not exist have no link back
+        has_back = numpy.zeros(has_link.shape, dtype=bool)
+        rows, outs = numpy.nonzero(table >= 0)
+        has_back[rows, outs] = has_link[table[rows, outs], backs[outs]]
+        rows, outs = numpy.nonzero(has_link & ~has_back)
+        for row, out in zip(rows.tolist(), outs.tolist()):
+            yield (int(arrays.x[row]), int(arrays.y[row]), out,
+                   int(backs[out]))
+
+    def shortest_path(
+            self, source: XY, destination: XY) -> Optional[Path]:
+        """
+        Finds a shortest path between two chips using only the chips and links
+        that actually exist.
+
+        Unlike :py:meth:`get_vector_length` this takes into account missing
+        chips and links, such as those removed by a repair or configured as
+        down.
+
+        This is an A* search using :py:meth:`get_vector_length` as the
+        heuristic, which assumes links go to the chip given by
+        :py:meth:`xy_over_link` as they do on a real machine.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The links to follow in order and the number of hops,
+            or None if there is no path.
+        """
+        source = (source[0], source[1])
+        destination = (destination[0], destination[1])
+        if source not in self._chips or destination not in self._chips:
+            return None
+        hops: Dict[XY, int] = {source: 0}
+        arrived_by: Dict[XY, Tuple[XY, int]] = dict()
+        queue = [(self.get_vector_length(source, destination), 0, source)]
+        while queue:
+            _, n_hops, xy = heapq.heappop(queue)
+            if xy == destination:
+                return self._backtrack(arrived_by, source, destination)
+            if n_hops > hops[xy]:
+                # Already reached by a shorter path
+                continue
+            n_hops += 1
+            for link_id, d_x, d_y in self._chips[xy].router.destinations():
+                next_xy = (d_x, d_y)
+                if next_xy in self._chips and n_hops < hops.get(
+                        next_xy, n_hops + 1):
+                    hops[next_xy] = n_hops
+                    arrived_by[next_xy] = (xy, link_id)
+                    heapq.heappush(queue, (
+                        n_hops + self.get_vector_length(next_xy, destination),
+                        n_hops, next_xy))
+        return None
+
+    def shortest_paths(
+            self, pairs: Iterable[Tuple[XY, XY]]) -> List[Optional[Path]]:
+        """
+        Finds shortest paths between many pairs of chips using only the chips
+        and links that actually exist.
+
+        Pairs that share a source are solved by a single breadth first search
+        from that source, while lone pairs use :py:meth:`shortest_path`.
+        Each path has the same number of hops as :py:meth:`shortest_path`
+        would give but where there are several shortest paths a different one
+        may be returned.
+
+        :param pairs: The (source, destination) (x,y) coordinates to find
+        :return: For each pair in order, the links to follow and the number of
+            hops, or None if there is no path.
+        """
+        by_source: Dict[XY, List[XY]] = defaultdict(list)
+        pair_list = [((s[0], s[1]), (d[0], d[1])) for s, d in pairs]
+        for source, destination in pair_list:
+            by_source[source].append(destination)
+        found: Dict[Tuple[XY, XY], Optional[Path]] = dict()
+        for source, destinations in by_source.items():
+            if len(destinations) == 1:
+                found[source, destinations[0]] = self.shortest_path(
+                    source, destinations[0])
+                continue
+            arrived_by = self._breadth_first(source, set(destinations))
+            # A chip that does not exist has no path even to itself
+            at_source = source in self._chips
+            for destination in destinations:
+                if destination in arrived_by or (
+                        destination == source and at_source):
+                    found[source, destination] = self._backtrack(
+                        arrived_by, source, destination)
+                else:
+                    found[source, destination] = None
+        return [found[pair] for pair in pair_list]
+
+    def _breadth_first(
+            self, source: XY,
+            destinations: Set[XY]) -> Dict[XY, Tuple[XY, int]]:
+        """
+        Searches out from source over existing links until all the
+        destinations have been reached or there is nothing left to reach.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destinations: (x,y) coordinates of the chips to reach
+        :return: The chip and link ID from which each reached chip was
+            first arrived at
+        """
+        arrived_by: Dict[XY, Tuple[XY, int]] = dict()
+        if source not in self._chips:
+            return arrived_by
+        remaining = set(destinations)
+        remaining.discard(source)
+        seen = {source}
+        queue = deque([source])
+        while queue and remaining:
+            xy = queue.popleft()
+            for link_id, d_x, d_y in self._chips[xy].router.destinations():
+                next_xy = (d_x, d_y)
+                if next_xy not in seen and next_xy in self._chips:
+                    seen.add(next_xy)
+                    arrived_by[next_xy] = (xy, link_id)
+                    remaining.discard(next_xy)
+                    queue.append(next_xy)
+        return arrived_by
+
+    def _backtrack(
+            self, arrived_by: Dict[XY, Tuple[XY, int]], source: XY,
+            destination: XY) -> Path:
+        """
+        Builds a path by following the links back from the destination.
+
+        Only the links on the path are created.
+
+        :param arrived_by: The chip and link ID from which each chip was
+            reached
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The links to follow in order and the number of hops
+        """
+        links: List[Link] = []
+        xy = destination
+        while xy != source:
+            xy, link_id = arrived_by[xy]
+            link = self._chips[xy].router.get_link(link_id)
+            assert link is not None
+            links.append(link)
+        links.reverse()
+        return links, len(links)
+
     @staticmethod
     def _minimize_vector(x: int, y: int) -> Tuple[int, int, int]:
         """
@@ -998,6 +1997,69 @@ class Machine(object, metaclass=AbstractBase):
                 else:
                     return (x - y, 0, -y)
 
+    @staticmethod
+    def _deltas(
+            sources: ArrayLike, destinations: ArrayLike) -> Tuple[
+                NDArray[numpy.int64], NDArray[numpy.int64]]:
+        """
+        Get the x and y differences between arrays of sources and
+        destinations.
+
+        :param sources: N by 2 array of (x,y) coordinates
+        :param destinations: N by 2 array of (x,y) coordinates
+        :return: The x differences and the y differences
+        """
+        # Reshaped so that an empty batch is 0 by 2 rather than 1-D
+        source_array = numpy.asarray(
+            sources, dtype=numpy.int64).reshape(-1, 2)
+        destination_array = numpy.asarray(
+            destinations, dtype=numpy.int64).reshape(-1, 2)
+        return (destination_array[:, 0] - source_array[:, 0],
+                destination_array[:, 1] - source_array[:, 1])
+
+    @staticmethod
+    def _vector_lengths(
+            x: NDArray[numpy.int64],
+            y: NDArray[numpy.int64]) -> NDArray[numpy.int64]:
+        """
+        Gets the length of each (x, y, 0) vector once minimised.
+
+        As minimising does not change the range of numbers in a vector this is
+        the range of x, y and 0.
+
+        :param x:
+        :param y:
+        :return: the lengths
+        """
+        zero = numpy.zeros_like(x)
+        return (numpy.maximum(numpy.maximum(x, y), zero) -
+                numpy.minimum(numpy.minimum(x, y), zero))
+
+    @staticmethod
+    def _minimize_vectors(
+            x: NDArray[numpy.int64],
+            y: NDArray[numpy.int64]) -> NDArray[numpy.int64]:
+        """
+        Minimises arrays of (x, y, 0) vectors.
+
+        This uses exactly the same rules as :py:meth:`_minimize_vector`.
+
+        :param x:
+        :param y:
+        :return: N by 3 array of (x, y, z) vectors
+        """
+        positive = (x > 0) & (y > 0)
+        negative = (x <= 0) & (y <= 0)
+        # delta is y so x - y, 0, -y
+        by_y = (positive & (x > y)) | (negative & (x <= y))
+        # delta is x so 0, y - x, -x
+        by_x = (positive & (x <= y)) | (negative & (x > y))
+        vectors = numpy.empty((len(x), 3), dtype=numpy.int64)
+        vectors[:, 0] = numpy.where(by_y, x - y, numpy.where(by_x, 0, x))
+        vectors[:, 1] = numpy.where(by_x, y - x, numpy.where(by_y, 0, y))
+        vectors[:, 2] = numpy.where(by_y, -y, numpy.where(by_x, -x, 0))
+        return vectors
+
     @property
     def local_xys(self) -> Iterable[XY]:
         """
@@ -1025,20 +2087,26 @@ class Machine(object, metaclass=AbstractBase):
         It will however return the same `unused_xy` until a chip is added at
         that location.
 
+        The search carries on from the last (x,y) returned so finding each
+        of many unused (x,y)s in turn, as chips are added at them, takes
+        amortised constant time.
+
         :return: an unused (x,y) coordinate
         """
-        # get a set of xys that could be connected to any existing Ethernet
-        xys_by_ethernet: Set[XY] = set()
-        for ethernet_x, ethernet_y in self.ethernet_connected_chips:
-            xys_by_ethernet.update(self.get_xys_by_ethernet(
-                ethernet_x, ethernet_y))
-        x = 0
-        while (True):
-            for y in range(self.height):
-                xy = (x, y)
-                if xy not in self._chips and xy not in xys_by_ethernet:
-                    return xy
-            x += 1
+        if self._board_xys is None:
+            # get a set of xys that could be connected to any existing Ethernet
+            self._board_xys = set()
+            for ethernet in self._ethernet_connected_chips:
+                self._board_xys.update(self.get_xys_by_ethernet(
+                    ethernet.x, ethernet.y))
+        x, y = self._unused_xy
+        while (x, y) in self._chips or (x, y) in self._board_xys:
+            y += 1
+            if y >= self._height:
+                x += 1
+                y = 0
+        self._unused_xy = (x, y)
+        return x, y
 
     @staticmethod
     def _basic_concentric_xys(radius: int, start: XY) -> Iterator[XY]:
@@ -0,0 +1,317 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.typing.coords import XY
+
+from .router import Router
+
+if TYPE_CHECKING:
+    from .chip import Chip
+
+
+def _frozen(values: List[int], dtype: type) -> NDArray:
+    array: NDArray = numpy.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+class MachineArrays(object):
+    """
+    A read-only columnar view of the Chips of a Machine.
+
+    Each column is a NumPy array with one entry per Chip.
+    The entry for each Chip is found at the chip's position, which is
+    where the Chip was in :py:attr:`Machine.chips` when the view was built.
+    Positions change as chips are added or removed, so unlike the stable
+    :py:meth:`Machine.chip_index` they should not be kept beyond the view.
+    :py:meth:`Machine.chip_indexes` of :py:attr:`x` and :py:attr:`y` gives
+    the stable index of the Chip at each position.
+
+    The view is a snapshot taken when it was created.
+    Changes made directly to a Chip or Router afterwards are not seen.
+    """
+
+    __slots__ = (
+        "_grid", "_indexes", "_indices", "_indptr", "_is_ethernet",
+        "_link_mask", "_n_placable_processors", "_n_processors",
+        "_n_router_entries", "_nearest_ethernet_x", "_nearest_ethernet_y",
+        "_neighbours", "_sdram", "_x", "_y")
+
+    def __init__(self, chips: Iterable[Chip]):
+        """
+        :param chips: The Chips to include in the order of their positions
+        """
+        xs: List[int] = []
+        ys: List[int] = []
+        n_processors: List[int] = []
+        n_placable_processors: List[int] = []
+        sdram: List[int] = []
+        nearest_ethernet_x: List[int] = []
+        nearest_ethernet_y: List[int] = []
+        n_router_entries: List[int] = []
+        link_mask: List[int] = []
+        is_ethernet: List[int] = []
+        # The index of the chip, link and destination of every link
+        links: List[Tuple[int, int, XY]] = []
+        self._indexes: Dict[XY, int] = dict()
+        for index, chip in enumerate(chips):
+            self._indexes[chip.x, chip.y] = index
+            xs.append(chip.x)
+            ys.append(chip.y)
+            n_processors.append(chip.n_processors)
+            n_placable_processors.append(chip.n_placable_processors)
+            sdram.append(chip.sdram)
+            nearest_ethernet_x.append(chip.nearest_ethernet_x)
+            nearest_ethernet_y.append(chip.nearest_ethernet_y)
+            n_router_entries.append(chip.router.n_available_multicast_entries)
+            for link_id, d_x, d_y in chip.router.destinations():
+                if 0 <= link_id < Router.MAX_LINKS_PER_ROUTER:
+                    links.append((index, link_id, (d_x, d_y)))
+            link_mask.append(chip.router.link_mask)
+            is_ethernet.append(chip.ip_address is not None)
+
+        self._x = _frozen(xs, numpy.int32)
+        self._y = _frozen(ys, numpy.int32)
+        self._n_processors = _frozen(n_processors, numpy.int32)
+        self._n_placable_processors = _frozen(
+            n_placable_processors, numpy.int32)
+        self._sdram = _frozen(sdram, numpy.int64)
+        self._nearest_ethernet_x = _frozen(nearest_ethernet_x, numpy.int32)
+        self._nearest_ethernet_y = _frozen(nearest_ethernet_y, numpy.int32)
+        self._n_router_entries = _frozen(n_router_entries, numpy.int64)
+        self._link_mask = _frozen(link_mask, numpy.uint8)
+        self._is_ethernet = _frozen(is_ethernet, numpy.bool_)
+
+        # The index of the Chip at each x, y or -1 if there is none
+        self._grid = numpy.full(
+            (max(xs, default=-1) + 1, max(ys, default=-1) + 1), -1,
+            dtype=numpy.int32)
+        # Chips with negative coordinates are invalid and never looked up
+        valid = (self._x >= 0) & (self._y >= 0)
+        self._grid[self._x[valid], self._y[valid]] = numpy.nonzero(valid)[0]
+        self._grid.flags.writeable = False
+
+        self._neighbours = numpy.full(
+            (len(xs), Router.MAX_LINKS_PER_ROUTER), -1, dtype=numpy.int32)
+        for index, link_id, destination in links:
+            self._neighbours[index, link_id] = self._indexes.get(
+                destination, -1)
+        self._neighbours.flags.writeable = False
+        # Rows in order so the indices of each row are together
+        exists = self._neighbours >= 0
+        self._indices = self._neighbours[exists]
+        self._indices.flags.writeable = False
+        indptr = numpy.zeros(len(xs) + 1, dtype=numpy.int64)
+        numpy.cumsum(exists.sum(axis=1), out=indptr[1:])
+        self._indptr = indptr
+        self._indptr.flags.writeable = False
+
+    def __len__(self) -> int:
+        """
+        The number of Chips in the view.
+        """
+        return len(self._indexes)
+
+    def position_of(self, x: int, y: int) -> int:
+        """
+        Get the position of the Chip at (x, y).
+
+        :param x: The x coordinate of the Chip
+        :param y: The y coordinate of the Chip
+        :return: The position of the Chip in each of the columns
+        :raises KeyError: If there is no Chip at (x, y)
+        """
+        return self._indexes[x, y]
+
+    def positions_of(
+            self, x: ArrayLike, y: ArrayLike) -> NDArray[numpy.int32]:
+        """
+        Get the positions of the Chips at many (x, y) coordinates at once.
+
+        :param x: The x coordinates to look up
+        :param y: The y coordinates to look up, the same shape as x
+        :return: The position of the Chip at each (x, y), or -1 where there
+            is no Chip
+        """
+        x = numpy.asarray(x)
+        y = numpy.asarray(y)
+        width, height = self._grid.shape
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        indexes = numpy.full(x.shape, -1, dtype=numpy.int32)
+        indexes[inside] = self._grid[x[inside], y[inside]]
+        return indexes
+
+    @property
+    def x(self) -> NDArray[numpy.int32]:
+        """
+        The X coordinate of each Chip.
+        """
+        return self._x
+
+    @property
+    def y(self) -> NDArray[numpy.int32]:
+        """
+        The Y coordinate of each Chip.
+        """
+        return self._y
+
+    @property
+    def n_processors(self) -> NDArray[numpy.int32]:
+        """
+        The total number of processors on each Chip.
+        """
+        return self._n_processors
+
+    @property
+    def n_placable_processors(self) -> NDArray[numpy.int32]:
+        """
+        The number of placeable / non scamp processors on each Chip.
+        """
+        return self._n_placable_processors
+
+    @property
+    def sdram(self) -> NDArray[numpy.int64]:
+        """
+        The SDRAM of each Chip.
+        """
+        return self._sdram
+
+    @property
+    def nearest_ethernet_x(self) -> NDArray[numpy.int32]:
+        """
+        The X coordinate of the nearest Ethernet chip of each Chip.
+        """
+        return self._nearest_ethernet_x
+
+    @property
+    def nearest_ethernet_y(self) -> NDArray[numpy.int32]:
+        """
+        The Y coordinate of the nearest Ethernet chip of each Chip.
+        """
+        return self._nearest_ethernet_y
+
+    @property
+    def n_router_entries(self) -> NDArray[numpy.int64]:
+        """
+        The number of available multicast entries on the router of each Chip.
+        """
+        return self._n_router_entries
+
+    @property
+    def link_mask(self) -> NDArray[numpy.uint8]:
+        """
+        A bit mask of the links each Chip's router has.
+
+        Bit `n` is set if and only if the router has a link with ID `n`.
+        """
+        return self._link_mask
+
+    @property
+    def is_ethernet(self) -> NDArray[numpy.bool_]:
+        """
+        Flag to say if each Chip has an Ethernet connection.
+        """
+        return self._is_ethernet
+
+    @property
+    def neighbours(self) -> NDArray[numpy.int32]:
+        """
+        The position of the Chip reached over each link of each Chip.
+
+        This is an n_chips by 6 table indexed by position and link ID
+        with -1 where there is no link or no Chip at the other end.
+        """
+        return self._neighbours
+
+    @property
+    def csr(self) -> Tuple[NDArray[numpy.int64], NDArray[numpy.int32]]:
+        """
+        The links between Chips as compressed sparse row adjacency.
+
+        This is the (indptr, indices) pair, where the positions of the Chips
+        reached from the Chip at position `i` are
+        ``indices[indptr[i]:indptr[i + 1]]`` in link ID order.
+        Links to Chips that do not exist are left out.
+
+        The arrays are built once and shared, so can be used directly,
+        for example as ``scipy.sparse.csr_array((data, indices, indptr))``.
+        """
+        return self._indptr, self._indices
+
+    @staticmethod
+    def reverse_table(
+            table: NDArray[numpy.int32]) -> NDArray[numpy.int32]:
+        """
+        Builds the table of the Chips that reach each Chip.
+
+        :param table: A table like :py:attr:`neighbours` of the Chips
+            reached from each Chip
+        :return: n_chips by max in degree table padded with -1
+        """
+        sources, _ = numpy.nonzero(table >= 0)
+        targets = table[table >= 0]
+        order = numpy.argsort(targets, kind="stable")
+        sources = sources[order]
+        targets = targets[order]
+        counts = numpy.bincount(targets, minlength=len(table))
+        width = int(counts.max()) if len(counts) else 0
+        reverse = numpy.full(
+            (len(table), max(width, 1)), -1, dtype=numpy.int32)
+        starts = numpy.cumsum(counts) - counts
+        columns = numpy.arange(len(targets)) - starts[targets]
+        reverse[targets, columns] = sources
+        return reverse
+
+    @staticmethod
+    def breadth_first(
+            table: NDArray[numpy.int32],
+            starts: ArrayLike) -> NDArray[numpy.int32]:
+        """
+        Finds the hops from the nearest start to every Chip, one whole
+        level at a time.
+
+        :param table: A table like :py:attr:`neighbours` of the Chips
+            reached from each Chip
+        :param starts: The position or positions of the Chips to start from
+        :return: The hops to each Chip or -1 if the Chip can not be reached
+        """
+        distances = numpy.full(len(table), -1, dtype=numpy.int32)
+        frontier: NDArray = numpy.unique(
+            numpy.asarray(starts, dtype=numpy.intp))
+        distances[frontier] = 0
+        hops = 0
+        while len(frontier):
+            hops += 1
+            reached = table[frontier].ravel()
+            reached = reached[reached >= 0]
+            reached = numpy.unique(reached[distances[reached] < 0])
+            distances[reached] = hops
+            frontier = reached
+        return distances
+
+    def xys(self, selected: NDArray[numpy.bool_]) -> List[XY]:
+        """
+        Converts a mask over the Chips into a list of their (x, y)s.
+
+        :param selected: A boolean array with one entry per Chip
+        :return: The (x, y) coordinates of the selected Chips in order of
+            position
+        """
+        return list(zip(self._x[selected].tolist(),
+                        self._y[selected].tolist()))
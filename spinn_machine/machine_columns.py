@@ -0,0 +1,211 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from functools import partial
+from typing import (
+    Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type,
+    TYPE_CHECKING)
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.typing.coords import XY
+
+from .chip import Chip
+from .router import Router
+if TYPE_CHECKING:
+    from .machine import Machine
+
+#: The values of a chip other than its x, y and links as
+#: (scamp_processors, placable_processors, sdram, nearest_ethernet_x,
+#: nearest_ethernet_y, ip_address, tag_ids, parent_link,
+#: n_available_multicast_entries)
+ChipValues = Tuple[
+    Tuple[int, ...], Tuple[int, ...], int, int, int, Optional[str],
+    Tuple[int, ...], Optional[int], int]
+
+
+class ChipColumns(NamedTuple):
+    """
+    The chips of a machine held as NumPy arrays with one entry per chip,
+    plus a table of the distinct values shared by many chips.
+
+    Links that go from their chip to the neighbour given by the geometry of
+    the machine are only held as a bit in the link mask.
+    The links of a router that does not hold them in order of link ID are
+    all held as odd links instead, so they are made again in the same order.
+    """
+    #: The x and y of each chip
+    xys: NDArray[numpy.int32]
+    #: The index into :py:attr:`values` of each chip
+    value_indexes: NDArray[numpy.int32]
+    #: The distinct values of the chips other than the x, y and links
+    values: List[ChipValues]
+    #: The IDs of the links of each chip as a bit mask,
+    #: or 0 if the links are all odd links
+    link_masks: NDArray[numpy.uint8]
+    #: The chip index, link ID, source x and y and destination x and y of
+    #: each link that does not follow the geometry of the machine
+    #: or is held out of order of link ID
+    odd_links: NDArray[numpy.int32]
+
+    def boards(self) -> Dict[XY, Tuple[List[int], int, int]]:
+        """
+        Groups the chips by the (x, y) of their nearest Ethernet chip.
+
+        :return: The indexes of the chips, the number of cores and the number
+            of placeable cores of each board, in the order first seen
+        """
+        boards: Dict[XY, Tuple[List[int], int, int]] = dict()
+        for index, value_index in enumerate(self.value_indexes.tolist()):
+            scamp, placable, _, e_x, e_y, *_ = self.values[value_index]
+            indexes, n_cores, n_placable = boards.get((e_x, e_y), ([], 0, 0))
+            indexes.append(index)
+            boards[e_x, e_y] = (
+                indexes, n_cores + len(scamp) + len(placable),
+                n_placable + len(placable))
+        return boards
+
+
+def chip_columns(machine: Machine) -> ChipColumns:
+    """
+    Gets the chips of a machine as columns.
+
+    Any lazy boards of the machine are built first.
+
+    :param machine: The machine to get the chips of
+    :return: The columns, with the chips in the order of
+        :py:attr:`Machine.chips`
+    """
+    xys: List[XY] = []
+    value_indexes: List[int] = []
+    values: Dict[ChipValues, int] = dict()
+    link_masks: List[int] = []
+    odd_links: List[Tuple[int, int, int, int, int, int]] = []
+    for index, chip in enumerate(machine.chips):
+        x, y = chip
+        xys.append((x, y))
+        chip_values: ChipValues = (
+            chip.scamp_processors_ids, chip.placable_processors_ids,
+            chip.sdram, chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+            chip.ip_address, tuple(chip.tag_ids), chip.parent_link,
+            chip.router.n_available_multicast_entries)
+        value_indexes.append(values.setdefault(chip_values, len(values)))
+        router = chip.router
+        mask = router.link_mask
+        in_order = (
+            [link_id for link_id, _ in router] ==
+            list(Router.link_ids_in_mask(mask)))
+        link_masks.append(mask if in_order else 0)
+        for link_id, link in router:
+            destination = (link.destination_x, link.destination_y)
+            if (not in_order or
+                    link.source_x != x or link.source_y != y or
+                    destination != machine.xy_over_link(x, y, link_id)):
+                odd_links.append((
+                    index, link_id, link.source_x, link.source_y,
+                    link.destination_x, link.destination_y))
+    return ChipColumns(
+        xys=numpy.array(xys, dtype=numpy.int32).reshape(-1, 2),
+        value_indexes=numpy.array(value_indexes, dtype=numpy.int32),
+        values=list(values),
+        link_masks=numpy.array(link_masks, dtype=numpy.uint8),
+        odd_links=numpy.array(odd_links, dtype=numpy.int32).reshape(-1, 6))
+
+
+def chips_from_columns(
+        columns: ChipColumns, indexes: Sequence[int],
+        xy_over_link: Callable[[int, int, int], XY]) -> List[Chip]:
+    """
+    Creates chips from columns.
+
+    :param columns: The columns the chips are in
+    :param indexes: The indexes of the chips to create
+    :param xy_over_link:
+        The function of the machine that gives the neighbour of a chip
+    :return: The chips in the order of the indexes
+    """
+    odd: Dict[int, Dict[int, Tuple[int, int, int, int]]] = dict()
+    odd_rows = columns.odd_links[
+        numpy.isin(columns.odd_links[:, 0], indexes)]
+    for index, link_id, s_x, s_y, d_x, d_y in odd_rows.tolist():
+        odd.setdefault(index, dict())[link_id] = (s_x, s_y, d_x, d_y)
+    xys = columns.xys[indexes].tolist()
+    value_indexes = columns.value_indexes[indexes].tolist()
+    link_masks = columns.link_masks[indexes].tolist()
+    chips = []
+    for i, index in enumerate(indexes):
+        x, y = xys[i]
+        (scamp, placable, sdram, e_x, e_y, ip_address, tag_ids,
+         parent_link, router_entries) = columns.values[value_indexes[i]]
+        odd_links = odd.get(index, {})
+        link_ids = Router.link_ids_in_mask(link_masks[i])
+        # The ends of the links without making Links; any odd links not in
+        # the mask are from a router with links out of order
+        ends: List[int] = []
+        for link_id in link_ids:
+            link_ends = odd_links.pop(link_id, None)
+            if link_ends is None:
+                link_ends = (x, y, *xy_over_link(x, y, link_id))
+            ends += link_ends
+        if odd_links:
+            link_ids += tuple(odd_links)
+            for link_ends in odd_links.values():
+                ends += link_ends
+        router = Router.from_link_ends(link_ids, tuple(ends), router_entries)
+        chips.append(Chip(
+            x, y, scamp, placable, router, sdram, e_x, e_y, ip_address,
+            tag_ids, parent_link))
+    return chips
+
+
+def machine_from_columns(
+        machine_class: Type[Machine], width: int, height: int,
+        chip_core_map: Dict[XY, int], origin: str,
+        extra_slots: Dict[XY, int], columns: ChipColumns,
+        lazy: bool = False) -> Machine:
+    """
+    Creates a machine from columns.
+
+    This is how a pickled machine is rebuilt, with all the chips added in
+    the order of the columns.
+
+    :param machine_class: The type of machine to create
+    :param width: The width of the machine
+    :param height: The height of the machine
+    :param chip_core_map: The expected number of cores of each chip
+    :param origin: Extra information about how the machine was created
+    :param extra_slots: The slot index of each chip outside the width and
+        height, so these stay the same as in the original machine
+    :param columns: The chips of the machine
+    :param lazy: If True each board is added as a lazy board so only the
+        boards used are built, and the chips are in order of board
+    :return: The machine
+    """
+    machine = machine_class(width, height, chip_core_map, origin)
+    # pylint: disable=protected-access
+    for xy in sorted(extra_slots, key=extra_slots.__getitem__):
+        machine._add_extra_slot(xy)
+    if not lazy:
+        machine.add_chips(chips_from_columns(
+            columns, range(len(columns.xys)), machine.xy_over_link))
+        return machine
+    for (e_x, e_y), (indexes, n_cores, n_placable) in \
+            columns.boards().items():
+        xys = [(x, y) for x, y in columns.xys[indexes].tolist()]
+        machine.add_lazy_board(
+            e_x, e_y, xys, n_cores, n_placable,
+            partial(chips_from_columns, columns, indexes,
+                    machine.xy_over_link))
+    return machine
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from spinn_utilities.typing.coords import XY
+
+from .chip import Chip
+from .machine import Machine
+
+#: A link as the x and y of the chip it goes out of and the link ID
+LinkXYId = Tuple[int, int, int]
+
+
+class MachineDiff(NamedTuple):
+    """
+    The differences found by :py:func:`machine_diff`.
+
+    Each change is given as the value in the first machine and then the
+    value in the second machine.
+    """
+    #: The (x, y) of the boards, by their nearest Ethernet chip, that differ
+    changed_boards: List[XY]
+    #: The (x, y) of chips only in the second machine
+    added_chips: List[XY]
+    #: The (x, y) of chips only in the first machine
+    removed_chips: List[XY]
+    #: The number of processors of chips where that changed
+    changed_cores: Dict[XY, Tuple[int, int]]
+    #: The SDRAM of chips where that changed
+    changed_sdram: Dict[XY, Tuple[int, int]]
+    #: The router entries of chips where that changed
+    changed_router_entries: Dict[XY, Tuple[int, int]]
+    #: The tag IDs of chips where those changed
+    changed_tags: Dict[XY, Tuple[Tuple[int, ...], Tuple[int, ...]]]
+    #: The IP address of chips where that changed
+    changed_ip_addresses: Dict[XY, Tuple[Optional[str], Optional[str]]]
+    #: Links out of chips in both machines only in the second machine
+    added_links: List[LinkXYId]
+    #: Links out of chips in both machines only in the first machine
+    removed_links: List[LinkXYId]
+
+    def __bool__(self) -> bool:
+        return bool(self.changed_boards)
+
+
+def _link_ends(chip: Chip) -> Dict[int, XY]:
+    """
+    Gets where each link out of a chip goes.
+
+    :param chip: The chip to get the links of
+    :return: The (x, y) each link of the chip goes to by link ID
+    """
+    return {link_id: (x, y) for link_id, x, y in chip.router.destinations()}
+
+
+def machine_diff(a: Machine, b: Machine) -> MachineDiff:
+    """
+    Finds the differences between two machines, such as a booted machine
+    and a snapshot of the same machine saved earlier as JSON.
+
+    The :py:meth:`Machine.board_digests` are compared first and only the
+    chips on the boards whose digest differs are looked at,
+    so the time taken depends on the number of boards changed rather than
+    the size of the machines.
+
+    A chip that moves to another nearest Ethernet chip marks both boards
+    as changed but is otherwise only reported if some other value changed.
+    A diff is True if any board changed.
+
+    :param a: The first, for example older, machine
+    :param b: The second, for example newer, machine
+    :return: The changes needed to get from a to b
+    """
+    a_digests = a.board_digests()
+    b_digests = b.board_digests()
+    boards = sorted(
+        board for board in set(a_digests) | set(b_digests)
+        if a_digests.get(board) != b_digests.get(board))
+
+    a_chips: Dict[XY, Chip] = dict()
+    b_chips: Dict[XY, Chip] = dict()
+    for board in boards:
+        for chip in a.get_chips_by_ethernet(*board):
+            a_chips[chip.x, chip.y] = chip
+        for chip in b.get_chips_by_ethernet(*board):
+            b_chips[chip.x, chip.y] = chip
+
+    diff = MachineDiff(
+        changed_boards=boards,
+        added_chips=sorted(set(b_chips) - set(a_chips)),
+        removed_chips=sorted(set(a_chips) - set(b_chips)),
+        changed_cores=dict(), changed_sdram=dict(),
+        changed_router_entries=dict(), changed_tags=dict(),
+        changed_ip_addresses=dict(), added_links=[], removed_links=[])
+    for xy in sorted(set(a_chips) & set(b_chips)):
+        a_chip = a_chips[xy]
+        b_chip = b_chips[xy]
+        if a_chip is b_chip or a_chip.fingerprint() == b_chip.fingerprint():
+            continue
+        if a_chip.n_processors != b_chip.n_processors:
+            diff.changed_cores[xy] = (
+                a_chip.n_processors, b_chip.n_processors)
+        if a_chip.sdram != b_chip.sdram:
+            diff.changed_sdram[xy] = (a_chip.sdram, b_chip.sdram)
+        a_entries = a_chip.router.n_available_multicast_entries
+        b_entries = b_chip.router.n_available_multicast_entries
+        if a_entries != b_entries:
+            diff.changed_router_entries[xy] = (a_entries, b_entries)
+        a_tags = tuple(a_chip.tag_ids)
+        b_tags = tuple(b_chip.tag_ids)
+        if a_tags != b_tags:
+            diff.changed_tags[xy] = (a_tags, b_tags)
+        if a_chip.ip_address != b_chip.ip_address:
+            diff.changed_ip_addresses[xy] = (
+                a_chip.ip_address, b_chip.ip_address)
+        a_links = _link_ends(a_chip)
+        b_links = _link_ends(b_chip)
+        for link_id in sorted(set(a_links) | set(b_links)):
+            if a_links.get(link_id) != b_links.get(link_id):
+                if link_id in a_links:
+                    diff.removed_links.append((xy[0], xy[1], link_id))
+                if link_id in b_links:
+                    diff.added_links.append((xy[0], xy[1], link_id))
+    return diff
@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
 import logging
-from typing import Collection, Iterable, Set, Tuple
+from typing import Collection, Iterable, Optional, Set, Tuple
 from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
@@ -26,52 +25,57 @@ from .exceptions import SpinnMachineException
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
-def _machine_ignore(
-        original: Machine, dead_chips: Collection[XY],
-        dead_links: Set[Tuple[int, int, int, int]]) -> Machine:
+def _machine_copy(original: Machine) -> Machine:
     """
-    Creates a near copy of the machine without the dead bits.
+    Creates a new Machine with the same Chips as the original.
 
-    Creates a new Machine with the the Chips that where in the original
-    machine but are not listed as dead.
+    The Chips are shared not copied, so they must be replaced rather than
+    changed when repairing the copy.
 
-    Each Chip will only have the links that already existed and are not listed
-    as dead.
+    :param original: Machine to make a copy of
+    :return: A New Machine object
+    """
+    new_machine = MachineDataView.get_machine_version().create_machine(
+        original.width, original.height, "Fixed")
+    new_machine.add_chips(original.chips)
+    return new_machine
 
-    Spinnaker_links and fpga_links are re-added so removing a wrap around link
-    could results in and extra spiNNaker or FPGA link.
 
-    Dead Chips or links not in the original machine are ignored.
+def _remove_dead(
+        machine: Machine, dead_chips: Collection[XY],
+        dead_links: Set[Tuple[int, int, int, int]]
+        ) -> Tuple[Set[XY], Set[XY]]:
+    """
+    Removes the dead chips and links from the machine in place.
 
-    Does not change the original machine!
+    Dead Chips or links not in the machine are ignored.
 
-    :param original: Machine to make a near copy of
+    :param machine: Machine to remove from
     :param dead_chips: Collection of dead chips' (x, y) coordinates
-    :param dead_links: Collection of dead links' (x, y, direction) coordinates
-    :return: A New Machine object
+    :param dead_links: Collection of dead links' (x, y, direction, back)
+    :return: The (x, y) of the Ethernet chips of the boards that changed
+        and the (x, y) of the chips next to a removed chip
     """
-    new_machine = MachineDataView.get_machine_version().create_machine(
-        original.width, original.height, "Fixed")
-    links_map = defaultdict(set)
-    for x, y, d, _ in dead_links:
-        links_map[(x, y)].add(d)
-    for chip in original.chips:
-        if chip in dead_chips:
+    ethernets: Set[XY] = set()
+    neighbours: Set[XY] = set()
+    for x, y, out, _ in dead_links:
+        if (x, y) not in dead_chips and machine.is_link_at(x, y, out):
+            chip = machine[x, y]
+            ethernets.add((chip.nearest_ethernet_x, chip.nearest_ethernet_y))
+            machine.remove_link(x, y, out)
+    for x, y in dead_chips:
+        if not machine.is_chip_at(x, y):
             continue
-        if chip in links_map:
-            links = []
-            for link in chip.router.links:
-                if link.source_link_id not in links_map[chip]:
-                    links.append(link)
-            router = Router(links, chip.router.n_available_multicast_entries)
-            chip = Chip(
-                chip.x, chip.y, chip.scamp_processors_ids,
-                chip.placable_processors_ids, router, chip.sdram,
-                chip.nearest_ethernet_x, chip.nearest_ethernet_y,
-                chip.ip_address, chip.tag_ids)
-        new_machine.add_chip(chip)
-    new_machine.validate()
-    return new_machine
+        chip = machine[x, y]
+        ethernets.add((chip.nearest_ethernet_x, chip.nearest_ethernet_y))
+        machine.remove_chip(x, y)
+        for link in range(Router.MAX_LINKS_PER_ROUTER):
+            neighbours.add(machine.xy_over_link(x, y, link))
+    neighbours = {xy for xy in neighbours if xy in machine}
+    for x, y in neighbours:
+        chip = machine[x, y]
+        ethernets.add((chip.nearest_ethernet_x, chip.nearest_ethernet_y))
+    return ethernets, neighbours
 
 
 def _generate_uni_direction_link_error(
@@ -118,34 +122,39 @@ def _generate_uni_direction_link_error(
                f"Please report this to {contact_email()} \n\n"
 
 
-def machine_repair(
-        original: Machine, removed_chips: Iterable[XY] = ()) -> Machine:
+def _find_dead(
+        machine: Machine, removed_chips: Iterable[XY], repair_machine: bool,
+        ethernets: Optional[Iterable[XY]] = None,
+        xys: Optional[Iterable[XY]] = None
+        ) -> Tuple[Set[XY], Set[Tuple[int, int, int, int]]]:
     """
-    Remove chips that can't be reached or that can't reach other chips
-    due to missing links.
-
-    Also remove any one way links.
-
-    :param original: the original machine
-    :param removed_chips: List of chips (x and y coordinates) that have been
-        removed while the machine was being created.
-        One-way links to these chip are expected repairs so always done and
-        never logged
+    Finds the chips and links that need to be removed, logging why.
+
+    :param machine: The machine to check
+    :param removed_chips: (x, y) of chips removed while the machine was being
+        created. One-way links to these are not logged
+    :param repair_machine: If False any repair needed is an error
+    :param ethernets: If given only check that the chips on the boards with
+        these Ethernet (x, y) can reach and be reached from the Ethernet chip
+    :param xys: If given only check the links and parents of the chips
+        at these (x, y)
     :raises SpinnMachineException: if repair_machine is false and an unexpected
         repair is needed.
-    :return: Either the original machine or a repaired replacement
+    :return: The dead chips' (x, y) and dead links' (x, y, direction, back)
     """
-    repair_machine = get_config_bool("Machine", "repair_machine")
     dead_chips: Set[XY] = set()
     dead_links: Set[Tuple[int, int, int, int]] = set()
 
     # holder for error message
     error_message = ""
 
-    for xy in original.unreachable_incoming_local_chips():
-        chip = original[xy[0], xy[1]]
-        error_xy = original.get_local_xy(chip)
-        ethernet = original[chip.nearest_ethernet_x, chip.nearest_ethernet_y]
+    # One pass finds whole groups of chips cut off from their board
+    not_reached, not_returned = machine.find_unreachable_chips(
+        local=True, ethernets=ethernets)
+    for xy in not_reached:
+        chip = machine[xy[0], xy[1]]
+        error_xy = machine.get_local_xy(chip)
+        ethernet = machine[chip.nearest_ethernet_x, chip.nearest_ethernet_y]
         msg = f"Your machine has unreachable incoming chips at {error_xy} " \
               f"on board {ethernet} which will cause algorithms to fail. " \
               f"Please report this to {contact_email()} \n\n"
@@ -155,10 +164,10 @@ def machine_repair(
         else:
             logger.error(msg)
             error_message += msg
-    for xy in original.unreachable_outgoing_local_chips():
-        chip = original[xy[0], xy[1]]
-        error_xy = original.get_local_xy(chip)
-        ethernet = original[chip.nearest_ethernet_x, chip.nearest_ethernet_y]
+    for xy in not_returned:
+        chip = machine[xy[0], xy[1]]
+        error_xy = machine.get_local_xy(chip)
+        ethernet = machine[chip.nearest_ethernet_x, chip.nearest_ethernet_y]
         msg = f"Your machine has unreachable outgoing chips at {error_xy} " \
               f"on board {ethernet} which will cause algorithms to fail. " \
               f"Please report this to {contact_email()} \n\n"
@@ -168,13 +177,13 @@ def machine_repair(
         else:
             logger.error(msg)
             error_message += msg
-    for (source_x, source_y, out, back) in original.one_way_links():
-        (dest_x, dest_y) = original.xy_over_link(source_x, source_y, out)
+    for (source_x, source_y, out, back) in machine.one_way_links(xys):
+        (dest_x, dest_y) = machine.xy_over_link(source_x, source_y, out)
         if (dest_x, dest_y) in removed_chips:
             dead_links.add((source_x, source_y, out, back))
         else:
             uni_direction_link_message = _generate_uni_direction_link_error(
-                dest_x, dest_y, source_x, source_y, out, back, original)
+                dest_x, dest_y, source_x, source_y, out, back, machine)
             if repair_machine:
                 dead_links.add((source_x, source_y, out, back))
                 logger.warning(uni_direction_link_message)
@@ -182,13 +191,14 @@ def machine_repair(
                 logger.error(uni_direction_link_message)
                 error_message += uni_direction_link_message
 
-    for chip in original.chips:
+    chips = machine.chips if xys is None else (machine[xy] for xy in xys)
+    for chip in chips:
         if chip.parent_link is not None:
-            parent_x, parent_y = original.xy_over_link(
+            parent_x, parent_y = machine.xy_over_link(
                 chip.x, chip.y, chip.parent_link)
-            if not original.is_chip_at(parent_x, parent_y):
-                ethernet = original[chip.nearest_ethernet_x,
-                                    chip.nearest_ethernet_y]
+            if not machine.is_chip_at(parent_x, parent_y):
+                ethernet = machine[chip.nearest_ethernet_x,
+                                   chip.nearest_ethernet_y]
                 msg = f"The source: {Chip} will fail to receive signals " \
                       f"because its parent {parent_x}:{parent_y} in the " \
                       f"signal tree has disappeared from the machine since " \
@@ -204,9 +214,39 @@ def machine_repair(
 
     if not repair_machine and error_message != "":
         raise SpinnMachineException(error_message)
+    return dead_chips, dead_links
 
-    if not dead_chips and not dead_links:
-        return original
 
-    new_machine = _machine_ignore(original, dead_chips, dead_links)
-    return machine_repair(new_machine)
+def machine_repair(
+        original: Machine, removed_chips: Iterable[XY] = ()) -> Machine:
+    """
+    Remove chips that can't be reached or that can't reach other chips
+    due to missing links.
+
+    Also remove any one way links.
+
+    :param original: the original machine
+    :param removed_chips: List of chips (x and y coordinates) that have been
+        removed while the machine was being created.
+        One-way links to these chip are expected repairs so always done and
+        never logged
+    :raises SpinnMachineException: if repair_machine is false and an unexpected
+        repair is needed.
+    :return: Either the original machine or a repaired replacement
+    """
+    repair_machine = get_config_bool("Machine", "repair_machine")
+    machine = original
+    dead_chips, dead_links = _find_dead(
+        machine, removed_chips, repair_machine)
+    while dead_chips or dead_links:
+        if machine is original:
+            # Copy once so the original is not changed
+            machine = _machine_copy(original)
+        # Only what is next to a removal can need repairing as a result
+        ethernets, neighbours = _remove_dead(machine, dead_chips, dead_links)
+        dead_chips, dead_links = _find_dead(
+            machine, (), repair_machine, ethernets, neighbours)
+
+    if machine is not original:
+        machine.validate()
+    return machine
@@ -0,0 +1,697 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple)
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+from typing_extensions import Never
+
+from spinn_utilities.typing.coords import XY
+
+from spinn_machine.data import MachineDataView
+from .chip import Chip
+from .exceptions import (
+    SpinnMachineException, SpinnMachineInvalidParameterException)
+from .machine import Machine, Path
+
+
+class MachineOverlay(object):
+    """
+    A copy-on-write view of a Machine that only records the differences.
+
+    Chips and links removed and Chips overridden are held by the overlay.
+    Chip and link queries check these first before falling back to the base
+    machine, so creating an overlay and each change costs time and memory in
+    proportion to the changes rather than the size of the machine.
+
+    The base machine must not be changed while the overlay is in use.
+
+    Geometry, such as :py:meth:`xy_over_link`, is that of the base machine.
+
+    Queries that need every chip, such as :py:meth:`shortest_path` or
+    :py:meth:`validate`, are answered by the base machine while there are
+    no changes, and otherwise by a Machine made by :py:meth:`to_machine`
+    the first time one is needed after a change.
+
+    The overlay is not a :py:class:`Machine`; use :py:meth:`to_machine`
+    where one is needed. Machine methods that add chips or boards are
+    refused as the overlay could not record them.
+    """
+
+    __slots__ = (
+        "_base", "_changed", "_machine", "_n_chips", "_removed",
+        "_total_cores", "_total_user_cores")
+
+    def __init__(self, base: Machine):
+        """
+        :param base: The machine the changes are relative to
+        """
+        self._base = base
+        self._changed: Dict[XY, Chip] = dict()
+        self._removed: Set[XY] = set()
+        self._n_chips = base.n_chips
+        self._total_cores = base.total_cores
+        self._total_user_cores = base.total_available_user_cores
+        # The full machine answering the rest of the API, if made
+        self._machine: Optional[Machine] = None
+
+    @property
+    def base(self) -> Machine:
+        """
+        The machine the changes are relative to.
+        """
+        return self._base
+
+    def _set_chip(self, xy: XY, chip: Optional[Chip]) -> None:
+        """
+        Records the chip now at xy, or `None` if there is no longer one.
+
+        :param xy: The (x, y) coordinates changed
+        :param chip: The new chip or `None` to remove the chip
+        """
+        old = self.get_chip_at(xy[0], xy[1])
+        if old is not None:
+            self._n_chips -= 1
+            self._total_cores -= old.n_processors
+            self._total_user_cores -= old.n_placable_processors
+        base_chip = self._base.get_chip_at(xy[0], xy[1])
+        self._machine = None
+        self._changed.pop(xy, None)
+        self._removed.discard(xy)
+        if chip is None:
+            if base_chip is not None:
+                self._removed.add(xy)
+            return
+        if chip is not base_chip:
+            self._changed[xy] = chip
+        self._n_chips += 1
+        self._total_cores += chip.n_processors
+        self._total_user_cores += chip.n_placable_processors
+
+    def remove_chip(self, x: int, y: int) -> Chip:
+        """
+        Remove a chip from the overlay. The base machine is not changed.
+
+        Links from other chips to the removed chip are *not* removed.
+
+        :param x: The x-coordinate of the chip to remove
+        :param y: The y-coordinate of the chip to remove
+        :return: The chip removed
+        :raise SpinnMachineInvalidParameterException:
+            If there is no chip at (x, y)
+        """
+        chip = self.get_chip_at(x, y)
+        if chip is None:
+            raise SpinnMachineInvalidParameterException(
+                "x, y", (x, y), "There is no chip there")
+        self._set_chip((x, y), None)
+        return chip
+
+    def remove_link(self, x: int, y: int, link_id: int) -> Chip:
+        """
+        Remove a link going out of a chip by overriding the chip with a copy
+        without the link. The base machine is not changed.
+
+        The link going the opposite way, if any, is *not* removed.
+
+        :param x: The x-coordinate of the chip the link goes out of
+        :param y: The y-coordinate of the chip the link goes out of
+        :param link_id: The ID of the link to remove
+        :return: The new chip without the link
+        :raise SpinnMachineInvalidParameterException:
+            If there is no chip at (x, y) or it does not have the link
+        """
+        if not self.is_link_at(x, y, link_id):
+            raise SpinnMachineInvalidParameterException(
+                "x, y, link_id", (x, y, link_id), "There is no link there")
+        chip = self[x, y].without_link(link_id)
+        self._set_chip((x, y), chip)
+        return chip
+
+    def override_chip(self, chip: Chip) -> None:
+        """
+        Replace the chip at the same (x, y), or add it if there is none.
+        The base machine is not changed.
+
+        :param chip: The chip to use from now on
+        """
+        self._set_chip((chip.x, chip.y), chip)
+
+    @property
+    def removed_xys(self) -> Set[XY]:
+        """
+        The (x, y) of chips in the base machine removed by the overlay.
+        """
+        return set(self._removed)
+
+    @property
+    def overridden_chips(self) -> Iterable[Chip]:
+        """
+        The chips that replace or add to those in the base machine.
+        """
+        return iter(self._changed.values())
+
+    def get_chip_at(self, x: int, y: int) -> Optional[Chip]:
+        """
+        Get the chip at the given x and y coordinates.
+
+        :param x: x location of the chip to be returned
+        :param y: y location of the chip to be returned
+        :return: the chip at the specified location,
+            or ``None`` if no such chip
+        """
+        xy = (x, y)
+        if xy in self._changed:
+            return self._changed[xy]
+        if xy in self._removed:
+            return None
+        return self._base.get_chip_at(x, y)
+
+    def __getitem__(self, x_y_tuple: XY) -> Chip:
+        """
+        Get the chip at the given x and y coordinates.
+
+        :param x_y_tuple: A tuple of (x, y) where:
+            * x is the x location of the chip to retrieve
+            * y is the y location of the chip to retrieve
+        :return: the chip at the specified location
+        :raise KeyError: If the chip does not exist
+        """
+        chip = self.get_chip_at(x_y_tuple[0], x_y_tuple[1])
+        if chip is None:
+            raise KeyError(x_y_tuple)
+        return chip
+
+    def is_chip_at(self, x: int, y: int) -> bool:
+        """
+        Determine if a chip exists at the given coordinates.
+
+        :param x: x location of the chip to test for existence
+        :param y: y location of the chip to test for existence
+        :return: True if the chip exists, False otherwise
+        """
+        return self.get_chip_at(x, y) is not None
+
+    def __contains__(self, x_y_tuple: XY) -> bool:
+        """
+        Determine if a chip exists at the given coordinates.
+
+        :param x_y_tuple: A tuple of (x, y) where:
+            * x is the x location of the chip to test for existence
+            * y is the y location of the chip to test for existence
+        :return: True if the chip exists, False otherwise
+        """
+        return self.is_chip_at(x_y_tuple[0], x_y_tuple[1])
+
+    def is_link_at(self, x: int, y: int, link: int) -> bool:
+        """
+        Determine if a link exists at the given coordinates.
+
+        :param x: The x location of the chip to test for a link
+        :param y: The y location of the chip to test for a link
+        :param link: The link to test the existence of
+        :return: True if the link exists, False otherwise
+        """
+        chip = self.get_chip_at(x, y)
+        return chip is not None and chip.router.is_link(link)
+
+    @property
+    def chips(self) -> Iterator[Chip]:
+        """
+        An iterable of chips in the overlay.
+
+        Chips of the base machine are in the same order with chips only in
+        the overlay after them.
+        """
+        for xy, chip in self._base:
+            if xy in self._changed:
+                yield self._changed[xy]
+            elif xy not in self._removed:
+                yield chip
+        for xy, chip in self._changed.items():
+            if xy not in self._base:
+                yield chip
+
+    @property
+    def chip_coordinates(self) -> Iterator[XY]:
+        """
+        An iterable of chip coordinates in the overlay.
+        """
+        for chip in self.chips:
+            yield chip.x, chip.y
+
+    def __iter__(self) -> Iterator[Tuple[XY, Chip]]:
+        """
+        Get an iterable of the chip coordinates and chips.
+
+        :return: An iterable of tuples of ((x, y), chip) where:
+            * (x, y) is a tuple where:
+                * x is the x-coordinate of a chip
+                * y is the y-coordinate of a chip
+            * chip is a chip
+        """
+        for chip in self.chips:
+            yield (chip.x, chip.y), chip
+
+    def __len__(self) -> int:
+        """
+        The number of chips in the overlay.
+        """
+        return self._n_chips
+
+    @property
+    def n_chips(self) -> int:
+        """
+        The number of chips in the overlay.
+        """
+        return self._n_chips
+
+    @property
+    def total_cores(self) -> int:
+        """
+        The total number of cores in the overlay, including monitors.
+        """
+        return self._total_cores
+
+    @property
+    def total_available_user_cores(self) -> int:
+        """
+        The total number of cores in the overlay which are not
+        monitor cores.
+        """
+        return self._total_user_cores
+
+    @property
+    def width(self) -> int:
+        """
+        The width of the base machine in chips.
+        """
+        return self._base.width
+
+    @property
+    def height(self) -> int:
+        """
+        The height of the base machine in chips.
+        """
+        return self._base.height
+
+    def xy_over_link(self, x: int, y: int, link: int) -> XY:
+        """
+        Get the potential (x,y) location of the chip reached over this link.
+
+        :param x: The x coordinate of a chip that may exist
+        :param y: The y coordinate of a chip that may exist
+        :param link: The link ID to traverse
+        :return: The (x, y) reached on the base machine
+        """
+        return self._base.xy_over_link(x, y, link)
+
+    def get_local_xy(self, chip: Chip) -> XY:
+        """
+        Get the chip's board-local (x,y) coordinates.
+
+        :param chip: A Chip in the overlay
+        :return: Local (x, y) coordinates.
+        """
+        return self._base.get_local_xy(chip)
+
+    def get_existing_xys_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
+        """
+        Yields the (x,y)s of actual chips on the board with this
+        Ethernet-enabled chip.
+        Including the Ethernet-enabled chip itself.
+
+        :param ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :return: Yields the (x,y)s of chips on this board.
+        """
+        for x, y in self._base.get_xys_by_ethernet(ethernet_x, ethernet_y):
+            if self.is_chip_at(x, y):
+                yield x, y
+
+    def get_chips_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> Iterable[Chip]:
+        """
+        Yields the actual chips on the board with this Ethernet-enabled chip.
+        Including the Ethernet-enabled chip itself.
+
+        :param ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :return: Yields the chips on this board.
+        """
+        for x, y in self._base.get_xys_by_ethernet(ethernet_x, ethernet_y):
+            chip = self.get_chip_at(x, y)
+            if chip is not None:
+                yield chip
+
+    def get_existing_xys_on_board(self, chip: Chip) -> Iterable[XY]:
+        """
+        Get the chips that are on the same board as the given chip.
+
+        :param chip: The chip to find other chips on the same board as
+        :return: An iterable of (x, y) coordinates of chips on the same board
+        """
+        return self.get_existing_xys_by_ethernet(
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+
+    @property
+    def ethernet_connected_chips(self) -> List[Chip]:
+        """
+        The chips in the overlay that have an Ethernet connection.
+        """
+        ethernets: List[Chip] = []
+        for chip in self._base.ethernet_connected_chips:
+            current = self.get_chip_at(chip.x, chip.y)
+            if current is not None and current.ip_address is not None:
+                ethernets.append(current)
+        for xy, chip in self._changed.items():
+            if chip.ip_address is not None:
+                base_chip = self._base.get_chip_at(xy[0], xy[1])
+                if base_chip is None or base_chip.ip_address is None:
+                    ethernets.append(chip)
+        return ethernets
+
+    @property
+    def boot_chip(self) -> Chip:
+        """
+        The chip used to boot the machine.
+        """
+        return self[0, 0]
+
+    def get_xys_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
+        """
+        Yields the potential (x,y) locations of all chips on the board
+        with this Ethernet-enabled chip, as on the base machine.
+
+        :param ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :return: Yields the (x,y)s of the potential chips on this board
+        """
+        return self._base.get_xys_by_ethernet(ethernet_x, ethernet_y)
+
+    def get_xy_cores_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> Iterable[
+                Tuple[XY, int]]:
+        """
+        Yields the potential (x,y) locations and the expected number of
+        cores of all chips on the board with this Ethernet-enabled chip,
+        as on the base machine.
+
+        :param ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :return: Yields the (x,y)s and number of cores of potential chips
+        """
+        return self._base.get_xy_cores_by_ethernet(ethernet_x, ethernet_y)
+
+    def get_down_xys_by_ethernet(
+            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
+        """
+        Yields the (x,y)s of chips that are assumed to be on the board
+        with this Ethernet-enabled chip but are not in the overlay.
+
+        :param ethernet_x:
+            The X coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :param ethernet_y:
+            The Y coordinate of a (local 0,0) legal Ethernet-enabled chip
+        :return: Yields the (x,y)s of the missing chips on this board
+        """
+        for x, y in self._base.get_xys_by_ethernet(ethernet_x, ethernet_y):
+            if not self.is_chip_at(x, y):
+                yield x, y
+
+    def get_global_xy(
+            self, local_x: int, local_y: int,
+            ethernet_x: int, ethernet_y: int) -> XY:
+        """
+        Get the global (x,y) of a board-local (x,y) on the base machine.
+
+        :param local_x: A local x coordinate
+        :param local_y: A local y coordinate
+        :param ethernet_x: The global Ethernet-enabled chip x coordinate
+        :param ethernet_y: The global Ethernet-enabled chip y coordinate
+        :return: Global (x, y) coordinates of the chip
+        """
+        return self._base.get_global_xy(
+            local_x, local_y, ethernet_x, ethernet_y)
+
+    def get_vector_length(self, source: XY, destination: XY) -> int:
+        """
+        Get the length of the shortest vector between two chips.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The distance in steps on the base machine
+        """
+        return self._base.get_vector_length(source, destination)
+
+    def get_vector(self, source: XY, destination: XY) -> Tuple[int, int, int]:
+        """
+        Get the shortest vector (x, y, z) between two chips.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The vector on the base machine
+        """
+        return self._base.get_vector(source, destination)
+
+    def get_vector_lengths(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        """
+        Get the lengths of the shortest vectors between many pairs of chips.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: Array of the N distances in steps on the base machine
+        """
+        return self._base.get_vector_lengths(sources, destinations)
+
+    def get_vectors(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        """
+        Get the shortest vectors (x, y, z) between many pairs of chips.
+
+        :param sources: N by 2 array of (x,y) coordinates of source chips
+        :param destinations:
+            N by 2 array of (x,y) coordinates of destination chips
+        :return: N by 3 array of the vectors on the base machine
+        """
+        return self._base.get_vectors(sources, destinations)
+
+    def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
+        """
+        A generator that produces coordinates for concentric rings of
+        possible chips based on the links of the chips of the base machine.
+
+        :param radius: The radius of rings to produce (0 = start only)
+        :param start: The start coordinate
+        :return: Yields the (x, y) coordinates of the rings
+        """
+        return self._base.concentric_xys(radius, start)
+
+    @property
+    def wrap(self) -> str:
+        """
+        A short string representing the type of wrap of the base machine.
+        """
+        return self._base.wrap
+
+    def _full_machine(self) -> Machine:
+        """
+        Get a Machine with the chips of the overlay to answer queries that
+        need every chip.
+
+        This is the base machine while there are no changes, otherwise a
+        machine made by :py:meth:`to_machine` and kept until the next change.
+        It must only be read from.
+
+        :return: A machine with the same chips as the overlay
+        """
+        if not self._changed and not self._removed:
+            return self._base
+        if self._machine is None:
+            self._machine = self.to_machine()
+        return self._machine
+
+    def get_ethernet_chip_by_ip(self, ip_address: str) -> Optional[Chip]:
+        """
+        Get the Ethernet-enabled chip with the given IP address.
+
+        :param ip_address: The IP address of the chip
+        :return: The chip, or None if no such chip
+        """
+        return self._full_machine().get_ethernet_chip_by_ip(ip_address)
+
+    def where_is_xy(self, x: int, y: int) -> str:
+        """
+        Returns global and local location for this chip.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :return: A human-readable description of the location of a chip.
+        """
+        return self._full_machine().where_is_xy(x, y)
+
+    def chips_within(self, radius: int, start: XY,
+                     by_ring: bool = True) -> NDArray[numpy.int32]:
+        """
+        Get the chips of the overlay no more than radius links from start.
+
+        :param radius: The most links to follow
+        :param start: The (x, y) coordinates to start from
+        :param by_ring: If True the chips are ordered by distance
+        :return: N by 2 array of the (x, y) coordinates of the chips
+        """
+        return self._full_machine().chips_within(radius, start, by_ring)
+
+    def validate(self, collect_all: bool = False) -> None:
+        """
+        Validates the chips of the overlay as :py:meth:`Machine.validate`.
+
+        :param collect_all: If True report every problem found at once
+        :raise SpinnMachineException: If anything is not valid
+        """
+        self._full_machine().validate(collect_all)
+
+    def fingerprint(self) -> str:
+        """
+        A digest of the overlay as :py:meth:`Machine.fingerprint`, so the
+        same as that of a Machine with the same chips.
+
+        :return: A hex digest that is the same in any run and any process
+        """
+        return self._full_machine().fingerprint()
+
+    def summary_string(self) -> str:
+        """
+        Gets a summary of the overlay as :py:meth:`Machine.summary_string`.
+
+        :return: A String describing the overlay
+        """
+        return self._full_machine().summary_string()
+
+    def one_way_links(self, xys: Optional[Iterable[XY]] = None
+                      ) -> Iterable[Tuple[int, int, int, int]]:
+        """
+        Links with no link going the opposite way.
+
+        :param xys: The (x, y) of the chips to check or None for all chips
+        :return: The x, y, link ID and opposite link ID of each
+        """
+        return self._full_machine().one_way_links(xys)
+
+    def shortest_path(
+            self, source: XY, destination: XY) -> Optional[Path]:
+        """
+        Finds a shortest path between two chips using only the chips and
+        links of the overlay.
+
+        :param source: (x,y) coordinates of the source chip
+        :param destination: (x,y) coordinates of the destination chip
+        :return: The links to follow in order and the number of hops,
+            or None if there is no path.
+        """
+        return self._full_machine().shortest_path(source, destination)
+
+    def shortest_paths(
+            self, pairs: Iterable[Tuple[XY, XY]]) -> List[Optional[Path]]:
+        """
+        Finds shortest paths between many pairs of chips using only the chips
+        and links of the overlay.
+
+        :param pairs: The (source, destination) (x,y) coordinates to find
+        :return: For each pair in order, the links to follow and the number of
+            hops, or None if there is no path.
+        """
+        return self._full_machine().shortest_paths(pairs)
+
+    def _not_supported(self, name: str) -> Never:
+        """
+        Refuses a change the overlay can not record.
+
+        :param name: The name of the method called
+        :raise SpinnMachineException: Always
+        """
+        raise SpinnMachineException(
+            f"A MachineOverlay does not support {name}; "
+            "use override_chip to add or replace a chip")
+
+    def add_chip(self, chip: Chip) -> None:
+        """
+        Not supported; use :py:meth:`override_chip`.
+
+        :param chip: The chip that would have been added
+        :raise SpinnMachineException: Always
+        """
+        self._not_supported("add_chip")
+
+    def add_chips(self, chips: Iterable[Chip]) -> None:
+        """
+        Not supported; use :py:meth:`override_chip` for each chip.
+
+        :param chips: The chips that would have been added
+        :raise SpinnMachineException: Always
+        """
+        self._not_supported("add_chips")
+
+    def add_lazy_board(
+            self, ethernet_x: int, ethernet_y: int, xys: Iterable[XY],
+            n_cores: int, n_placable_cores: int,
+            build: Callable[[], Iterable[Chip]]) -> None:
+        """
+        Not supported; use :py:meth:`override_chip` for each chip.
+
+        :param ethernet_x: The x of the Ethernet chip of the board
+        :param ethernet_y: The y of the Ethernet chip of the board
+        :param xys: The (x, y)s of the chips of the board
+        :param n_cores: The total number of cores of the chips
+        :param n_placable_cores: The number of placeable cores of the chips
+        :param build: The function that would have built the chips
+        :raise SpinnMachineException: Always
+        """
+        self._not_supported("add_lazy_board")
+
+    def build_vector_table(self) -> None:
+        """
+        Not supported; build the table on the base machine instead.
+
+        :raise SpinnMachineException: Always
+        """
+        self._not_supported("build_vector_table")
+
+    def to_machine(self, origin: str = "Overlay") -> Machine:
+        """
+        Create a full Machine with the chips in the overlay.
+
+        :param origin: Extra information about how this machine was created
+        :return: A new machine of the same size as the base machine
+        """
+        machine = MachineDataView.get_machine_version().create_machine(
+            self._base.width, self._base.height, origin)
+        machine.add_chips(self.chips)
+        return machine
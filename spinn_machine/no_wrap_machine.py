@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from typing import Iterable, Tuple
+import numpy
+from numpy.typing import ArrayLike, NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
 from .machine import Machine
@@ -41,14 +43,6 @@ class NoWrapMachine(Machine):
             # if Ethernet_x/y != 0 GIGO mode so ignore Ethernet
             yield ((x + ethernet_x, y + ethernet_y), n_cores)
 
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(
-            self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
-        for (x, y) in self._chip_core_map:
-            chip_xy = (x + ethernet_x, y + ethernet_y)
-            if chip_xy in self._chips:
-                yield chip_xy
-
     @overrides(Machine.get_down_xys_by_ethernet)
     def get_down_xys_by_ethernet(
             self, ethernet_x: int, ethernet_y: int) -> Iterable[XY]:
@@ -125,6 +119,20 @@ class NoWrapMachine(Machine):
         return self._minimize_vector(
             destination[0]-source[0], destination[1]-source[1])
 
+    @overrides(Machine.get_vector_lengths)
+    def get_vector_lengths(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        x, y = self._deltas(sources, destinations)
+        return self._vector_lengths(x, y)
+
+    @overrides(Machine.get_vectors)
+    def get_vectors(
+            self, sources: ArrayLike,
+            destinations: ArrayLike) -> NDArray[numpy.integer]:
+        x, y = self._deltas(sources, destinations)
+        return self._minimize_vectors(x, y)
+
     @overrides(Machine.concentric_xys)
     def concentric_xys(self, radius: int, start: XY) -> Iterable[XY]:
         # Aliases for convenience
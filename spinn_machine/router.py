@@ -15,12 +15,14 @@ from __future__ import annotations
 from typing import (
     Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING)
 
+from spinn_utilities.typing.coords import XY
+
 from spinn_machine.data import MachineDataView
 
 from .exceptions import (
     SpinnMachineAlreadyExistsException, SpinnMachineInvalidParameterException)
+from .link import Link
 if TYPE_CHECKING:
-    from .link import Link
     from .multicast_routing_entry import MulticastRoutingEntry
     from .routing_entry import RoutingEntry
 
@@ -33,6 +35,11 @@ class Router(object):
 
         * ``source_link_id`` is the ID of a link
         * ``link`` is the :py:class:`Link` with ID ``source_link_id``
+
+    The links are held as a tuple of their IDs, shared by all routers with
+    the same links, and a flat tuple of the source and destination
+    coordinates of each, with the :py:class:`Link` objects created when
+    asked for. Iterating gives the links in the order they were added.
     """
 
     # The maximum number of links/directions a router can handle
@@ -41,7 +48,10 @@ class Router(object):
     # Number to add or sub from a link to get its opposite
     LINK_OPPOSITE = 3
 
-    __slots__ = ("_links", "_n_available_multicast_entries")
+    # The number of values held in _ends for each link
+    _N_END_VALUES = 4
+
+    __slots__ = ("_ends", "_link_ids", "_n_available_multicast_entries")
 
     def __init__(
             self, links: Iterable[Link],
@@ -53,12 +63,61 @@ class Router(object):
         :raise ~spinn_machine.exceptions.SpinnMachineAlreadyExistsException:
             If any two links have the same ``source_link_id``
         """
-        self._links: Dict[int, Link] = dict()
+        link_ids: List[int] = []
+        # source_x, source_y, destination_x, destination_y for each link
+        # in the order the links are given
+        ends: List[int] = []
         for link in links:
-            self.add_link(link)
+            if link.source_link_id in link_ids:
+                raise SpinnMachineAlreadyExistsException(
+                    "link", str(link.source_link_id))
+            link_ids.append(link.source_link_id)
+            ends += (link.source_x, link.source_y,
+                     link.destination_x, link.destination_y)
+        self._link_ids = _shared_link_ids(tuple(link_ids))
+        self._ends = tuple(ends)
 
         self._n_available_multicast_entries = n_available_multicast_entries
 
+    @classmethod
+    def from_link_ends(
+            cls, link_ids: Tuple[int, ...], ends: Tuple[int, ...],
+            n_available_multicast_entries: int) -> Router:
+        """
+        Creates a router from the values it holds,
+        without creating or checking :py:class:`Link` objects.
+
+        :param link_ids: The IDs of the links in the order they are held,
+            such as from :py:meth:`link_ids_in_mask`
+        :param ends: The source x and y and destination x and y of each
+            link, one after the other in the order of the link IDs
+        :param n_available_multicast_entries:
+            The number of entries available in the routing table
+        :return: A new router
+        """
+        router = cls.__new__(cls)
+        router.__setstate__((link_ids, ends, n_available_multicast_entries))
+        return router
+
+    @staticmethod
+    def link_ids_in_mask(link_mask: int) -> Tuple[int, ...]:
+        """
+        Gets the IDs of the links in a bit mask, as :py:attr:`link_mask`.
+
+        :param link_mask: The bit mask of link IDs
+        :return: The link IDs in the mask in order of link ID
+        """
+        return _MASK_LINK_IDS[link_mask]
+
+    def _offset(self, source_link_id: int) -> int:
+        """
+        Gets where the values of a link start in the ends tuple.
+
+        :param source_link_id: The ID of the link, which must exist
+        :return: The index into the ends of the first value of the link
+        """
+        return self._link_ids.index(source_link_id) * self._N_END_VALUES
+
     def add_link(self, link: Link) -> None:
         """
         Add a link to the router of the chip.
@@ -67,10 +126,34 @@ class Router(object):
         :raise ~spinn_machine.exceptions.SpinnMachineAlreadyExistsException:
             If another link already exists with the same ``source_link_id``
         """
-        if link.source_link_id in self._links:
+        if self.is_link(link.source_link_id):
             raise SpinnMachineAlreadyExistsException(
                 "link", str(link.source_link_id))
-        self._links[link.source_link_id] = link
+        self._link_ids = _shared_link_ids(
+            self._link_ids + (link.source_link_id, ))
+        self._ends += (link.source_x, link.source_y,
+                       link.destination_x, link.destination_y)
+
+    def without_link(self, source_link_id: int) -> Router:
+        """
+        Creates a copy of this router that does not have the link,
+        without creating any :py:class:`Link` objects.
+
+        This router is not changed.
+
+        :param source_link_id: The ID of the link to leave out
+        :return: A new router with all the same values except for the link
+        """
+        if not self.is_link(source_link_id):
+            return self.from_link_ends(
+                self._link_ids, self._ends,
+                self._n_available_multicast_entries)
+        index = self._link_ids.index(source_link_id)
+        offset = index * self._N_END_VALUES
+        return self.from_link_ends(
+            self._link_ids[:index] + self._link_ids[index + 1:],
+            self._ends[:offset] + self._ends[offset + self._N_END_VALUES:],
+            self._n_available_multicast_entries)
 
     def is_link(self, source_link_id: int) -> bool:
         """
@@ -80,7 +163,7 @@ class Router(object):
         :param source_link_id: The ID of the link to find
         :return: True if there is a link with the given ID, False otherwise
         """
-        return source_link_id in self._links
+        return source_link_id in self._link_ids
 
     def __contains__(self, source_link_id: int) -> bool:
         """
@@ -96,7 +179,13 @@ class Router(object):
         :param source_link_id: The ID of the link to find
         :return: The link, or ``None`` if no such link
         """
-        return self._links.get(source_link_id)
+        if not self.is_link(source_link_id):
+            return None
+        offset = self._offset(source_link_id)
+        (source_x, source_y, destination_x, destination_y) = \
+            self._ends[offset:offset + self._N_END_VALUES]
+        return Link(
+            source_x, source_y, source_link_id, destination_x, destination_y)
 
     def __getitem__(self, source_link_id: int) -> Optional[Link]:
         """
@@ -104,12 +193,55 @@ class Router(object):
         """
         return self.get_link(source_link_id)
 
+    def get_destination(self, source_link_id: int) -> Optional[XY]:
+        """
+        Get the (x, y) the link with the given ID goes to,
+        without creating a :py:class:`Link`.
+
+        :param source_link_id: The ID of the link to find
+        :return: The destination coordinates, or ``None`` if no such link
+        """
+        if not self.is_link(source_link_id):
+            return None
+        offset = self._offset(source_link_id) + 2
+        return (self._ends[offset], self._ends[offset + 1])
+
+    @property
+    def link_mask(self) -> int:
+        """
+        The IDs of the available links as a bit mask,
+        with bit ``n`` set if there is a link with ID ``n``.
+
+        Only links with IDs from 0 to
+        :py:const:`MAX_LINKS_PER_ROUTER` - 1 are in the mask.
+        """
+        mask = 0
+        for link_id in self._link_ids:
+            if 0 <= link_id < self.MAX_LINKS_PER_ROUTER:
+                mask |= 1 << link_id
+        return mask
+
+    def destinations(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Get the destination of each link in the router,
+        without creating :py:class:`Link` objects.
+
+        :return: An iterable of ``(source_link_id, x, y)``
+        """
+        ends = self._ends
+        for offset, link_id in zip(
+                range(2, len(ends), self._N_END_VALUES), self._link_ids):
+            yield (link_id, ends[offset], ends[offset + 1])
+
     @property
     def links(self) -> Iterator[Link]:
         """
         The available links of this router.
+
+        Each :py:class:`Link` is created as it is asked for so where only
+        the destinations are needed :py:meth:`destinations` is faster.
         """
-        return iter(self._links.values())
+        return (link for _, link in self)
 
     def __iter__(self) -> Iterator[Tuple[int, Link]]:
         """
@@ -119,7 +251,12 @@ class Router(object):
             * ``source_link_id`` is the ID of the link
             * ``link`` is a router link
         """
-        return iter(self._links.items())
+        ends = self._ends
+        for offset, link_id in zip(
+                range(0, len(ends), self._N_END_VALUES), self._link_ids):
+            yield (link_id, Link(
+                ends[offset], ends[offset + 1], link_id,
+                ends[offset + 2], ends[offset + 3]))
 
     def __len__(self) -> int:
         """
@@ -127,7 +264,16 @@ class Router(object):
 
         :return: The length of the underlying iterable
         """
-        return len(self._links)
+        return len(self._link_ids)
+
+    def __getstate__(self) -> Tuple[Tuple[int, ...], Tuple[int, ...], int]:
+        return (self._link_ids, self._ends,
+                self._n_available_multicast_entries)
+
+    def __setstate__(
+            self, state: Tuple[Tuple[int, ...], Tuple[int, ...], int]) -> None:
+        (link_ids, self._ends, self._n_available_multicast_entries) = state
+        self._link_ids = _shared_link_ids(link_ids)
 
     @property
     def n_available_multicast_entries(self) -> int:
@@ -198,7 +344,7 @@ class Router(object):
         return (
             f"[Router: "
             f"available_entries={self._n_available_multicast_entries}, "
-            f"links={list(self._links.values())}]")
+            f"links={list(self.links)}]")
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -216,3 +362,26 @@ class Router(object):
         """
         # Mod is faster than if
         return (link_id + Router.LINK_OPPOSITE) % Router.MAX_LINKS_PER_ROUTER
+
+
+#: The one copy of each tuple of link IDs held by any router
+_LINK_IDS: Dict[Tuple[int, ...], Tuple[int, ...]] = dict()
+
+
+def _shared_link_ids(link_ids: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Gets the one shared copy of a tuple of link IDs,
+    so routers with the same links do not each hold their own.
+
+    :param link_ids: The link IDs in the order held by a router
+    :return: An equal tuple, which is the same object for equal tuples
+    """
+    return _LINK_IDS.setdefault(link_ids, link_ids)
+
+
+#: The link IDs in each possible link mask, in order of link ID
+_MASK_LINK_IDS = tuple(
+    _shared_link_ids(tuple(
+        link_id for link_id in range(Router.MAX_LINKS_PER_ROUTER)
+        if mask & (1 << link_id)))
+    for mask in range(1 << Router.MAX_LINKS_PER_ROUTER))
@@ -0,0 +1,381 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+import gc
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import struct
+import sys
+from types import TracebackType
+from typing import (
+    Any, Callable, Dict, List, Optional, Tuple, Type, TYPE_CHECKING)
+import weakref
+
+import numpy
+from numpy.typing import NDArray
+
+from .exceptions import SpinnMachineException
+from .machine_columns import ChipColumns, ChipValues
+from .machine_overlay import MachineOverlay
+
+if TYPE_CHECKING:
+    from .machine import Machine
+
+# Before Python 3.13 attaching to shared memory always registers it with
+# the resource tracker, to be removed when the tracker ends
+_ATTACH_REGISTERS = sys.version_info < (3, 13) and os.name == "posix"
+
+# The header is the length of the pickled description that follows it
+_HEADER = struct.Struct("<Q")
+# Arrays start on a multiple of this many bytes
+_ALIGN = 8
+
+# Where each array is in the shared memory as (dtype, shape, offset)
+_Layout = Dict[str, Tuple[str, Tuple[int, ...], int]]
+
+# The open shared machines this process has made or attached to by name,
+# so attaching again in a process gives the same mapping
+_SHARED: Dict[str, SharedMachine] = dict()
+
+
+def _aligned(n_bytes: int) -> int:
+    """
+    Rounds a number of bytes up to the alignment of the arrays.
+
+    :param n_bytes: The number of bytes
+    :return: The smallest multiple of the alignment not below n_bytes
+    """
+    return -(-n_bytes // _ALIGN) * _ALIGN
+
+
+class SharedMachine(object):
+    """
+    A machine published in :py:mod:`multiprocessing.shared_memory` as
+    columns of chip values, link masks and the neighbour table, so many
+    processes can read one copy of them.
+
+    Only the :py:attr:`columns` and the :py:attr:`neighbours` are shared,
+    as chips are Python objects.
+    :py:meth:`view` gives a read-only view of the machine whose chips are
+    built straight from the shared memory when first used, while
+    :py:meth:`copy_machine` makes a private machine that can be changed.
+
+    Pickling a shared machine only sends the name of the shared memory,
+    so it can be passed to pool workers cheaply.
+    Unpickling it attaches to the shared memory, once per process.
+
+    Each process should :py:meth:`close` the shared machine when done with
+    it. The process that made it owns the shared memory, and closing it
+    there also stops other processes attaching.
+    """
+
+    __slots__ = (
+        "_columns", "_layout", "_machine", "_memory", "_neighbours",
+        "_owner", "_rebuild", "_roots", "_start", "_values")
+
+    def __init__(self, memory: SharedMemory, owner: bool):
+        """
+        Use :py:func:`share_machine` or :py:func:`attach_shared_machine`
+        rather than this.
+
+        :param memory: The shared memory the machine is in
+        :param owner: Whether this process made the shared memory
+        """
+        self._memory = memory
+        self._owner = owner
+        buffer = memory.buf
+        assert buffer is not None
+        (length, ) = _HEADER.unpack_from(buffer)
+        description = pickle.loads(
+            bytes(buffer[_HEADER.size:_HEADER.size + length]))
+        del buffer
+        self._rebuild: Tuple[Any, ...] = description[0]
+        self._values: List[ChipValues] = description[1]
+        self._layout: _Layout = description[2]
+        self._start = _aligned(_HEADER.size + length)
+        # The view of this process, once asked for
+        self._machine: Optional[Machine] = None
+        self._columns: Optional[ChipColumns] = None
+        self._neighbours: Optional[NDArray[numpy.int32]] = None
+        self._roots: List[weakref.ref[NDArray]] = []
+        self._map_arrays()
+
+    def _map_arrays(self) -> None:
+        """
+        Makes the read-only arrays of the columns and neighbours over the
+        shared memory.
+
+        Each array is a view of a flat root array, as is any view made of
+        it, so the memory is in use while any of the roots are alive.
+        """
+        buffer = self._memory.buf
+        assert buffer is not None
+        arrays: Dict[str, NDArray] = dict()
+        # Roots of earlier arrays still in use are kept track of too
+        self._roots = [root for root in self._roots if root() is not None]
+        for key, (dtype, shape, offset) in self._layout.items():
+            root: NDArray = numpy.frombuffer(
+                buffer, dtype=dtype, count=int(numpy.prod(shape)),
+                offset=self._start + offset)
+            root.flags.writeable = False
+            self._roots.append(weakref.ref(root))
+            arrays[key] = root.reshape(shape)
+        self._columns = ChipColumns(
+            xys=arrays["xys"], value_indexes=arrays["value_indexes"],
+            values=self._values, link_masks=arrays["link_masks"],
+            odd_links=arrays["odd_links"])
+        self._neighbours = arrays["neighbours"]
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory holding the machine.
+        """
+        return self._memory.name
+
+    @property
+    def columns(self) -> ChipColumns:
+        """
+        The chips of the machine as read-only columns in the shared memory.
+
+        :raises SpinnMachineException: If the shared machine is closed
+        """
+        if self._columns is None:
+            raise SpinnMachineException(f"{self} is closed")
+        return self._columns
+
+    @property
+    def neighbours(self) -> NDArray[numpy.int32]:
+        """
+        The read-only neighbour table of the machine in the shared memory.
+
+        This is :py:attr:`MachineArrays.neighbours` of the machine shared,
+        so is indexed by the position of each chip in the
+        :py:attr:`columns`, not by :py:meth:`Machine.chip_index`.
+
+        :raises SpinnMachineException: If the shared machine is closed
+        """
+        if self._neighbours is None:
+            raise SpinnMachineException(f"{self} is closed")
+        return self._neighbours
+
+    def view(self) -> MachineOverlay:
+        """
+        Gets a read-only view of the shared machine in this process.
+
+        Attaching is quick as the columns are not copied; the chips of each
+        board are built straight from the shared memory the first time
+        they are used, and are shared by all the views in this process.
+        The machine behind the views is never changed, so removing chips
+        or links from a view only changes that view, and adding chips is
+        refused.
+        The views can still be used after the shared machine is closed,
+        as closing builds any boards not yet built.
+
+        :return: A new view of the machine
+        :raises SpinnMachineException: If the shared machine is closed
+        """
+        if self._machine is None:
+            rebuild, args = self._rebuild
+            self._machine = rebuild(*args, self.columns, True)
+        return MachineOverlay(self._machine)
+
+    def copy_machine(self) -> Machine:
+        """
+        Creates a private copy of the shared machine in this process.
+
+        The columns are copied out of the shared memory and each board is
+        added as a lazy board, so creating the machine is quick and only
+        the boards used are built.
+        Changing the machine does not change the shared memory or the
+        machines of other processes, and it can still be used after the
+        shared machine is closed.
+
+        :return: A new machine with the same chips as the one shared
+        :raises SpinnMachineException: If the shared machine is closed
+        """
+        columns = self.columns
+        rebuild, args = self._rebuild
+        machine: Machine = rebuild(*args, ChipColumns(
+            xys=columns.xys.copy(),
+            value_indexes=columns.value_indexes.copy(),
+            values=columns.values, link_masks=columns.link_masks.copy(),
+            odd_links=columns.odd_links.copy()), True)
+        return machine
+
+    def close(self) -> None:
+        """
+        Unmaps the shared memory from this process, and if this process
+        made it, removes it so no more processes can attach.
+
+        The memory is freed once every process that attached has closed it
+        or ended. Machines from :py:meth:`view` and :py:meth:`copy_machine`
+        can be used after this.
+        Closing again does nothing.
+
+        :raises SpinnMachineException:
+            If any arrays from the :py:attr:`columns` or
+            :py:attr:`neighbours`, or views of them, are still in use.
+            The shared machine is left open.
+        """
+        if self._columns is None:
+            return
+        if self._machine is not None:
+            # The view machine must not need the memory once it is closed
+            # pylint: disable=protected-access
+            self._machine._build_all_lazy()
+            self._machine = None
+        # Unmapping memory that arrays still use would crash when they are
+        # next used, so they must all have gone
+        self._columns = None
+        self._neighbours = None
+        if self._in_use():
+            # Arrays may only be held by reference cycles
+            gc.collect()
+            if self._in_use():
+                self._map_arrays()
+                raise SpinnMachineException(
+                    f"{self} can not be closed while arrays of its columns "
+                    "or neighbours are still in use")
+        self._memory.close()
+        if _SHARED.get(self.name) is self:
+            del _SHARED[self.name]
+        if self._owner:
+            self._owner = False
+            if _ATTACH_REGISTERS:
+                # A process attaching may have taken back the registration
+                # of the memory if it shares this resource tracker,
+                # so it is made again for unlink to take back
+                resource_tracker.register(
+                    _tracker_name(self._memory), "shared_memory")
+            self._memory.unlink()
+
+    def _in_use(self) -> bool:
+        """
+        Whether any arrays over the shared memory are still in use.
+
+        :return: True if any of the root arrays are still alive
+        """
+        return any(root() is not None for root in self._roots)
+
+    def __enter__(self) -> SharedMachine:
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None:
+        self.close()
+
+    def __reduce__(self) -> Tuple[Callable[[str], SharedMachine], Tuple[str]]:
+        return (attach_shared_machine, (self.name, ))
+
+    def __str__(self) -> str:
+        return f"[SharedMachine: name={self.name}]"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def share_machine(machine: Machine) -> SharedMachine:
+    """
+    Copies a machine into a new block of shared memory.
+
+    Any lazy boards of the machine are built first.
+
+    :param machine: The machine to share
+    :return: The shared machine, owned by this process
+    """
+    rebuild, args = machine.__reduce__()
+    columns = args[-1]
+    assert isinstance(columns, ChipColumns)
+    arrays: Dict[str, NDArray] = {
+        "xys": columns.xys, "value_indexes": columns.value_indexes,
+        "link_masks": columns.link_masks, "odd_links": columns.odd_links,
+        "neighbours": machine.arrays.neighbours}
+
+    # Offsets are from the first aligned byte after the description
+    layout: _Layout = dict()
+    size = 0
+    for key, array in arrays.items():
+        layout[key] = (array.dtype.str, array.shape, size)
+        size += _aligned(array.nbytes)
+    description = pickle.dumps(
+        ((rebuild, args[:-1]), columns.values, layout))
+    start = _aligned(_HEADER.size + len(description))
+
+    memory = SharedMemory(create=True, size=start + size)
+    buffer = memory.buf
+    assert buffer is not None
+    _HEADER.pack_into(buffer, 0, len(description))
+    buffer[_HEADER.size:_HEADER.size + len(description)] = description
+    for key, array in arrays.items():
+        dtype, shape, offset = layout[key]
+        numpy.ndarray(shape, dtype=dtype, buffer=buffer,
+                      offset=start + offset)[...] = array
+    del buffer
+    shared = SharedMachine(memory, owner=True)
+    _SHARED[shared.name] = shared
+    return shared
+
+
+def attach_shared_machine(name: str) -> SharedMachine:
+    """
+    Attaches to a machine shared by :py:func:`share_machine`,
+    possibly in another process.
+
+    Attaching again to the same name in a process returns the same object.
+
+    :param name: The :py:attr:`SharedMachine.name` of the shared machine
+    :return: The shared machine
+    """
+    shared = _SHARED.get(name)
+    if shared is None:
+        memory = _attach_memory(name)
+        shared = SharedMachine(memory, owner=False)
+        _SHARED[name] = shared
+    return shared
+
+
+def _attach_memory(name: str) -> SharedMemory:
+    """
+    Attaches to existing shared memory without this process taking
+    responsibility for removing it.
+
+    :param name: The name of the shared memory
+    :return: The shared memory
+    """
+    if not _ATTACH_REGISTERS:
+        if sys.version_info >= (3, 13):
+            kwargs: Dict[str, Any] = {"track": False}
+            return SharedMemory(name=name, **kwargs)
+        return SharedMemory(name=name)
+    # Fallback for Python before 3.13, where attaching always registers
+    # the memory with the resource tracker, which would remove it when
+    # this process ends; the registration is taken back straight away.
+    memory = SharedMemory(name=name)
+    resource_tracker.unregister(_tracker_name(memory), "shared_memory")
+    return memory
+
+
+def _tracker_name(memory: SharedMemory) -> str:
+    """
+    Gets the name the resource tracker knows shared memory by before
+    Python 3.13, which on POSIX is the name with a leading slash.
+
+    :param memory: The shared memory
+    :return: The name as registered with the resource tracker
+    """
+    return "/" + memory.name
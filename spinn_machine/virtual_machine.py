@@ -13,8 +13,14 @@
 # limitations under the License.
 import math
 from collections import defaultdict
+from functools import partial
+from operator import itemgetter
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Callable, Dict, List, NamedTuple, Sequence, Set, Tuple, Union)
+
+import numpy
+from numpy.typing import NDArray
 
 from spinn_utilities.config_holder import (
     get_config_int, get_config_int_or_none, get_config_str_or_none,
@@ -25,15 +31,43 @@ from spinn_utilities.typing.coords import XY
 from spinn_machine.data import MachineDataView
 from spinn_machine.ignores import IgnoreChip, IgnoreCore, IgnoreLink
 from .chip import Chip
-from .exceptions import SpinnMachineException
+from .exceptions import (
+    SpinnMachineException, SpinnMachineInvalidParameterException)
 from .json_machine import machine_from_json
 from .router import Router
-from .link import Link
 from .machine import Machine
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
+class _VirtualChips(NamedTuple):
+    """
+    The chips of a virtual machine worked out before they are created,
+    with one entry per chip.
+    """
+    #: The x of each chip
+    x: NDArray[numpy.int32]
+    #: The y of each chip
+    y: NDArray[numpy.int32]
+    #: The index of the board of each chip in the potential Ethernet chips
+    board: NDArray[numpy.int32]
+    #: The x of the Ethernet chip of the board of each chip
+    ethernet_x: NDArray[numpy.int32]
+    #: The y of the Ethernet chip of the board of each chip
+    ethernet_y: NDArray[numpy.int32]
+    #: Whether each chip is an Ethernet chip
+    is_ethernet: NDArray[numpy.bool_]
+    #: The number of cores of each chip
+    n_cores: NDArray[numpy.int32]
+    #: The number of placeable cores of each chip that are not down
+    n_placable: NDArray[numpy.int32]
+    #: The IDs of the links of each chip as a bit mask
+    link_masks: NDArray[numpy.uint8]
+    #: The source x and y and destination x and y of each possible link of
+    #: each chip, one after the other in order of link ID
+    link_ends: NDArray[numpy.int32]
+
+
 def virtual_machine_generator() -> Machine:
     """
     Generates a virtual machine with given dimensions and configuration.
@@ -80,28 +114,37 @@ def virtual_machine_generator() -> Machine:
     return machine
 
 
-def virtual_machine(width: int, height: int, validate: bool = True) -> Machine:
+def virtual_machine(width: int, height: int, validate: bool = True,
+                    lazy: bool = False) -> Machine:
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
     :param width: the width of the virtual machine in chips
     :param height: the height of the virtual machine in chips
     :param validate: if True will call the machine validate function
+    :param lazy: if True the chips of each board are only built when
+        first needed; see :py:meth:`Machine.add_lazy_board`.
+        Validating builds every chip so validate must be False.
 
     :returns: a virtual machine (that cannot execute code)
+    :raises SpinnMachineInvalidParameterException:
+        If both validate and lazy are True
     """
-    factory = _VirtualMachine(width, height, validate)
+    factory = _VirtualMachine(width, height, validate, lazy)
     return factory.machine
 
 
 def virtual_machine_by_min_size(
-        width: int, height: int, validate: bool = True) -> Machine:
+        width: int, height: int, validate: bool = True,
+        lazy: bool = False) -> Machine:
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
     :param width: the minimum width of the virtual machine in chips
     :param height: the minimum height of the virtual machine in chips
     :param validate: if True will call the machine validate function
+    :param lazy: if True the chips are only built when first needed;
+        validate must then be False
 
     :returns: a virtual machine (that cannot execute code)
     """
@@ -114,10 +157,12 @@ def virtual_machine_by_min_size(
         height = h_board * 2
     width = w_board * math.ceil(width / w_board)
     height = h_board * math.ceil(height / h_board)
-    return virtual_machine(width, height, validate)
+    return virtual_machine(width, height, validate, lazy)
 
 
-def virtual_machine_by_cores(n_cores: int, validate: bool = True) -> Machine:
+def virtual_machine_by_cores(
+        n_cores: int, validate: bool = True,
+        lazy: bool = False) -> Machine:
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
@@ -131,6 +176,8 @@ def virtual_machine_by_cores(n_cores: int, validate: bool = True) -> Machine:
 
     :param n_cores: Minimum number of user cores
     :param validate: if True will call the machine validate function
+    :param lazy: if True the chips are only built when first needed;
+        validate must then be False
 
     :returns: a virtual machine (that cannot execute code)
     :raises SpinnMachineException:
@@ -138,10 +185,12 @@ def virtual_machine_by_cores(n_cores: int, validate: bool = True) -> Machine:
     """
     version = MachineDataView.get_machine_version()
     width, height = version.size_from_n_cores(n_cores)
-    return virtual_machine(width, height, validate)
+    return virtual_machine(width, height, validate, lazy)
 
 
-def virtual_machine_by_chips(n_chips: int, validate: bool = True) -> Machine:
+def virtual_machine_by_chips(
+        n_chips: int, validate: bool = True,
+        lazy: bool = False) -> Machine:
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
@@ -155,6 +204,8 @@ def virtual_machine_by_chips(n_chips: int, validate: bool = True) -> Machine:
 
     :param n_chips: Minimum number of chips
     :param validate: if True will call the machine validate function
+    :param lazy: if True the chips are only built when first needed;
+        validate must then be False
 
     :returns: a virtual machine (that cannot execute code)
     :raises SpinnMachineException:
@@ -162,10 +213,12 @@ def virtual_machine_by_chips(n_chips: int, validate: bool = True) -> Machine:
     """
     version = MachineDataView.get_machine_version()
     width, height = version.size_from_n_chips(n_chips)
-    return virtual_machine(width, height, validate)
+    return virtual_machine(width, height, validate, lazy)
 
 
-def virtual_machine_by_boards(n_boards: int, validate: bool = True) -> Machine:
+def virtual_machine_by_boards(
+        n_boards: int, validate: bool = True,
+        lazy: bool = False) -> Machine:
     """
     Create a virtual SpiNNaker machine, used for planning execution.
 
@@ -179,6 +232,8 @@ def virtual_machine_by_boards(n_boards: int, validate: bool = True) -> Machine:
 
     :param n_boards: Minimum number of boards
     :param validate: if True will call the machine validate function
+    :param lazy: if True the chips are only built when first needed;
+        validate must then be False
 
     :returns: a virtual machine (that cannot execute code)
     :raises SpinnMachineException:
@@ -186,7 +241,7 @@ def virtual_machine_by_boards(n_boards: int, validate: bool = True) -> Machine:
     """
     version = MachineDataView.get_machine_version()
     width, height = version.size_from_n_boards(n_boards)
-    return virtual_machine(width, height, validate)
+    return virtual_machine(width, height, validate, lazy)
 
 
 class _VirtualMachine(object):
@@ -199,7 +254,8 @@ class _VirtualMachine(object):
         "_unused_links",
         "_machine",
         "_with_monitors",
-        "_n_router_entries"
+        "_n_router_entries",
+        "_sdram"
     )
 
     _4_chip_down_links = {
@@ -209,18 +265,28 @@ class _VirtualMachine(object):
 
     ORIGIN = "Virtual"
 
-    def __init__(self, width: int, height: int, validate: bool = True):
+    def __init__(self, width: int, height: int, validate: bool = True,
+                 lazy: bool = False):
         """
 
         :param width: The width of the machine excluding any virtual chips
         :param height:
             The height of the machine excluding any virtual chips
         :param validate: If True will run code to validate the machine
+        :param lazy: If True each board is only built when first needed
+        :raises SpinnMachineInvalidParameterException:
+            If both validate and lazy are True
         """
+        if validate and lazy:
+            # Validating would build every board at once
+            raise SpinnMachineInvalidParameterException(
+                "lazy", lazy, "A lazy virtual machine can not be validated; "
+                "use validate=False")
         version = MachineDataView.get_machine_version()
         version.verify_size(width, height)
         max_cores = version.max_cores_per_chip
         self._n_router_entries = version.n_router_entries
+        self._sdram = version.max_sdram_per_chip
         self._machine = version.create_machine(
             width, height, origin=self.ORIGIN)
 
@@ -241,7 +307,9 @@ class _VirtualMachine(object):
         self._unused_links: Set[Tuple[int, int, int]] = set()
         for down_link in IgnoreLink.parse_string(get_config_str_or_none(
                 "Machine", "down_links")):
-            if down_link.ip_address is None:
+            # Link IDs that can not exist have nothing to take down
+            if (down_link.ip_address is None and
+                    0 <= down_link.link < Router.MAX_LINKS_PER_ROUTER):
                 self._unused_links.add(
                     (down_link.x, down_link.y, down_link.link))
 
@@ -249,32 +317,29 @@ class _VirtualMachine(object):
             self._unused_links.update(_VirtualMachine._4_chip_down_links)
 
         ethernet_chips = version.get_potential_ethernet_chips(width, height)
-
-        # Compute list of chips that are possible based on configuration
-        # If there are no wrap arounds, and the the size is not 2 * 2,
-        # the possible chips depend on the 48 chip board's gaps
-        configured_chips: Dict[XY, Tuple[XY, int]] = dict()
-        for eth in ethernet_chips:
-            for (xy, n_cores) in self._machine.get_xy_cores_by_ethernet(
-                    *eth):
-                if xy not in unused_chips:
-                    configured_chips[xy] = (eth, min(n_cores, max_cores))
-
-        # for chip in self._unreachable_outgoing_chips:
-        #    configured_chips.remove(chip)
-        # for chip in self._unreachable_incoming_chips:
-        #    configured_chips.remove(chip)
-
         scamp_processors = list(range(0, version.n_scamp_cores))
-        for xy in configured_chips:
-            if xy in ethernet_chips:
-                x, y = xy
-                new_chip = self._create_chip(
-                    xy, scamp_processors, configured_chips, f"127.0.{x}.{y}")
+        chips = self._configured_chips(
+            ethernet_chips, version.chip_core_map, unused_chips, max_cores,
+            len(scamp_processors))
+
+        # Group the chips by board in the order each board is first seen
+        boards: Dict[int, List[int]] = dict()
+        for index, board in enumerate(chips.board.tolist()):
+            boards.setdefault(board, []).append(index)
+
+        build = partial(self._create_chips, chips, scamp_processors)
+        for board, indexes in boards.items():
+            if lazy:
+                n_placable = int(chips.n_placable[indexes].sum())
+                n_cores = n_placable + len(scamp_processors) * len(indexes)
+                xys = list(zip(
+                    chips.x[indexes].tolist(), chips.y[indexes].tolist()))
+                e_x, e_y = ethernet_chips[board]
+                self._machine.add_lazy_board(
+                    e_x, e_y, xys, n_cores, n_placable,
+                    partial(build, indexes))
             else:
-                new_chip = self._create_chip(
-                    xy, scamp_processors, configured_chips)
-            self._machine.add_chip(new_chip)
+                self._machine.add_chips(build(indexes))
 
         if validate:
             self._machine.validate()
@@ -286,39 +351,152 @@ class _VirtualMachine(object):
         """
         return self._machine
 
-    def _create_chip(self, xy: XY, scamp_processors: list[int],
-                     configured_chips: Dict[XY, Tuple[XY, int]],
-                     ip_address: Optional[str] = None) -> Chip:
-        chip_links = self._calculate_links(xy, configured_chips)
-        chip_router = Router(chip_links, self._n_router_entries)
-
-        ((eth_x, eth_y), n_cores) = configured_chips[xy]
-
-        x, y = xy
-        sdram = MachineDataView.get_machine_version().max_sdram_per_chip
-        cores = list(range(len(scamp_processors), n_cores))
-        for down_core in self._unused_cores.get(xy, []):
-            if down_core in cores:
-                cores.remove(down_core)
-        return Chip(
-            x, y, scamp_processors, cores, chip_router, sdram, eth_x, eth_y,
-            ip_address)
-
-    def _calculate_links(
-            self, xy: XY, configured_chips: Dict[XY, Tuple[XY, int]]
-            ) -> List[Link]:
+    def _configured_chips(
+            self, ethernet_chips: Sequence[XY], chip_core_map: Dict[XY, int],
+            unused_chips: List[XY], max_cores: int,
+            n_scamp: int) -> _VirtualChips:
+        """
+        Works out the chips and links of all the boards at once.
+
+        If there are no wrap arounds, and the size is not 2 * 2,
+        the possible chips depend on the 48 chip board's gaps.
+
+        :param ethernet_chips: The (x, y)s of the Ethernet chips
+        :param chip_core_map: The number of cores of each chip of a board
+            by its (x, y) from the Ethernet chip of the board
+        :param unused_chips: The (x, y)s of the chips that are down
+        :param max_cores: The most cores a chip may have
+        :param n_scamp: The number of scamp cores of each chip
+        :return: The chips in the order first seen going through the boards
         """
-        Calculate the links needed for a machine structure
+        # pylint: disable=protected-access
+        wrap_xys = self._machine._wrap_xys
+        eth = numpy.array(ethernet_chips, dtype=numpy.int32).reshape(-1, 2)
+        local = numpy.array(
+            list(chip_core_map), dtype=numpy.int32).reshape(-1, 2)
+        x, y = wrap_xys(
+            (eth[:, 0, None] + local[None, :, 0]).ravel(),
+            (eth[:, 1, None] + local[None, :, 1]).ravel())
+        board = numpy.repeat(
+            numpy.arange(len(eth), dtype=numpy.int32), len(local))
+        n_cores = numpy.tile(
+            numpy.array(list(chip_core_map.values()), dtype=numpy.int32),
+            len(eth))
+        up = numpy.ones(len(x), dtype=bool)
+        for (down_x, down_y) in unused_chips:
+            up &= (x != down_x) | (y != down_y)
+        x, y, board, n_cores = x[up], y[up], board[up], n_cores[up]
+
+        # A chip on more than one board is kept where first seen but
+        # belongs to the last board it is on
+        _, first, inverse = numpy.unique(
+            numpy.stack((x, y), axis=1), axis=0, return_index=True,
+            return_inverse=True)
+        last = numpy.zeros(len(first), dtype=numpy.intp)
+        numpy.maximum.at(last, inverse.ravel(), numpy.arange(len(x)))
+        order = numpy.argsort(first)
+        first, last = first[order], last[order]
+        x, y, board = x[first], y[first], board[last]
+        n_cores = numpy.minimum(n_cores[last], max_cores)
+        grid = numpy.full(
+            (x.max(initial=0) + 1, y.max(initial=0) + 1), -1,
+            dtype=numpy.intp)
+        grid[x, y] = numpy.arange(len(x))
+
+        # Each link goes to the chip given by the geometry, if there is one
+        link_masks = numpy.zeros(len(x), dtype=numpy.uint8)
+        link_ends = numpy.zeros((len(x), 6, 4), dtype=numpy.int32)
+        link_ends[:, :, 0] = x[:, None]
+        link_ends[:, :, 1] = y[:, None]
+        for link_id, (add_x, add_y) in enumerate(Machine.LINK_ADD_TABLE):
+            link_x, link_y = wrap_xys(x + add_x, y + add_y)
+            link_ends[:, link_id, 2] = link_x
+            link_ends[:, link_id, 3] = link_y
+            link_masks[_index_of(grid, link_x, link_y) >= 0] |= 1 << link_id
+        for (down_x, down_y, link_id) in self._unused_links:
+            index = int(_index_of(grid, down_x, down_y))
+            if index >= 0:
+                link_masks[index] &= 0x3F ^ (1 << link_id)
+
+        is_ethernet = numpy.zeros(len(x), dtype=bool)
+        eth_indexes = _index_of(grid, eth[:, 0], eth[:, 1])
+        is_ethernet[eth_indexes[eth_indexes >= 0]] = True
+        n_placable = n_cores - n_scamp
+        for (core_x, core_y), down_cores in self._unused_cores.items():
+            index = int(_index_of(grid, core_x, core_y))
+            if index >= 0:
+                n_placable[index] -= len(down_cores.intersection(
+                    range(n_scamp, int(n_cores[index]))))
+        return _VirtualChips(
+            x=x, y=y, board=board, ethernet_x=eth[board, 0],
+            ethernet_y=eth[board, 1], is_ethernet=is_ethernet,
+            n_cores=n_cores, n_placable=n_placable, link_masks=link_masks,
+            link_ends=link_ends.reshape(len(x), -1))
+
+    def _create_chips(
+            self, chips: _VirtualChips, scamp_processors: List[int],
+            indexes: List[int]) -> List[Chip]:
+        """
+        Creates some of the chips worked out by :py:meth:`_configured_chips`.
+
+        :param chips: The chips of the machine
+        :param scamp_processors: The IDs of the scamp processors
+        :param indexes: The indexes of the chips to create
+        :return: The chips in the order of the indexes
         """
-        x, y = xy
-        links = list()
-        for link_id in range(6):
-            if (x, y, link_id) not in self._unused_links:
-                link_x_y = self._machine.xy_over_link(x, y, link_id)
-                if link_x_y in configured_chips:
-                    links.append(
-                        Link(source_x=x, source_y=y,
-                             destination_x=link_x_y[0],
-                             destination_y=link_x_y[1],
-                             source_link_id=link_id))
-        return links
+        n_scamp = len(scamp_processors)
+        placable: Dict[int, Tuple[int, ...]] = dict()
+        # Picks the ends of the links in the mask out of all possible ends
+        get_ends: Dict[int, Callable[[List[int]], Tuple[int, ...]]] = dict()
+        created = []
+        for (x, y, eth_x, eth_y, is_ethernet, n_cores, mask,
+             all_ends) in zip(
+                chips.x[indexes].tolist(), chips.y[indexes].tolist(),
+                chips.ethernet_x[indexes].tolist(),
+                chips.ethernet_y[indexes].tolist(),
+                chips.is_ethernet[indexes].tolist(),
+                chips.n_cores[indexes].tolist(),
+                chips.link_masks[indexes].tolist(),
+                chips.link_ends[indexes].tolist()):
+            ends: Tuple[int, ...] = ()
+            if mask:
+                if mask not in get_ends:
+                    get_ends[mask] = itemgetter(*(
+                        link_id * 4 + value for link_id in range(6)
+                        if mask & (1 << link_id) for value in range(4)))
+                ends = get_ends[mask](all_ends)
+            router = Router.from_link_ends(
+                Router.link_ids_in_mask(mask), ends, self._n_router_entries)
+            down_cores = self._unused_cores.get((x, y))
+            if down_cores:
+                cores: Tuple[int, ...] = tuple(
+                    core for core in range(n_scamp, n_cores)
+                    if core not in down_cores)
+            else:
+                cores = placable.setdefault(
+                    n_cores, tuple(range(n_scamp, n_cores)))
+            ip_address = None
+            if is_ethernet:
+                ip_address = f"127.0.{x}.{y}"
+            created.append(Chip(
+                x, y, scamp_processors, cores, router, self._sdram, eth_x,
+                eth_y, ip_address))
+        return created
+
+
+def _index_of(
+        grid: NDArray[numpy.intp], x: Union[int, NDArray[numpy.int32]],
+        y: Union[int, NDArray[numpy.int32]]) -> NDArray[numpy.intp]:
+    """
+    Looks up the indexes of chips in a grid of chip indexes.
+
+    :param grid: The index of the chip at each x and y, or -1 if none
+    :param x: The x coordinate or coordinates to look up
+    :param y: The y coordinate or coordinates to look up
+    :return: The index of the chip at each x and y, or -1 if none
+    """
+    width, height = grid.shape
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return numpy.where(
+        inside, grid[numpy.clip(x, 0, width - 1),
+                     numpy.clip(y, 0, height - 1)], -1)
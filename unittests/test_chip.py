@@ -12,14 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import pickle
 from typing import Optional
 import unittest
+import weakref
 
 from spinn_utilities.ordered_set import OrderedSet
 from spinn_machine import Link, Router, Chip
 from spinn_machine.config_setup import unittest_setup
 
 
+class _SubChip(Chip):
+    """ A Chip subclass, which must pickle as itself """
+
+
 class TestingChip(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -105,6 +112,56 @@ class TestingChip(unittest.TestCase):
         self.assertEqual([(2, 4), xy00, xy36], [chip24, chip00, chip36])
         self.assertEqual([chip24, xy00, chip36], [(2, 4), chip00, xy36])
 
+    def test_shared_values(self) -> None:
+        chip1 = self._create_chip(
+            1, 1, self.n_processors, self._router, self._sdram, None)
+        chip2 = self._create_chip(
+            2, 2, self.n_processors, self._router, self._sdram, None)
+        self.assertIs(chip1.placable_processors_ids,
+                      chip2.placable_processors_ids)
+        self.assertIs(chip1.scamp_processors_ids, chip2.scamp_processors_ids)
+        self.assertIs(chip1.tag_ids, chip2.tag_ids)
+        self.assertIs(chip1._values, chip2._values)
+        self.assertEqual(["_router", "_values"], sorted(vars(chip1)))
+        eth1 = self._create_chip(
+            0, 0, self.n_processors, self._router, self._sdram, self._ip)
+        eth2 = Chip(4, 8, [0], range(1, 10), self._router, self._sdram,
+                    4, 8, self._ip, [1, 2, 3, 4, 5, 6, 7])
+        self.assertIs(eth1.tag_ids, eth2.tag_ids)
+        self.assertIsNot(eth1.placable_processors_ids,
+                         eth2.placable_processors_ids)
+        # Chips of other boards share the template but not the values
+        other = Chip(5, 9, chip1.scamp_processors_ids,
+                     chip1.placable_processors_ids, self._router,
+                     self._sdram, 4, 8)
+        self.assertIsNot(chip1._values, other._values)
+        self.assertIs(chip1._values.template, other._values.template)
+        tags1 = Chip(1, 1, [0], [], self._router, 1, 0, 0, None, [3, 2])
+        tags2 = Chip(1, 1, [0], [], self._router, 1, 0, 0, None, (3, 2))
+        self.assertIs(tags1.tag_ids, tags2.tag_ids)
+        self.assertEqual([3, 2], list(tags1.tag_ids))
+
+        # The shared values go once no chip uses them
+        values = weakref.ref(tags1._values)
+        template = weakref.ref(tags1._values.template)
+        del tags1, tags2
+        gc.collect()
+        self.assertIsNone(values())
+        self.assertIsNone(template())
+
+    def test_pickle(self) -> None:
+        chip = self._create_chip(
+            1, 1, self.n_processors, self._router, self._sdram, self._ip)
+        copy = pickle.loads(pickle.dumps(chip))
+        self.assertEqual(chip, copy)
+        self.assertEqual(chip.fingerprint(), copy.fingerprint())
+        self.assertIs(chip.tag_ids, copy.tag_ids)
+        self.assertEqual(list(chip.router), list(copy.router))
+        self.assertEqual(chip.router.n_available_multicast_entries,
+                         copy.router.n_available_multicast_entries)
+        sub = _SubChip(1, 1, [0], [1, 2], self._router, self._sdram, 0, 0)
+        self.assertIs(_SubChip, type(pickle.loads(pickle.dumps(sub))))
+
 
 if __name__ == '__main__':
     unittest.main()
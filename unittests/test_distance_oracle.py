@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Machine
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.distance_oracle import DistanceOracle
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import (
+    virtual_machine, virtual_machine_by_boards)
+
+
+class TestDistanceOracle(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def _check_bounds(self, machine: Machine, oracle: DistanceOracle) -> int:
+        """
+        Checks the bounds hold for all pairs
+
+        :returns: Number of pairs where the lower bound was better than
+            the vector length
+        """
+        xys = list(machine.chip_coordinates)
+        sources = [s for s in xys for _ in xys]
+        targets = [t for _ in xys for t in xys]
+        paths = machine.shortest_paths(zip(sources, targets))
+        lowers = oracle.lower_bounds(sources, targets)
+        uppers = oracle.upper_bounds(sources, targets)
+        improved = 0
+        for source, target, path, lower, upper in zip(
+                sources, targets, paths, lowers, uppers):
+            if path is None:
+                self.assertEqual(-1, upper)
+                continue
+            _, hops = path
+            self.assertLessEqual(lower, hops)
+            self.assertGreaterEqual(upper, hops)
+            if lower > machine.get_vector_length(source, target):
+                improved += 1
+        return improved
+
+    def test_full_machine(self) -> None:
+        machine = virtual_machine(12, 12)
+        oracle = DistanceOracle(machine)
+        self.assertEqual(3, len(oracle.landmarks))
+        self.assertEqual((0, 0), oracle.landmarks[0])
+        self.assertEqual(0, self._check_bounds(machine, oracle))
+        self.assertEqual((4, 4), oracle.bounds((0, 0), (4, 4)))
+        self.assertEqual((0, 0), oracle.bounds((5, 7), (5, 7)))
+
+    def test_down_chips(self) -> None:
+        set_config("Machine", "down_chips", "2,1:2,2:2,3:2,4")
+        set_config("Machine", "down_links", "1,0,0:1,0,1")
+        machine = virtual_machine_by_boards(1)
+        oracle = DistanceOracle(machine, [(0, 0), (7, 7), (4, 0)])
+        self.assertListEqual([(0, 0), (7, 7), (4, 0)], oracle.landmarks)
+        self.assertGreater(self._check_bounds(machine, oracle), 0)
+        lower, upper = oracle.bounds((1, 2), (3, 2))
+        self.assertGreater(lower, 2)
+        assert upper is not None
+        self.assertGreaterEqual(upper, 7)
+
+    def test_unreachable(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        # Remove all the links out of 3, 3
+        for link in range(6):
+            if machine.is_link_at(3, 3, link):
+                machine.remove_link(3, 3, link)
+        oracle = DistanceOracle(machine)
+        lower, upper = oracle.bounds((3, 3), (1, 1))
+        self.assertEqual(DistanceOracle.UNREACHABLE, lower)
+        self.assertIsNone(upper)
+        self.assertEqual(2, oracle.bounds((1, 1), (3, 3))[0])
+
+    def test_bad_landmark(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            DistanceOracle(machine, [(0, 0), (7, 0)])
+        oracle = DistanceOracle(machine)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            oracle.bounds((0, 0), (7, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
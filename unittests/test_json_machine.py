@@ -20,6 +20,7 @@ import unittest
 from spinn_utilities.config_holder import set_config
 from spinn_utilities.ordered_set import OrderedSet
 
+from spinn_machine import Chip
 from spinn_machine.virtual_machine import (
     virtual_machine, virtual_machine_by_boards, virtual_machine_by_min_size)
 from spinn_machine.data.machine_data_writer import MachineDataWriter
@@ -118,9 +119,12 @@ class TestJsonMachine(unittest.TestCase):
         for chip in vm.chips:
             if chip.ip_address is None:
                 break
-        # Hack in an extra monitor
-        chip._scamp_processors = tuple([0, 1])
-        chip._placable_processors = tuple([2, 3, 4, 5, 6, 7, 8, 9])
+        # Swap in a chip with an extra monitor
+        vm.remove_chip(chip.x, chip.y)
+        vm.add_chip(Chip(
+            chip.x, chip.y, [0, 1], range(2, 10), chip.router, chip.sdram,
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+            chip.ip_address, chip.tag_ids, chip.parent_link))
         jpath = mktemp("json")
         to_json_path(jpath)
         jm = machine_from_json(jpath)
@@ -15,21 +15,44 @@
 """
 test for testing the python representation of a spinnaker machine
 """
+import pickle
+from typing import List, Optional, Set
 from parameterized import parameterized
 
 from testfixtures import LogCapture  # type: ignore[import]
 import unittest
 from spinn_utilities.config_holder import set_config
 from spinn_utilities.testing import log_checker
+from spinn_utilities.typing.coords import XY
 from spinn_machine import Chip, Link, Machine, Router
 from spinn_machine.version import (
     ALL_BOARD_TYPES, BIG_BOARD_TYPES, FOUR_PLUS_BOARD_TYPES, Spin1Gen)
 from spinn_machine.virtual_machine import (
-    virtual_machine_by_boards, virtual_machine_by_min_size)
+    virtual_machine, virtual_machine_by_boards, virtual_machine_by_min_size)
 from spinn_machine.config_setup import unittest_setup
 from spinn_machine.data import MachineDataView
 from spinn_machine.exceptions import (
-    SpinnMachineAlreadyExistsException, SpinnMachineException)
+    SpinnMachineAlreadyExistsException, SpinnMachineException,
+    SpinnMachineInvalidParameterException)
+
+
+def _changed_chip(
+        chip: Chip, placable_processors: Optional[List[int]] = None,
+        ip_address: Optional[str] = None,
+        nearest_ethernet_x: Optional[int] = None) -> Chip:
+    """
+    Copies a chip changing some of the values.
+    """
+    return Chip(
+        chip.x, chip.y, chip.scamp_processors_ids,
+        chip.placable_processors_ids if placable_processors is None
+        else placable_processors,
+        chip.router, chip.sdram,
+        chip.nearest_ethernet_x if nearest_ethernet_x is None
+        else nearest_ethernet_x,
+        chip.nearest_ethernet_y,
+        chip.ip_address if ip_address is None else ip_address,
+        chip.tag_ids, chip.parent_link)
 
 
 class SpinnMachineTestCase(unittest.TestCase):
@@ -147,6 +170,178 @@ class SpinnMachineTestCase(unittest.TestCase):
                 "Not all Chips had the same n_router_tables. "
                 "The counts where Counter({456: 1, 321: 1}).")
 
+    def test_remove(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        chip = machine.remove_chip(4, 4)
+        self.assertFalse(machine.is_chip_at(4, 4))
+        self.assertEqual((4, 4), chip)
+        ethernet = machine.remove_chip(4, 8)
+        self.assertNotIn(ethernet, machine.ethernet_connected_chips)
+        self.assertEqual(2, machine.n_ethernet_connected_chips)
+        original = machine[0, 0]
+        new_chip = machine.remove_link(0, 0, 0)
+        self.assertIs(new_chip, machine[0, 0])
+        self.assertIn(new_chip, machine.ethernet_connected_chips)
+        self.assertTrue(original.router.is_link(0))
+        self.assertFalse(machine.is_link_at(0, 0, 0))
+        self.assertEqual(original.parent_link, new_chip.parent_link)
+        machine.remove_link(1, 1, 0)
+        machine.remove_link(2, 2, 0)
+
+        # The stats must match those of a machine built with the same chips
+        rebuilt = MachineDataView.get_machine_version().create_machine(
+            machine.width, machine.height)
+        rebuilt.add_chips(machine.chips)
+        self.assertEqual(rebuilt.summary_string(), machine.summary_string())
+        for name in ["_n_cores_counter", "_n_links_counter",
+                     "_n_router_entries_counter", "_sdram_counter"]:
+            self.assertEqual(
+                getattr(rebuilt, name), getattr(machine, name), name)
+        self.assertEqual(rebuilt.total_cores, machine.total_cores)
+        self.assertEqual(rebuilt.n_chips, machine.n_chips)
+        self.assertEqual(rebuilt.total_available_user_cores,
+                         machine.total_available_user_cores)
+        self.assertEqual(rebuilt.arrays.n_processors.tolist(),
+                         machine.arrays.n_processors.tolist())
+
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.remove_chip(4, 4)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.remove_link(0, 0, 0)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.remove_link(4, 4, 1)
+
+        machine.remove_chip(0, 0)
+        with self.assertRaises(SpinnMachineException):
+            machine.validate()
+
+    def test_remove_boot_chip(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(1)
+        machine.validate()
+        boot = machine.remove_chip(0, 0)
+        with self.assertRaises(KeyError):
+            machine.boot_chip
+        with self.assertRaisesRegex(
+                SpinnMachineException, "no ethernet chip at 0, 0"):
+            machine.validate()
+        machine.add_chip(boot)
+        self.assertIs(boot, machine.boot_chip)
+        machine.validate()
+
+    def test_board_index(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        for ethernet in machine.ethernet_connected_chips:
+            expected = [
+                xy for xy in machine.get_xys_by_ethernet(
+                    ethernet.x, ethernet.y)
+                if machine.is_chip_at(*xy)]
+            self.assertListEqual(expected, list(
+                machine.get_existing_xys_by_ethernet(ethernet.x, ethernet.y)))
+            assert ethernet.ip_address is not None
+            self.assertIs(
+                ethernet, machine.get_ethernet_chip_by_ip(ethernet.ip_address))
+        self.assertIsNone(machine.get_ethernet_chip_by_ip("127.0.0.1"))
+        self.assertListEqual(
+            [], list(machine.get_chips_by_ethernet(1, 1)))
+
+        machine.remove_chip(5, 9)
+        self.assertNotIn((5, 9), list(machine.get_existing_xys_on_board(
+            machine[4, 8])))
+        chip = machine.remove_link(4, 8, 0)
+        self.assertIn(chip, list(machine.get_chips_by_ethernet(4, 8)))
+        self.assertIs(chip, machine.get_ethernet_chip_by_ip("127.0.4.8"))
+        machine.remove_chip(4, 8)
+        self.assertIsNone(machine.get_ethernet_chip_by_ip("127.0.4.8"))
+        self.assertEqual(46, len(list(machine.get_chips_by_ethernet(4, 8))))
+
+        # Chips can be removed while going through a board
+        for chip in machine.get_chips_by_ethernet(4, 8):
+            if chip.x % 2:
+                machine.remove_chip(chip.x, chip.y)
+        for x, y in machine.get_existing_xys_by_ethernet(4, 8):
+            machine.remove_chip(x, y)
+        self.assertListEqual([], list(machine.get_chips_by_ethernet(4, 8)))
+
+    def _first_unused_xy(self, machine: Machine) -> XY:
+        on_boards: Set[XY] = set()
+        for ethernet in machine.ethernet_connected_chips:
+            on_boards.update(machine.get_xys_by_ethernet(
+                ethernet.x, ethernet.y))
+        x = 0
+        while True:
+            for y in range(machine.height):
+                if (x, y) not in machine and (x, y) not in on_boards:
+                    return x, y
+            x += 1
+
+    def test_unused_xy(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        used: Set[XY] = set()
+        for _ in range(20):
+            xy = machine.get_unused_xy()
+            self.assertEqual(xy, machine.get_unused_xy())
+            self.assertEqual(self._first_unused_xy(machine), xy)
+            self.assertNotIn(xy, used)
+            used.add(xy)
+            machine.add_chip(Chip(
+                xy[0], xy[1], [0], [1], Router([], 1024), 100, 0, 0))
+        first = min(used)
+        machine.remove_chip(*first)
+        self.assertEqual(first, machine.get_unused_xy())
+        machine.remove_chip(4, 8)
+        self.assertEqual(self._first_unused_xy(machine),
+                         machine.get_unused_xy())
+
+    def test_chip_index(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        n_grid = machine.width * machine.height
+        self.assertEqual(n_grid, machine.n_chip_slots)
+        indexes = [machine.chip_index(x, y)
+                   for x, y in machine.chip_coordinates]
+        self.assertEqual(len(indexes), len(set(indexes)))
+        for (x, y), index in zip(machine.chip_coordinates, indexes):
+            self.assertEqual((x, y), machine.chip_xy(index))
+        self.assertEqual(machine.width + 1, machine.chip_index(1, 1))
+
+        # Chips outside the grid get new indexes that survive removal
+        x, y = machine.width + 2, 3
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.chip_index(x, y)
+        machine.add_chip(Chip(x, y, [0], [1], Router([], 1024), 100, 0, 0))
+        self.assertEqual(n_grid, machine.chip_index(x, y))
+        machine.remove_chip(x, y)
+        machine.remove_chip(4, 8)
+        self.assertEqual(n_grid, machine.chip_index(x, y))
+        self.assertEqual(n_grid + 1, machine.n_chip_slots)
+        self.assertEqual((x, y), machine.chip_xy(n_grid))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.chip_xy(n_grid + 1)
+        machine.add_chip(Chip(3, y + machine.height, [0], [1],
+                              Router([], 1024), 100, 0, 0))
+        self.assertEqual((3, y + machine.height), machine.chip_xy(n_grid + 1))
+        copy = pickle.loads(pickle.dumps(machine))
+        self.assertEqual((x, y), copy.chip_xy(n_grid))
+        self.assertEqual((3, y + machine.height), copy.chip_xy(n_grid + 1))
+        machine.remove_chip(3, y + machine.height)
+
+        # Bulk versions agree with the single ones
+        xs = [0, 4, x, -1, 5]
+        ys = [0, 8, y, 2, 9]
+        bulk = machine.chip_indexes(xs, ys)
+        self.assertListEqual(
+            [0, machine.chip_index(4, 8), n_grid, -1,
+             machine.chip_index(5, 9)], bulk.tolist())
+        self.assertListEqual(
+            [[0, 0], [4, 8], [x, y], [5, 9]],
+            machine.chip_xys(bulk[bulk >= 0]).tolist())
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            machine.chip_xys(bulk)
+
     @parameterized.expand(ALL_BOARD_TYPES)
     def test_chip_already_exists(self, _: str, ver_num: str) -> None:
         """
@@ -357,7 +552,8 @@ class SpinnMachineTestCase(unittest.TestCase):
     def test_weird_ethernet1(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
         machine = virtual_machine_by_boards(1)
-        self._non_ethernet_chip(machine)._ip_address = "1.2.3.4"
+        chip = machine.remove_chip(*self._non_ethernet_chip(machine))
+        machine.add_chip(_changed_chip(chip, ip_address="1.2.3.4"))
         with self.assertRaises(SpinnMachineException):
             machine.validate()
 
@@ -366,7 +562,8 @@ class SpinnMachineTestCase(unittest.TestCase):
         set_config("Machine", "version", ver_num)
         machine = virtual_machine_by_boards(1)
         width, __ = MachineDataView.get_machine_version().board_shape
-        self._non_ethernet_chip(machine)._nearest_ethernet_x = width + 1
+        chip = machine.remove_chip(*self._non_ethernet_chip(machine))
+        machine.add_chip(_changed_chip(chip, nearest_ethernet_x=width + 1))
         with self.assertRaises(SpinnMachineException):
             machine.validate()
 
@@ -375,7 +572,8 @@ class SpinnMachineTestCase(unittest.TestCase):
         set_config("Machine", "version", ver_num)
         machine = virtual_machine_by_boards(1)
         __, height = MachineDataView.get_machine_version().board_shape
-        self._non_ethernet_chip(machine)._nearest_ethernet_x = height + 1
+        chip = machine.remove_chip(*self._non_ethernet_chip(machine))
+        machine.add_chip(_changed_chip(chip, nearest_ethernet_x=height + 1))
         with self.assertRaises(SpinnMachineException):
             machine.validate()
 
@@ -391,16 +589,116 @@ class SpinnMachineTestCase(unittest.TestCase):
             (2, 4), (1, 3), (0, 2), (0, 1), (0, 0), (1, 0)]
         self.assertListEqual(expected, found)
 
+    def test_chips_within(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        set_config("Machine", "down_chips", "3,3:5,6")
+        for width, height, wrap in [
+                (12, 12, "Wrapped"), (12, 16, "HorWrap"),
+                (16, 12, "VerWrap"), (16, 16, "NoWrap")]:
+            machine = virtual_machine(width, height)
+            self.assertEqual(wrap, machine.wrap)
+            for radius in [0, 1, 4, 9]:
+                for start in [(0, 0), (4, 4), (11, 3)]:
+                    expected: List[XY] = []
+                    for xy in machine.concentric_xys(radius, start):
+                        if xy in machine and xy not in expected:
+                            expected.append(xy)
+                    found = machine.chips_within(radius, start)
+                    self.assertListEqual(
+                        expected, [(x, y) for x, y in found.tolist()])
+                    unordered = machine.chips_within(
+                        radius, start, by_ring=False)
+                    self.assertListEqual(
+                        [xy for xy in machine.chip_coordinates
+                         if xy in expected],
+                        [(x, y) for x, y in unordered.tolist()])
+        self.assertEqual((0, 2), machine.chips_within(3, (100, 100)).shape)
+
     @parameterized.expand(ALL_BOARD_TYPES)
     def test_too_few_cores(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
         machine = virtual_machine_by_boards(1)
-        # Hack to get n_processors return a low number
-        chip = next(machine.chips)
-        chip._placable_processors = tuple([1, 2])
+        # Swap in a chip with too few processors
+        chip = machine.remove_chip(*next(machine.chips))
+        machine.add_chip(_changed_chip(chip, placable_processors=[1, 2]))
         with self.assertRaises(SpinnMachineException):
             machine.validate()
 
+    def test_validate_collect_all(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        machine.validate(collect_all=True)
+        # Swap in some broken chips
+        machine.add_chip(_changed_chip(
+            machine.remove_chip(1, 0), placable_processors=[1, 2]))
+        machine.add_chip(_changed_chip(
+            machine.remove_chip(5, 9), ip_address="1.2.3.4"))
+        machine.add_chip(_changed_chip(
+            machine.remove_chip(9, 5),
+            nearest_ethernet_x=machine.width + 3))
+        machine.add_chip(Chip(
+            machine.width + 1, 0, [0], range(1, 18), Router([], 1024),
+            100, 0, 0))
+        with self.assertRaises(SpinnMachineException) as first:
+            machine.validate()
+        self.assertEqual(1, len(str(first.exception).splitlines()))
+        with self.assertRaises(SpinnMachineException) as every:
+            machine.validate(collect_all=True)
+        errors = str(every.exception).splitlines()
+        self.assertEqual(5, len(errors))
+        self.assertEqual(str(first.exception), errors[0])
+        self.assertIn("has too few cores found 3", errors[0])
+        self.assertIn("Only Chip with X divisible by 4", errors[1])
+        self.assertIn("has an invalid ethernet chip", errors[2])
+        self.assertIn("has an x larger than width", errors[3])
+        self.assertIn("has an unexpected local xy of", errors[4])
+        # The same when the values come from the machine arrays
+        self.assertEqual(len(machine.arrays), machine.n_chips)
+        with self.assertRaises(SpinnMachineException) as from_arrays:
+            machine.validate(collect_all=True)
+        self.assertEqual(str(every.exception), str(from_arrays.exception))
+
+    def test_fingerprint(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        machine = virtual_machine_by_boards(3)
+        fingerprint = machine.fingerprint()
+        self.assertEqual(32, len(fingerprint))
+        self.assertEqual(fingerprint,
+                         virtual_machine_by_boards(3).fingerprint())
+
+        # The order the chips are added in makes no difference
+        version = MachineDataView.get_machine_version()
+        reordered = version.create_machine(machine.width, machine.height)
+        reordered.add_chips(reversed(list(machine.chips)))
+        self.assertEqual(fingerprint, reordered.fingerprint())
+
+        # Changes are kept up to date and can be undone
+        chip = machine.remove_chip(5, 9)
+        self.assertNotEqual(fingerprint, machine.fingerprint())
+        machine.add_chip(chip)
+        self.assertEqual(fingerprint, machine.fingerprint())
+        machine.remove_link(0, 0, 0)
+        changed = machine.fingerprint()
+        self.assertNotEqual(fingerprint, changed)
+        rebuilt = version.create_machine(machine.width, machine.height)
+        rebuilt.add_chips(machine.chips)
+        self.assertEqual(changed, rebuilt.fingerprint())
+
+        self.assertNotEqual(
+            fingerprint, virtual_machine_by_boards(4).fingerprint())
+
+        # The same in a process with no machine version configured
+        pickled = pickle.dumps(rebuilt)
+        unittest_setup()
+        self.assertEqual(changed, pickle.loads(pickled).fingerprint())
+        router = Router([], 1024)
+        self.assertEqual(
+            Chip(1, 2, [0], [1, 2], router, 100, 0, 0).fingerprint(),
+            Chip(1, 2, [0], [1, 2], router, 100, 0, 0).fingerprint())
+        self.assertNotEqual(
+            Chip(1, 2, [0], [1, 2], router, 100, 0, 0).fingerprint(),
+            Chip(1, 2, [0], [1, 2], router, 200, 0, 0).fingerprint())
+
 
 if __name__ == '__main__':
     unittest.main()
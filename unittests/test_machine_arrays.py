@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, Router
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.machine_arrays import MachineArrays
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import (
+    virtual_machine, virtual_machine_by_boards)
+
+
+class TestMachineArrays(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_columns_match_chips(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        arrays = machine.arrays
+        self.assertEqual(machine.n_chips, len(arrays))
+        for index, chip in enumerate(machine.chips):
+            self.assertEqual(index, arrays.position_of(chip.x, chip.y))
+            self.assertEqual(chip.x, arrays.x[index])
+            self.assertEqual(chip.y, arrays.y[index])
+            self.assertEqual(chip.n_processors, arrays.n_processors[index])
+            self.assertEqual(chip.n_placable_processors,
+                             arrays.n_placable_processors[index])
+            self.assertEqual(chip.sdram, arrays.sdram[index])
+            self.assertEqual(chip.nearest_ethernet_x,
+                             arrays.nearest_ethernet_x[index])
+            self.assertEqual(chip.nearest_ethernet_y,
+                             arrays.nearest_ethernet_y[index])
+            self.assertEqual(chip.router.n_available_multicast_entries,
+                             arrays.n_router_entries[index])
+            self.assertEqual(chip.ip_address is not None,
+                             arrays.is_ethernet[index])
+            for link_id in range(Router.MAX_LINKS_PER_ROUTER):
+                self.assertEqual(
+                    chip.router.is_link(link_id),
+                    bool(arrays.link_mask[index] & (1 << link_id)))
+        self.assertEqual(3, arrays.is_ethernet.sum())
+        with self.assertRaises(KeyError):
+            arrays.position_of(machine.width, machine.height)
+
+    def test_positions_change(self) -> None:
+        machine = virtual_machine(8, 8)
+        chip_index = machine.chip_index(0, 1)
+        self.assertEqual(1, machine.arrays.position_of(0, 1))
+        machine.remove_chip(0, 0)
+        # The position moves up but the stable index does not
+        self.assertEqual(0, machine.arrays.position_of(0, 1))
+        self.assertEqual(chip_index, machine.chip_index(0, 1))
+        arrays = machine.arrays
+        self.assertListEqual(
+            [machine.chip_index(chip.x, chip.y) for chip in machine.chips],
+            machine.chip_indexes(arrays.x, arrays.y).tolist())
+
+    def test_read_only(self) -> None:
+        arrays = virtual_machine(8, 8).arrays
+        with self.assertRaises(ValueError):
+            arrays.x[0] = 7
+
+    def test_rebuilt_after_add_chip(self) -> None:
+        machine = virtual_machine(8, 8)
+        arrays = machine.arrays
+        self.assertIs(arrays, machine.arrays)
+        x, y = machine.get_unused_xy()
+        machine.add_chip(Chip(
+            x, y, [0], [1, 2], Router([], 1024), 100, 0, 0))
+        self.assertIsNot(arrays, machine.arrays)
+        self.assertEqual(49, len(machine.arrays))
+        self.assertEqual([(x, y)], machine.unreachable_outgoing_chips())
+        self.assertEqual(859, machine.total_cores)
+        self.assertEqual(859 - 49, machine.total_available_user_cores)
+
+    def test_neighbours(self) -> None:
+        set_config("Machine", "down_chips", "3,3:5,6")
+        machine = virtual_machine(12, 12)
+        machine.remove_link(1, 1, 0)
+        arrays = machine.arrays
+        indptr, indices = arrays.csr
+        self.assertEqual((machine.n_chips, 6), arrays.neighbours.shape)
+        self.assertEqual(machine.n_chips + 1, len(indptr))
+        for index, chip in enumerate(machine.chips):
+            expected = []
+            for link_id in range(6):
+                link = chip.router.get_link(link_id)
+                target = -1
+                if link is not None and machine.is_chip_at(
+                        link.destination_x, link.destination_y):
+                    target = arrays.position_of(
+                        link.destination_x, link.destination_y)
+                    expected.append(target)
+                self.assertEqual(target, arrays.neighbours[index, link_id])
+            self.assertListEqual(
+                expected, indices[indptr[index]:indptr[index + 1]].tolist())
+        with self.assertRaises(ValueError):
+            indices[0] = 1
+
+        # The array based checks match those done chip by chip
+        self.assertListEqual(
+            list(machine.one_way_links(machine.chip_coordinates)),
+            list(machine.one_way_links()))
+        self.assertIn((2, 1, 3, 0), list(machine.one_way_links()))
+        self.assertEqual(
+            machine.find_unreachable_chips(local=True),
+            machine.find_unreachable_chips(
+                local=True, ethernets=machine.ethernet_connected_chips))
+
+    def test_breadth_first(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        arrays = machine.arrays
+        start = arrays.position_of(0, 0)
+        hops = MachineArrays.breadth_first(arrays.neighbours, start)
+        back = MachineArrays.breadth_first(
+            MachineArrays.reverse_table(arrays.neighbours), [start])
+        for index, (x, y) in enumerate(machine.chip_coordinates):
+            self.assertEqual(
+                machine.get_vector_length((0, 0), (x, y)), hops[index])
+            self.assertEqual(
+                machine.get_vector_length((x, y), (0, 0)), back[index])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, Link, Machine, Router
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.machine_columns import chip_columns, machine_from_columns
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import (
+    virtual_machine, virtual_machine_by_boards)
+
+
+class TestMachineColumns(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def _check_same(self, machine: Machine, copy: Machine) -> None:
+        self.assertIs(type(machine), type(copy))
+        self.assertEqual(machine.fingerprint(), copy.fingerprint())
+        self.assertEqual(str(machine), str(copy))
+        self.assertListEqual(
+            [(chip, chip.fingerprint(), chip.parent_link, list(chip.router))
+             for chip in machine.chips],
+            [(chip, chip.fingerprint(), chip.parent_link, list(chip.router))
+             for chip in copy.chips])
+        self.assertListEqual(
+            list(machine.ethernet_connected_chips),
+            list(copy.ethernet_connected_chips))
+        self.assertEqual(
+            machine.boot_chip.ip_address, copy.boot_chip.ip_address)
+
+    def test_pickle(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        machine.remove_link(1, 1, 2)
+        machine.remove_chip(5, 9)
+        # Chips are kept in order even when not in order of board
+        machine.add_chip(machine.remove_chip(0, 1))
+        copy = pickle.loads(pickle.dumps(machine))
+        self.assertEqual(0, len(copy._lazy_boards))
+        self._check_same(machine, copy)
+
+    def test_lazy(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        machine.remove_link(1, 1, 2)
+        machine.remove_chip(5, 9)
+        copy = machine_from_columns(
+            type(machine), machine.width, machine.height,
+            machine._chip_core_map, "Lazy", {}, chip_columns(machine),
+            lazy=True)
+        self.assertEqual(3, len(copy._lazy_boards))
+        self.assertEqual(machine.n_chips, copy.n_chips)
+        self.assertEqual(machine.total_cores, copy.total_cores)
+        # Only the board used is built
+        self.assertEqual(machine[9, 5].router.link_mask,
+                         copy[9, 5].router.link_mask)
+        self.assertEqual(2, len(copy._lazy_boards))
+        self.assertEqual(machine.fingerprint(), copy.fingerprint())
+        self.assertEqual(0, len(copy._lazy_boards))
+        # The chips are in order of board, whichever was built first
+        self.assertListEqual(
+            [chip for ethernet in machine.ethernet_connected_chips
+             for chip in machine.get_chips_by_ethernet(
+                 ethernet.x, ethernet.y)],
+            list(copy.chips))
+
+    def test_pickle_wrap(self) -> None:
+        machine = virtual_machine(12, 12)
+        self.assertEqual("Wrapped", machine.wrap)
+        self._check_same(machine, pickle.loads(pickle.dumps(machine)))
+
+    def test_odd_chips(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        x = machine.width + 2
+        # A chip off the grid with a link that does not follow the geometry
+        machine.add_chip(Chip(
+            x, 3, [0], range(1, 5), Router([Link(x, 3, 4, 7, 7)], 100),
+            1000, 0, 0, parent_link=4))
+        index = machine.chip_index(x, 3)
+        columns = chip_columns(machine)
+        self.assertEqual([[machine.n_chips - 1, 4, x, 3, 7, 7]],
+                         columns.odd_links.tolist())
+        copy = pickle.loads(pickle.dumps(machine))
+        self._check_same(machine, copy)
+        self.assertEqual(index, copy.chip_index(x, 3))
+        self.assertEqual((7, 7), copy[x, 3].router.get_destination(4))
+
+    def test_links_out_of_order(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        chip = machine.remove_chip(1, 1)
+        links = list(chip.router.links)
+        machine.add_chip(Chip(
+            1, 1, chip.scamp_processors_ids, chip.placable_processors_ids,
+            Router(reversed(links), 100), chip.sdram, 0, 0))
+        columns = chip_columns(machine)
+        self.assertEqual(len(links), len(columns.odd_links))
+        copy = pickle.loads(pickle.dumps(machine))
+        self._check_same(machine, copy)
+        self.assertEqual([link_id for link_id, _ in copy[1, 1].router],
+                         [link.source_link_id for link in reversed(links)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tempfile import mktemp
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.data.machine_data_writer import MachineDataWriter
+from spinn_machine.json_machine import machine_from_json, to_json_path
+from spinn_machine.machine_diff import machine_diff
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+
+class TestMachineDiff(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_same(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        MachineDataWriter.mock().set_machine(machine)
+        jpath = mktemp("json")
+        to_json_path(jpath)
+        snapshot = machine_from_json(jpath)
+        self.assertEqual(machine.board_digests(), snapshot.board_digests())
+        diff = machine_diff(snapshot, machine)
+        self.assertFalse(diff)
+        self.assertListEqual([], diff.added_chips)
+
+    def test_changes(self) -> None:
+        old = virtual_machine_by_boards(3)
+        new = virtual_machine_by_boards(3)
+        new.remove_chip(5, 9)
+        new.remove_link(1, 1, 2)
+        chip = new.remove_chip(8, 4)
+        new.add_chip(Chip(
+            chip.x, chip.y, [0], range(1, 10), chip.router, 1000,
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+            "1.2.3.4", [1, 2]))
+
+        diff = machine_diff(old, new)
+        self.assertTrue(diff)
+        self.assertListEqual([(0, 0), (4, 8), (8, 4)], diff.changed_boards)
+        self.assertListEqual([], diff.added_chips)
+        self.assertListEqual([(5, 9)], diff.removed_chips)
+        self.assertDictEqual({(8, 4): (18, 10)}, diff.changed_cores)
+        self.assertDictEqual(
+            {(8, 4): (old[8, 4].sdram, 1000)}, diff.changed_sdram)
+        self.assertDictEqual({}, diff.changed_router_entries)
+        self.assertDictEqual(
+            {(8, 4): (tuple(old[8, 4].tag_ids), (1, 2))}, diff.changed_tags)
+        self.assertDictEqual(
+            {(8, 4): (old[8, 4].ip_address, "1.2.3.4")},
+            diff.changed_ip_addresses)
+        self.assertListEqual([(1, 1, 2)], diff.removed_links)
+        self.assertListEqual([], diff.added_links)
+
+        # Going the other way swaps the sides
+        back = machine_diff(new, old)
+        self.assertListEqual([(5, 9)], back.added_chips)
+        self.assertListEqual([(1, 1, 2)], back.added_links)
+
+        # Only the boards that changed are looked at
+        one = virtual_machine_by_boards(3)
+        one.remove_link(9, 5, 0)
+        diff = machine_diff(old, one)
+        self.assertListEqual([(8, 4)], diff.changed_boards)
+        self.assertListEqual([(9, 5, 0)], diff.removed_links)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, Machine, Router
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import (
+    SpinnMachineException, SpinnMachineInvalidParameterException)
+from spinn_machine.machine_factory import machine_repair
+from spinn_machine.machine_overlay import MachineOverlay
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+
+class TestMachineOverlay(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_unchanged(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        overlay = MachineOverlay(machine)
+        self.assertListEqual(list(machine.chips), list(overlay.chips))
+        self.assertEqual(machine.n_chips, len(overlay))
+        self.assertEqual(machine.total_cores, overlay.total_cores)
+        self.assertListEqual(list(machine.ethernet_connected_chips),
+                             overlay.ethernet_connected_chips)
+        self.assertListEqual(
+            list(machine.get_existing_xys_by_ethernet(4, 8)),
+            list(overlay.get_existing_xys_by_ethernet(4, 8)))
+        self.assertIs(machine.boot_chip, overlay.boot_chip)
+
+    def test_changes(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        overlay = MachineOverlay(machine)
+        removed = overlay.remove_chip(5, 9)
+        self.assertIs(machine[5, 9], removed)
+        self.assertFalse(overlay.is_chip_at(5, 9))
+        self.assertNotIn((5, 9), overlay)
+        with self.assertRaises(KeyError):
+            overlay[5, 9]
+        self.assertNotIn((5, 9), list(overlay.chip_coordinates))
+        self.assertNotIn(
+            (5, 9), list(overlay.get_existing_xys_by_ethernet(4, 8)))
+        ethernet = overlay.remove_chip(8, 4)
+        self.assertNotIn(ethernet, overlay.ethernet_connected_chips)
+        self.assertEqual(2, len(overlay.ethernet_connected_chips))
+
+        chip = overlay.remove_link(0, 0, 0)
+        self.assertIs(chip, overlay.boot_chip)
+        self.assertFalse(overlay.is_link_at(0, 0, 0))
+        self.assertIn(chip, overlay.ethernet_connected_chips)
+
+        # The base machine is unchanged
+        self.assertTrue(machine.is_chip_at(5, 9))
+        self.assertTrue(machine.is_link_at(0, 0, 0))
+        self.assertEqual(3, machine.n_ethernet_connected_chips)
+
+        x, y = machine.get_unused_xy()
+        extra = Chip(x, y, [0], [1, 2], Router([], 1024), 100, 0, 0)
+        overlay.override_chip(extra)
+        self.assertIs(extra, overlay[x, y])
+        self.assertIs(extra, list(overlay.chips)[-1])
+        self.assertEqual({(5, 9), (8, 4)}, overlay.removed_xys)
+        self.assertEqual(2, len(list(overlay.overridden_chips)))
+
+        # The overlay should match a machine with the same changes
+        expected = virtual_machine_by_boards(3)
+        expected.remove_chip(5, 9)
+        expected.remove_chip(8, 4)
+        expected.remove_link(0, 0, 0)
+        expected.add_chip(extra)
+        self.assertEqual(expected.n_chips, overlay.n_chips)
+        self.assertEqual(expected.total_cores, overlay.total_cores)
+        self.assertEqual(expected.total_available_user_cores,
+                         overlay.total_available_user_cores)
+        rebuilt = overlay.to_machine()
+        self.assertEqual(expected.summary_string(), rebuilt.summary_string())
+        self.assertListEqual(list(expected.chip_coordinates),
+                             list(rebuilt.chip_coordinates))
+
+        # Putting back the original chip removes the change
+        overlay.override_chip(removed)
+        self.assertIs(removed, overlay[5, 9])
+        self.assertEqual({(8, 4)}, overlay.removed_xys)
+
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            overlay.remove_chip(8, 4)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            overlay.remove_link(0, 0, 0)
+
+    def test_machine_api(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        overlay = MachineOverlay(machine)
+        # Unchanged it answers as the base machine
+        self.assertEqual(machine.summary_string(), overlay.summary_string())
+        self.assertEqual(machine.wrap, overlay.wrap)
+        self.assertEqual(machine.get_vector((0, 0), (5, 3)),
+                         overlay.get_vector((0, 0), (5, 3)))
+
+        overlay.remove_chip(2, 1)
+        overlay.remove_link(1, 0, 0)
+        expected = virtual_machine_by_boards(3)
+        expected.remove_chip(2, 1)
+        expected.remove_link(1, 0, 0)
+        self.assertEqual(expected.summary_string(), overlay.summary_string())
+        self.assertEqual(expected.where_is_xy(2, 1), overlay.where_is_xy(2, 1))
+        self.assertEqual(expected.shortest_path((1, 0), (3, 1)),
+                         overlay.shortest_path((1, 0), (3, 1)))
+        self.assertListEqual(
+            expected.chips_within(2, (1, 1)).tolist(),
+            overlay.chips_within(2, (1, 1)).tolist())
+        self.assertEqual(expected.fingerprint(), overlay.fingerprint())
+
+        # A Machine consumer is given the machine made by to_machine
+        set_config("Machine", "repair_machine", "True")
+        repaired = machine_repair(overlay.to_machine(), [(2, 1)])
+        self.assertEqual(
+            machine_repair(expected, [(2, 1)]).fingerprint(),
+            repaired.fingerprint())
+        self.assertTrue(machine.is_chip_at(2, 1))
+        self.assertNotIsInstance(overlay, Machine)
+
+        # A change is seen by the rest of the API
+        overlay.remove_chip(3, 1)
+        self.assertEqual(expected.n_chips - 1, overlay.n_chips)
+        self.assertNotIn((3, 1), overlay.chips_within(2, (1, 1)).tolist())
+        self.assertIn((3, 1), list(overlay.get_down_xys_by_ethernet(0, 0)))
+
+    def test_refused_changes(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        x, y = machine.get_unused_xy()
+        extra = Chip(x, y, [0], [1, 2], Router([], 1024), 100, 0, 0)
+        for changed in (False, True):
+            overlay = MachineOverlay(machine)
+            if changed:
+                overlay.remove_chip(5, 9)
+            with self.assertRaises(SpinnMachineException):
+                overlay.add_chip(extra)
+            with self.assertRaises(SpinnMachineException):
+                overlay.add_chips([extra])
+            with self.assertRaises(SpinnMachineException):
+                overlay.add_lazy_board(x, y, [(x, y)], 3, 2, lambda: [extra])
+            with self.assertRaises(SpinnMachineException):
+                overlay.build_vector_table()
+            self.assertFalse(overlay.is_chip_at(x, y))
+            # The base machine is never changed
+            self.assertFalse(machine.is_chip_at(x, y))
+            overlay.override_chip(extra)
+            self.assertTrue(overlay.is_chip_at(x, y))
+            self.assertFalse(machine.is_chip_at(x, y))
+
+
+if __name__ == '__main__':
+    unittest.main()
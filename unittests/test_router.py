@@ -41,6 +41,11 @@ class TestingRouter(unittest.TestCase):
         self.assertEqual([link[1].source_link_id for link in r], [0, 1, 2, 3])
 
         self.assertEqual(r.n_available_multicast_entries, 1024)
+        self.assertEqual(r.link_mask, 0b1111)
+        self.assertEqual(r.get_destination(2), (0, 0))
+        self.assertIsNone(r.get_destination(4))
+        self.assertEqual(list(r.destinations()),
+                         [(0, 1, 1), (1, 1, 0), (2, 0, 0), (3, 0, 1)])
 
         self.assertFalse(r.is_link(-1))
         self.assertFalse(r.is_link(links.__len__() + 1))
@@ -71,6 +76,50 @@ class TestingRouter(unittest.TestCase):
         with self.assertRaises(SpinnMachineAlreadyExistsException):
             Router(links, 1024)
 
+    def test_links_out_of_order(self) -> None:
+        r = Router([Link(2, 2, 5, 1, 1), Link(2, 2, 1, 3, 3)], 1024)
+        r.add_link(Link(2, 2, 3, 1, 2))
+        self.assertEqual(len(r), 3)
+        self.assertEqual(r.link_mask, 0b101010)
+        self.assertEqual([link_id for link_id, _ in r], [5, 1, 3])
+        self.assertEqual([link.source_link_id for link in r.links], [5, 1, 3])
+        self.assertEqual(list(r.destinations()),
+                         [(5, 1, 1), (1, 3, 3), (3, 1, 2)])
+        self.assertEqual(r.get_link(3), Link(2, 2, 3, 1, 2))
+        self.assertEqual(r.get_destination(5), (1, 1))
+        self.assertFalse(r.is_link(0))
+        self.assertFalse(r.is_link(6))
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            r.add_link(Link(2, 2, 1, 3, 3))
+
+    def test_links_outside_mask(self) -> None:
+        r = Router([Link(2, 2, 7, 1, 1), Link(2, 2, 1, 3, 3)], 1024)
+        self.assertEqual(len(r), 2)
+        self.assertEqual(r.link_mask, 0b10)
+        self.assertTrue(r.is_link(7))
+        self.assertEqual(r.get_link(7), Link(2, 2, 7, 1, 1))
+        self.assertEqual([link_id for link_id, _ in r], [7, 1])
+
+    def test_from_link_ends(self) -> None:
+        r = Router([Link(2, 2, 5, 1, 1), Link(2, 2, 1, 3, 3)], 1024)
+        copy = Router.from_link_ends((5, 1), (2, 2, 1, 1, 2, 2, 3, 3), 1024)
+        self.assertEqual(list(r), list(copy))
+        self.assertEqual(r.n_available_multicast_entries,
+                         copy.n_available_multicast_entries)
+        self.assertEqual(len(Router.from_link_ends((), (), 1024)), 0)
+        self.assertEqual(Router.link_ids_in_mask(0b100010), (1, 5))
+
+    def test_without_link(self) -> None:
+        r = Router([Link(2, 2, 5, 1, 1), Link(2, 2, 1, 3, 3),
+                    Link(2, 2, 3, 1, 2)], 1024)
+        without = r.without_link(3)
+        self.assertEqual(len(r), 3)
+        self.assertEqual(without.link_mask, 0b100010)
+        self.assertEqual(list(without.destinations()),
+                         [(5, 1, 1), (1, 3, 3)])
+        self.assertEqual(without.n_available_multicast_entries, 1024)
+        self.assertEqual(list(r.without_link(0)), list(r))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import pickle
+from typing import Tuple
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine.config_setup import unittest_setup
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.shared_machine import (
+    SharedMachine, _attach_memory, attach_shared_machine, share_machine)
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+
+def _chip_in_worker(shared: SharedMachine) -> Tuple[int, str, int]:
+    view = shared.view()
+    return view.n_chips, str(view[9, 5]), int(shared.neighbours[5, 0])
+
+
+class TestSharedMachine(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_share(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        machine.remove_link(1, 1, 2)
+        with share_machine(machine) as shared:
+            self.assertIs(shared, attach_shared_machine(shared.name))
+            self.assertIs(shared, pickle.loads(pickle.dumps(shared)))
+            self.assertLess(len(pickle.dumps(shared)), 200)
+            self.assertListEqual(
+                machine.arrays.neighbours.tolist(),
+                shared.neighbours.tolist())
+            with self.assertRaises(ValueError):
+                shared.neighbours[0, 0] = 3
+
+            # Attach as another process would
+            other = SharedMachine(_attach_memory(shared.name), owner=False)
+            self.assertListEqual(
+                shared.columns.xys.tolist(), other.columns.xys.tolist())
+            copy = other.copy_machine()
+            self.assertEqual(machine.fingerprint(), copy.fingerprint())
+            self.assertFalse(copy.is_link_at(1, 1, 2))
+            # Changing the copy does not change the shared memory
+            copy.remove_chip(0, 0)
+            self.assertEqual(machine.n_chips, other.copy_machine().n_chips)
+            other.close()
+            with self.assertRaises(SpinnMachineException):
+                other.columns
+            # Closing an attached one leaves the owner's open
+            self.assertIs(shared, attach_shared_machine(shared.name))
+            lazy_copy = shared.copy_machine()
+            view = shared.view()
+            self.assertEqual(3, len(view.base._lazy_boards))
+            self.assertEqual(str(machine[9, 5]), str(view[9, 5]))
+            self.assertEqual(2, len(view.base._lazy_boards))
+            self.assertIs(view.base, shared.view().base)
+            # Changing a view does not change the machine behind it
+            view.remove_chip(0, 0)
+            self.assertIn((0, 0), shared.view())
+        # Once the owner closes, the name can not be attached to
+        with self.assertRaises(FileNotFoundError):
+            attach_shared_machine(shared.name)
+        with self.assertRaises(SpinnMachineException):
+            shared.copy_machine()
+        shared.close()
+        # A copy does not need the shared memory to build its boards
+        self.assertEqual(machine.fingerprint(), lazy_copy.fingerprint())
+        # Nor does a view once the shared machine is closed
+        self.assertEqual(0, len(view.base._lazy_boards))
+        self.assertEqual(machine.n_chips - 1, view.n_chips)
+
+    def test_close_in_use(self) -> None:
+        machine = virtual_machine_by_boards(1)
+        shared = share_machine(machine)
+        row = shared.neighbours[5]
+        xys = shared.columns.xys
+        with self.assertRaises(SpinnMachineException):
+            shared.close()
+        # Still open, with the arrays still readable
+        self.assertListEqual(
+            machine.arrays.neighbours[5].tolist(), row.tolist())
+        self.assertIs(shared, attach_shared_machine(shared.name))
+        del row
+        with self.assertRaises(SpinnMachineException):
+            shared.close()
+        del xys
+        shared.close()
+        with self.assertRaises(SpinnMachineException):
+            shared.neighbours
+
+    def test_workers(self) -> None:
+        machine = virtual_machine_by_boards(3)
+        context = multiprocessing.get_context("spawn")
+        with share_machine(machine) as shared:
+            with context.Pool(2) as pool:
+                results = pool.map(_chip_in_worker, [shared] * 4)
+        expected = (machine.n_chips, str(machine[9, 5]),
+                    int(machine.arrays.neighbours[5, 0]))
+        self.assertEqual([expected] * 4, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
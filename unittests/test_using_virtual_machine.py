@@ -13,21 +13,25 @@
 # limitations under the License.
 
 from parameterized import parameterized
-from typing import Tuple
+from typing import Optional, Tuple
 import unittest
+import numpy
 
 from spinn_utilities.config_holder import set_config
 from spinn_utilities.typing.coords import XY
 
 from spinn_machine.config_setup import unittest_setup
-from spinn_machine import virtual_machine
+from spinn_machine import Machine, virtual_machine
 from spinn_machine.virtual_machine import (
     virtual_machine_by_boards, virtual_machine_by_min_size)
 from spinn_machine.data import MachineDataView
-from spinn_machine.exceptions import (SpinnMachineException)
+from spinn_machine.full_wrap_machine import FullWrapMachine
+from spinn_machine.machine import Path
+from spinn_machine.exceptions import (
+    SpinnMachineException, SpinnMachineInvalidParameterException)
 from spinn_machine.machine_factory import machine_repair
 from spinn_machine.version import (
-    ALL_BOARD_TYPES, BIG_BOARD_TYPES, FOUR_PLUS_BOARD_TYPES)
+    ALL_BOARD_TYPES, BIG_BOARD_TYPES, FOUR_PLUS_BOARD_TYPES, Spin1Gen)
 from .geometry import (to_xyz, shortest_mesh_path_length,
                        shortest_torus_path_length, minimise_xyz)
 
@@ -85,6 +89,83 @@ class TestUsingVirtualMachine(unittest.TestCase):
             self.assertNotIn(_chip, down_chips)
         self.assertEqual(n_chips - 1, count)
 
+    @parameterized.expand(BIG_BOARD_TYPES)
+    def test_lazy(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        set_config("Machine", "down_chips", "1,1")
+        set_config("Machine", "down_cores", "2,2,3")
+        eager = virtual_machine_by_boards(3)
+        vm = virtual_machine_by_boards(3, validate=False, lazy=True)
+        self.assertEqual(eager.n_chips, vm.n_chips)
+        self.assertEqual(eager.total_cores, vm.total_cores)
+        self.assertEqual(eager.total_available_user_cores,
+                         vm.total_available_user_cores)
+        self.assertEqual(0, len(vm._chip_map))
+
+        # Looking up a chip only builds its board
+        chip = vm[5, 9]
+        self.assertEqual(str(eager[5, 9]), str(chip))
+        self.assertEqual(
+            MachineDataView.get_machine_version().n_chips_per_board,
+            len(vm._chip_map))
+        self.assertIs(chip, vm.get_chip_at(5, 9))
+        self.assertTrue(vm.is_link_at(5, 9, 0))
+        self.assertFalse(vm.is_chip_at(1, 1))
+        self.assertEqual(eager.n_chips, vm.n_chips)
+        self.assertEqual(eager.total_cores, vm.total_cores)
+        self.assertEqual(
+            list(eager.get_existing_xys_by_ethernet(8, 4)),
+            list(vm.get_existing_xys_by_ethernet(8, 4)))
+
+        # Anything needing all the chips builds them all
+        self.assertEqual(eager.summary_string(), vm.summary_string())
+        self.assertListEqual(list(eager.chip_coordinates),
+                             list(vm.chip_coordinates))
+        self.assertEqual(eager.fingerprint(), vm.fingerprint())
+        vm.validate()
+
+        # Validating would build every board
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            virtual_machine_by_boards(3, lazy=True)
+
+    def test_lazy_order(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        eager = virtual_machine_by_boards(3)
+        vm = virtual_machine_by_boards(3, validate=False, lazy=True)
+        # Building the last board first does not change the order
+        vm[8, 4]
+        self.assertListEqual(
+            list(eager.chip_coordinates), list(vm.chip_coordinates))
+        self.assertListEqual(
+            [(0, 0), (4, 8), (8, 4)],
+            [(chip.x, chip.y) for chip in vm.ethernet_connected_chips])
+        self.assertEqual(0, vm.arrays.position_of(0, 0))
+
+    def test_lazy_digests(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        eager = virtual_machine_by_boards(3)
+        vm = virtual_machine_by_boards(3, validate=False, lazy=True)
+        # Digests asked for while some boards are still lazy
+        vm[5, 9]
+        self.assertDictEqual(eager.board_digests(), vm.board_digests())
+        self.assertEqual(eager.fingerprint(), vm.fingerprint())
+
+    def test_boards_share_templates(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        vm = virtual_machine_by_boards(3)
+        # Chips on every board share the few templates of the first board
+        board = set(
+            id(vm[x, y]._values.template)
+            for x, y in vm.get_existing_xys_by_ethernet(0, 0))
+        self.assertSetEqual(
+            board, set(id(chip._values.template) for chip in vm.chips))
+
+    def test_down_links_out_of_range(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        set_config("Machine", "down_links", "1,1,9:1,1,-1:1,1,2")
+        machine = virtual_machine(8, 8)
+        self.assertEqual(0b111011, machine[1, 1].router.link_mask)
+
     def _check_path(self, source: XY, target: XY, path: Tuple[int, int, int],
                     width: int, height: int) -> None:
         new_target = ((source[0] + path[0] - path[2]) % width,
@@ -186,6 +267,126 @@ class TestUsingVirtualMachine(unittest.TestCase):
                 min2 = machine._minimize_vector(x, y)
                 self.assertEqual(min1, min2)
 
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
+    def test_vector_arrays(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        # full wrap, no wrap, horizontal wrap and vertical wrap
+        for width, height in [(12, 24), (16, 28), (12, 16), (16, 12)]:
+            machine = virtual_machine(width, height, validate=False)
+            sources = []
+            targets = []
+            for source in machine.chip_coordinates:
+                for target in machine.chip_coordinates:
+                    sources.append(source)
+                    targets.append(target)
+            lengths = machine.get_vector_lengths(sources, targets)
+            vectors = machine.get_vectors(sources, targets)
+            self.assertEqual((len(sources), 3), vectors.shape)
+            for source, target, length, vector in zip(
+                    sources, targets, lengths, vectors):
+                self.assertEqual(
+                    machine.get_vector_length(source, target), length)
+                self.assertEqual(
+                    machine.get_vector(source, target), tuple(vector))
+            # An empty batch gives an empty result
+            self.assertEqual((0,), machine.get_vector_lengths([], []).shape)
+            self.assertEqual((0, 3), machine.get_vectors([], []).shape)
+
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
+    def test_fullwrap_vector_table(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        machine = virtual_machine(12, 24, validate=True)
+        assert isinstance(machine, FullWrapMachine)
+        pairs = [(source, target)
+                 for source in machine.chip_coordinates
+                 for target in machine.chip_coordinates]
+        lengths = [machine.get_vector_length(s, t) for s, t in pairs]
+        vectors = [machine.get_vector(s, t) for s, t in pairs]
+        machine.build_vector_table()
+        for (source, target), length, vector in zip(pairs, lengths, vectors):
+            self.assertEqual(
+                length, machine.get_vector_length(source, target))
+            self.assertEqual(vector, machine.get_vector(source, target))
+        sources = [s for s, _ in pairs]
+        targets = [t for _, t in pairs]
+        self.assertListEqual(
+            lengths, machine.get_vector_lengths(sources, targets).tolist())
+        self.assertListEqual(
+            [list(vector) for vector in vectors],
+            machine.get_vectors(sources, targets).tolist())
+        self.assertEqual((0,), machine.get_vector_lengths([], []).shape)
+        self.assertEqual((0, 3), machine.get_vectors([], []).shape)
+
+    @parameterized.expand(ALL_BOARD_TYPES)
+    def test_minimize_vectors(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        machine = virtual_machine_by_boards(1)
+        xs = numpy.array([x for x in range(-3, 3) for _ in range(-3, 3)])
+        ys = numpy.array([y for _ in range(-3, 3) for y in range(-3, 3)])
+        vectors = machine._minimize_vectors(xs, ys)
+        for x, y, vector in zip(xs, ys, vectors):
+            self.assertEqual(minimise_xyz((x, y, 0)), tuple(vector))
+
+    def _check_link_path(
+            self, machine: Machine, source: XY, destination: XY,
+            path: Optional[Path]) -> int:
+        assert path is not None
+        links, hops = path
+        self.assertEqual(len(links), hops)
+        xy = source
+        for link in links:
+            self.assertEqual(xy, (link.source_x, link.source_y))
+            self.assertTrue(machine.is_link_at(
+                xy[0], xy[1], link.source_link_id))
+            xy = (link.destination_x, link.destination_y)
+            self.assertTrue(machine.is_chip_at(*xy))
+        self.assertEqual(destination, xy)
+        return hops
+
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
+    def test_shortest_path(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        # full wrap, no wrap, horizontal wrap and vertical wrap
+        for width, height in [(12, 12), (16, 16), (12, 16), (16, 12)]:
+            machine = virtual_machine(width, height, validate=False)
+            xys = list(machine.chip_coordinates)[::5]
+            pairs = [(s, t) for s in xys for t in xys]
+            paths = machine.shortest_paths(pairs)
+            for (source, target), path in zip(pairs, paths):
+                hops = self._check_link_path(
+                    machine, source, target,
+                    machine.shortest_path(source, target))
+                self.assertEqual(
+                    machine.get_vector_length(source, target), hops)
+                self.assertEqual(hops, self._check_link_path(
+                    machine, source, target, path))
+
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs a large board
+    def test_shortest_path_around_down_chips(
+            self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        set_config("Machine", "down_chips", "2,1:2,2:2,3:2,4")
+        set_config("Machine", "down_links", "1,0,0:1,0,1")
+        machine = virtual_machine_by_boards(1)
+        self.assertEqual(2, machine.get_vector_length((1, 2), (3, 2)))
+        path = machine.shortest_path((1, 2), (3, 2))
+        hops = self._check_link_path(machine, (1, 2), (3, 2), path)
+        # Has to go over the top as links from 1,0 to 2,0 and 2,1 are down
+        # 1,3 1,4 2,5 3,5 3,4 3,3 3,2
+        self.assertEqual(7, hops)
+        self.assertListEqual(
+            [path, None, None, ([], 0)],
+            machine.shortest_paths([
+                ((1, 2), (3, 2)), ((1, 2), (2, 2)), ((2, 2), (1, 2)),
+                ((1, 2), (1, 2))]))
+        self.assertIsNone(machine.shortest_path((1, 2), (2, 2)))
+        # A chip that is down has no path to itself, alone or with others
+        self.assertIsNone(machine.shortest_path((2, 2), (2, 2)))
+        self.assertListEqual(
+            [None, None, None],
+            machine.shortest_paths([
+                ((2, 2), (2, 2)), ((2, 2), (1, 2)), ((2, 2), (2, 2))]))
+
     @parameterized.expand(BIG_BOARD_TYPES)  # Needs a large board
     def test_unreachable_incoming_chips(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
@@ -196,7 +397,7 @@ class TestUsingVirtualMachine(unittest.TestCase):
             (2, 2, 1), (2, 3, 0), (3, 4, 5), (4, 4, 4), (4, 3, 3), (3, 2, 2)]
         for (x, y, link) in down_links:
             if machine.is_link_at(x, y, link):
-                del machine._chips[x, y].router._links[link]
+                machine.remove_link(x, y, link)
         unreachable = machine.unreachable_incoming_chips()
         self.assertListEqual([(3, 3)], unreachable)
 
@@ -208,7 +409,7 @@ class TestUsingVirtualMachine(unittest.TestCase):
         # Delete links outgoing from 3, 3
         for link in range(6):
             if machine.is_link_at(3, 3, link):
-                del machine._chips[3, 3].router._links[link]
+                machine.remove_link(3, 3, link)
         unreachable = machine.unreachable_outgoing_chips()
         self.assertListEqual([(3, 3)], unreachable)
 
@@ -236,6 +437,51 @@ class TestUsingVirtualMachine(unittest.TestCase):
         unreachable = machine.unreachable_outgoing_local_chips()
         self.assertListEqual([(8, 7)], unreachable)
 
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs a large board
+    def test_unreachable_group_of_chips(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        machine = virtual_machine_by_min_size(6, 6)
+        self.assertListEqual([], machine.unreachable_chips())
+        self.assertEqual(([], []), machine.find_unreachable_chips())
+
+        # Delete the links into 3, 3 and 4, 4 except between them
+        group = {(3, 3), (4, 4)}
+        for x, y in group:
+            for link in range(6):
+                source = machine.xy_over_link(x, y, link)
+                if source not in group and machine.is_chip_at(*source):
+                    back = (link + 3) % 6
+                    if machine.is_link_at(source[0], source[1], back):
+                        machine.remove_link(source[0], source[1], back)
+        # Each chip has a neighbour so the old checks see nothing
+        self.assertListEqual([], machine.unreachable_incoming_chips())
+        self.assertListEqual([(3, 3), (4, 4)], machine.unreachable_chips())
+        self.assertListEqual(
+            [(3, 3), (4, 4)], machine.unreachable_local_chips())
+        not_reached, not_returned = machine.find_unreachable_chips()
+        self.assertListEqual([(3, 3), (4, 4)], not_reached)
+        self.assertListEqual([], not_returned)
+
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
+    def test_unreachable_local_group(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        # Assumes boards of exactly size 8,8
+        # 8,7 and 9,8 are only connected locally through each other
+        down_chips = [(8, 6), (9, 7), (10, 8), (10, 9)]
+        down_str = ":".join([f"{x},{y}" for x, y in down_chips])
+        set_config("Machine", "down_chips", down_str)
+        machine = virtual_machine(16, 16)
+        self.assertListEqual([], machine.unreachable_chips())
+        self.assertListEqual([], machine.unreachable_incoming_local_chips())
+        self.assertListEqual([], machine.unreachable_outgoing_local_chips())
+        local = machine.unreachable_local_chips()
+        self.assertListEqual([(8, 7), (9, 8)], local)
+        set_config("Machine", "repair_machine", "True")
+        repaired = machine_repair(machine)
+        for xy in local:
+            self.assertTrue(machine.is_chip_at(*xy))
+            self.assertFalse(repaired.is_chip_at(*xy))
+
     @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
     def test_repair_with_local_orphan(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
@@ -262,7 +508,7 @@ class TestUsingVirtualMachine(unittest.TestCase):
         down_links = [
             (7, 7, 0), (7, 3, 1), (6, 7, 2), (4, 7, 3), (8, 6, 4), (8, 4, 5)]
         for (x, y, link) in down_links:
-            del machine._chips[x, y].router._links[link]
+            machine.remove_link(x, y, link)
         with self.assertRaises(SpinnMachineException):
             set_config("Machine", "repair_machine", "False")
             new_machine = machine_repair(machine)
@@ -270,6 +516,34 @@ class TestUsingVirtualMachine(unittest.TestCase):
         new_machine = machine_repair(machine)
         self.assertIsNotNone(new_machine)
 
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs a large board
+    def test_repair_after_link_repair(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        set_config("Machine", "repair_machine", "True")
+        machine = virtual_machine_by_boards(1)
+        # Only 2, 3 has a link to 3, 3 and it is one way
+        down_links = [(2, 2, 1), (3, 4, 5), (4, 4, 4), (4, 3, 3), (3, 2, 2),
+                      (3, 3, 3)]
+        for (x, y, link) in down_links:
+            machine.remove_link(x, y, link)
+        n_cores = machine[3, 3].n_processors
+        n_user_cores = machine[3, 3].n_placable_processors
+        # Removing the one way link leaves 3, 3 unreachable
+        repaired = machine_repair(machine)
+        self.assertTrue(machine.is_chip_at(3, 3))
+        self.assertTrue(machine.is_link_at(2, 3, 0))
+        self.assertFalse(repaired.is_chip_at(3, 3))
+        self.assertFalse(repaired.is_link_at(2, 3, 0))
+        self.assertEqual(machine.n_chips - 1, repaired.n_chips)
+        self.assertEqual(machine.total_cores - n_cores, repaired.total_cores)
+        self.assertEqual(
+            machine.total_available_user_cores - n_user_cores,
+            repaired.total_available_user_cores)
+        self.assertEqual(
+            machine.boot_chip.ip_address, repaired.boot_chip.ip_address)
+        self.assertListEqual([], list(repaired.one_way_links()))
+        self.assertIs(repaired, machine_repair(repaired))
+
     @parameterized.expand(BIG_BOARD_TYPES)  # Needs a large board
     def test_oneway_link_no_repair(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
@@ -280,7 +554,7 @@ class TestUsingVirtualMachine(unittest.TestCase):
             (3, 6, 0), (5, 4, 1), (3, 2, 5), (1, 3, 3)]
         for (x, y, link) in down_links:
             if machine.is_link_at(x, y, link):
-                del machine._chips[x, y].router._links[link]
+                machine.remove_link(x, y, link)
         with self.assertRaises(SpinnMachineException):
             set_config("Machine", "repair_machine", "False")
             new_machine = machine_repair(machine)
@@ -293,7 +567,7 @@ class TestUsingVirtualMachine(unittest.TestCase):
         set_config("Machine", "version", ver_num)
         machine = virtual_machine_by_boards(1)
 
-        del machine._chips[(3, 3)]
+        machine.remove_chip(3, 3)
         set_config("Machine", "repair_machine", "False")
         new_machine = machine_repair(machine, [(3, 3)])
         self.assertIsNotNone(new_machine)